@@ -0,0 +1,240 @@
+# ----------------------------------------------------------------
+# Contained here are the shared image, font and text caches used by every scene
+# ----------------------------------------------------------------
+
+import os
+import pygame
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+AssetKey = tuple[str, tuple[int, int] | None, bool]
+ScaledKey = tuple[int, tuple[int, int]]
+DerivedKey = tuple[int, tuple[Any, ...]]
+TextKey = tuple[pygame.font.Font, str, tuple[int, ...], bool]
+
+
+class AssetCache:
+    """
+    Process-wide image cache.
+
+    Surfaces are keyed by (path, size, alpha), converted to the display format
+    once and shared by every caller, so thousands of creatures end up
+    referencing a handful of surfaces. Past `capacity` entries the least
+    recently used one is evicted; callers that still hold it keep it alive.
+
+    Headless runs have no display mode, so surfaces are cached unconverted and
+    converted on first use once a display exists.
+
+    scaled() covers surfaces that did not come from a path (creature frames,
+    drag icons): variants are keyed by (id(surface), size) and keep the source
+    alive so its id cannot be reused while the entry exists. flipped() and
+    mask() cache the other per-image derivatives sprites need the same way.
+    """
+    def __init__(self, capacity : int = 256):
+        self.capacity = capacity
+        self._surfaces : OrderedDict[AssetKey, pygame.Surface] = OrderedDict()
+        self._converted : set[AssetKey] = set()
+        self._scaled : OrderedDict[ScaledKey, tuple[pygame.Surface, pygame.Surface]] = OrderedDict()
+        self._derived : OrderedDict[DerivedKey, tuple[pygame.Surface, Any]] = OrderedDict()
+
+        # Instrumentation
+        self.loads = 0          # disk reads
+        self.scales = 0         # pre-scaled variants built
+        self.flips = 0
+        self.masks = 0          # collision masks built
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def image(self, path : str, size : tuple[int, int] | None = None, alpha : bool = True) -> pygame.Surface:
+        """Cached surface for path, optionally pre-scaled to size"""
+        key : AssetKey = (os.path.normpath(path), tuple(size) if size else None, alpha)  # type: ignore
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            if key not in self._converted and pygame.display.get_surface() is not None:
+                surface = self._store(key, surface)
+            return surface
+
+        self.misses += 1
+        if size:
+            surface = pygame.transform.scale(self.image(path, None, alpha), size)
+            self.scales += 1
+        else:
+            surface = pygame.image.load(path)
+            self.loads += 1
+        return self._store(key, surface)
+
+    def scaled(self, surface : pygame.Surface, size : tuple[int, int]) -> pygame.Surface:
+        """Cached copy of an already loaded surface scaled to size"""
+        size = (int(size[0]), int(size[1]))
+        if surface.get_size() == size:
+            return surface
+
+        key : ScaledKey = (id(surface), size)
+        entry = self._scaled.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._scaled.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        self.scales += 1
+        result = pygame.transform.scale(surface, size)
+        self._scaled[key] = (surface, result)
+        while len(self._scaled) > self.capacity:
+            self._scaled.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def flipped(self, surface : pygame.Surface, flip_x : bool, flip_y : bool) -> pygame.Surface:
+        """Cached pygame.transform.flip() of surface"""
+        def build():
+            self.flips += 1
+            return pygame.transform.flip(surface, flip_x, flip_y)
+        return self._derive(surface, ("flip", flip_x, flip_y), build)
+
+    def mask(self, surface : pygame.Surface) -> pygame.mask.Mask:
+        """Cached collision mask of surface; masks are shared, do not modify them"""
+        def build():
+            self.masks += 1
+            return pygame.mask.from_surface(surface)
+        return self._derive(surface, ("mask",), build)
+
+    def _derive(self, surface : pygame.Surface, kind : tuple[Any, ...], build : Callable[[], Any]) -> Any:
+        key : DerivedKey = (id(surface), kind)
+        entry = self._derived.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._derived.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        result = build()
+        self._derived[key] = (surface, result)
+        while len(self._derived) > self.capacity:
+            self._derived.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def _store(self, key : AssetKey, surface : pygame.Surface) -> pygame.Surface:
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if key[2] else surface.convert()
+            self._converted.add(key)
+
+        self._surfaces[key] = surface
+        self._surfaces.move_to_end(key)
+        while len(self._surfaces) > self.capacity:
+            evicted, _ = self._surfaces.popitem(last=False)
+            self._converted.discard(evicted)
+            self.evictions += 1
+        return surface
+
+    def memory_bytes(self) -> int:
+        """Approximate pixel memory held by the cache"""
+        surfaces = list(self._surfaces.values()) + [scaled for _, scaled in self._scaled.values()]
+        surfaces += [derived for _, derived in self._derived.values() if isinstance(derived, pygame.Surface)]
+        return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._surfaces),
+            "scaled": len(self._scaled),
+            "loads": self.loads,
+            "scales": self.scales,
+            "flips": self.flips,
+            "masks": self.masks,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_kb": self.memory_bytes() // 1024,
+        }
+
+    def clear(self):
+        self._surfaces.clear()
+        self._converted.clear()
+        self._scaled.clear()
+        self._derived.clear()
+
+
+assets = AssetCache()
+
+
+def load_image(path : str, size : tuple[int, int] | None = None, alpha : bool = True) -> pygame.Surface:
+    """Shortcut for assets.image()"""
+    return assets.image(path, size, alpha)
+
+
+def scaled_image(surface : pygame.Surface, size : tuple[int, int]) -> pygame.Surface:
+    """Shortcut for assets.scaled()"""
+    return assets.scaled(surface, size)
+
+
+class TextCache:
+    """
+    Font registry and rendered-string cache for the UI toolkit.
+
+    Fonts are shared per (name, size); rendered strings are keyed by
+    (font, text, color, antialias) and evicted least recently used past
+    `capacity`. Hits and misses are counted per frame, end_frame() rolls
+    them over into last_hits / last_misses for the debug overlay.
+    """
+    def __init__(self, capacity : int = 512):
+        self.capacity = capacity
+        self._fonts : dict[tuple[str | None, int], pygame.font.Font] = {}
+        self._surfaces : OrderedDict[TextKey, pygame.Surface] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.last_hits = 0
+        self.last_misses = 0
+        self.evictions = 0
+
+    def font(self, name : str | None, size : int) -> pygame.font.Font:
+        """Shared pygame Font, None is pygame's default font"""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, font : pygame.font.Font, text : str,
+               color : tuple[int, int, int] | pygame.Color, antialias : bool = True) -> pygame.Surface:
+        """Cached font.render(); the returned surface is shared, do not draw on it"""
+        key : TextKey = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        while len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def end_frame(self):
+        self.last_hits, self.last_misses = self.hits, self.misses
+        self.hits = self.misses = 0
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def get_font(name : str | None, size : int) -> pygame.font.Font:
+    """Shortcut for text_cache.font()"""
+    return text_cache.font(name, size)
+
+
+def render_text(font : pygame.font.Font, text : str,
+                color : tuple[int, int, int] | pygame.Color, antialias : bool = True) -> pygame.Surface:
+    """Shortcut for text_cache.render()"""
+    return text_cache.render(font, text, color, antialias)
@@ -0,0 +1,119 @@
+# ----------------------------------------------------------------
+# Contained here are the shared sound effect bank and music player
+# ----------------------------------------------------------------
+
+import os
+import pygame
+from typing import Any
+
+HOME_MUSIC = "assets/Music/HomeScene_music.mp3"
+GAME_MUSIC = "assets/Music/Gamescene_music.mp3"
+
+
+class SoundBank:
+    """
+    Preloaded sound effects played on a bounded pool of mixer channels.
+
+    Effects are decoded once by load() (typically when a scene is built) and
+    shared afterwards, so play() never touches the disk. The pool reserves
+    `channels` mixer channels; overlapping effects take a free one, and
+    when all are busy the one started longest ago is cut off.
+
+    Without an initialised mixer (headless runs, no audio device) loading
+    and playing are silent no-ops.
+    """
+    def __init__(self, channels : int = 8):
+        self.size = channels
+        self._sounds : dict[str, pygame.mixer.Sound] = {}
+        self._channels : list[pygame.mixer.Channel] = []
+        self._started : list[int] = []
+        self._plays = 0
+
+        # Instrumentation
+        self.loads = 0
+        self.steals = 0
+
+    def load(self, name : str, path : str, volume : float = 1.0) -> pygame.mixer.Sound | None:
+        """Decode path under name, once per process"""
+        sound = self._sounds.get(name)
+        if sound is None and pygame.mixer.get_init():
+            sound = self._sounds[name] = pygame.mixer.Sound(path)
+            sound.set_volume(volume)
+            self.loads += 1
+        return sound
+
+    def play(self, name : str) -> pygame.mixer.Channel | None:
+        sound = self._sounds.get(name)
+        if sound is None or not self._reserve():
+            return None
+
+        self._plays += 1
+        busy = [channel.get_busy() for channel in self._channels]
+        if all(busy):
+            index = self._started.index(min(self._started))
+            self.steals += 1
+        else:
+            index = busy.index(False)
+        self._channels[index].play(sound)
+        self._started[index] = self._plays
+        return self._channels[index]
+
+    def _reserve(self) -> bool:
+        """Claim the pool's channels on first use"""
+        if self._channels:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+        if pygame.mixer.get_num_channels() < self.size:
+            pygame.mixer.set_num_channels(self.size)
+        pygame.mixer.set_reserved(self.size)
+        self._channels = [pygame.mixer.Channel(i) for i in range(self.size)]
+        self._started = [0] * self.size
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {"sounds": len(self._sounds), "loads": self.loads, "plays": self._plays, "steals": self.steals}
+
+
+class MusicManager:
+    """
+    Streams one background track through pygame.mixer.music.
+
+    play() is a no-op when the requested track is already playing, so scenes
+    can ask for their music unconditionally without restarting it.
+    """
+    def __init__(self):
+        self.current : str | None = None
+        self.loads = 0
+
+    def play(self, path : str, loops : int = -1, volume : float | None = None):
+        if not pygame.mixer.get_init():
+            return
+        if volume is not None:
+            pygame.mixer.music.set_volume(volume)
+        path = os.path.normpath(path)
+        if path == self.current and pygame.mixer.music.get_busy():
+            return
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(loops)
+        self.current = path
+        self.loads += 1
+
+    def stop(self):
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        self.current = None
+
+
+sounds = SoundBank()
+music = MusicManager()
+
+
+def play_sound(name : str) -> pygame.mixer.Channel | None:
+    """Shortcut for sounds.play()"""
+    return sounds.play(name)
+
+
+def play_music(path : str, loops : int = -1, volume : float | None = None):
+    """Shortcut for music.play()"""
+    music.play(path, loops, volume)
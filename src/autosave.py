@@ -0,0 +1,219 @@
+# ----------------------------------------------------------------
+# Contained here is the background autosave worker
+# ----------------------------------------------------------------
+
+import threading
+import time
+import numpy as np
+from datetime import datetime
+from typing import Any, NamedTuple
+from collections.abc import Callable
+from classes import SIM_DT, Creature, CreaturePool, Inventory
+from persistence import Persistence
+from logger import log
+
+# Pool columns a save is built from (positions, sizes and the lazy satisfaction anchors)
+SNAPSHOT_COLUMNS = ("left", "top", "width", "height", "level0", "anchor", "decay")
+
+
+class WorldSnapshot(NamedTuple):
+    """
+    What a save needs, copied on the main thread so the world can keep running.
+
+    Pool columns are copied as arrays (one memcpy each). Creatures are only
+    kept by reference for their name, type and sprite paths, which never
+    change after creation. Effects are turned into dicts right away since
+    their remaining duration follows the live clock. The save dict itself
+    is built later by state(), off the main thread.
+    """
+    world_name : str
+    tick : int
+    creatures : tuple[Creature, ...]
+    columns : dict[str, np.ndarray]
+    effects : dict[int, list[tuple[dict[str, Any], int | None]]]   # row -> [(effect dict, expiry tick)]
+    inventory : tuple[dict[str, int], dict[str, int], dict[str, int]]
+    money : int
+    taken_at : datetime
+
+    @classmethod
+    def capture(cls, world_name : str, pool : CreaturePool, inventory : Inventory, money : int) -> "WorldSnapshot":
+        size = pool.size
+        return cls(
+            world_name,
+            pool.tick,
+            tuple(pool.creatures),
+            {column: getattr(pool, column)[:size].copy() for column in SNAPSHOT_COLUMNS},
+            {i: [(effect.to_dict(c), effect.expires_at) for effect in c.effects]
+             for i, c in enumerate(pool.creatures) if c.effects},
+            (dict(inventory.foods), dict(inventory.potions), dict(inventory.cleanse)),
+            money,
+            datetime.now(),
+        )
+
+    def same_world(self, other : "WorldSnapshot | None") -> bool:
+        """
+        True when other already stores this world. The clock is ignored:
+        satisfaction only changes through the anchors, and an older clock
+        is caught up on load from the save time like any offline gap.
+        """
+        if other is None or len(self.creatures) != len(other.creatures):
+            return False
+        if (self.world_name, self.inventory, self.money) != (other.world_name, other.inventory, other.money):
+            return False
+        if not all(np.array_equal(self.columns[c], other.columns[c]) for c in SNAPSHOT_COLUMNS):
+            return False
+        if any(a is not b for a, b in zip(self.creatures, other.creatures)):
+            return False
+        return _effect_keys(self.effects) == _effect_keys(other.effects)
+
+    def state(self) -> dict[str, Any]:
+        """The dict Persistence.save_to_slot() would have saved at capture time"""
+        c = self.columns
+        levels = np.maximum(0.0, c["level0"] - c["decay"] * (self.tick - c["anchor"]) * SIM_DT)
+        xs = (c["left"] + c["width"] // 2).tolist()
+        ys = (c["top"] + c["height"] // 2).tolist()
+        level0, anchor, decay = c["level0"].tolist(), c["anchor"].tolist(), c["decay"].tolist()
+        current = levels.tolist()
+
+        creatures = [
+            Persistence.creature_record(
+                creature, xs[i], ys[i], current[i],
+                [data for data, _ in self.effects.get(i, [])],
+                level0[i], anchor[i] * SIM_DT, decay[i]
+            )
+            for i, creature in enumerate(self.creatures)
+        ]
+        foods, potions, cleanse = self.inventory
+        return Persistence.world_state(self.world_name, float(levels.sum()), creatures,
+                                       foods, potions, cleanse, self.money, self.tick * SIM_DT, self.taken_at)
+
+
+def _effect_keys(effects : dict[int, list[tuple[dict[str, Any], int | None]]]) -> dict[int, list[Any]]:
+    """Effects without their remaining duration, which shrinks every tick; the expiry tick stands in for it"""
+    return {i: [({k: v for k, v in data.items() if k != "duration_seconds"}, expires) for data, expires in row]
+            for i, row in effects.items()}
+
+
+class AutoSaver:
+    """
+    Saves one world slot on a background thread.
+
+    poll() runs every simulation step. Once `interval` seconds have passed
+    since the last save it calls `capture` for a WorldSnapshot, the only
+    part of a save that runs on the main thread, and hands it to the worker,
+    which builds the save dict and writes it through Persistence.
+
+    At most one save is in flight: poll() skips its turn while the worker
+    is busy, and a save_now() meanwhile replaces any queued snapshot with
+    its newer one. Snapshots equal to the last one written are dropped
+    without touching the disk (see WorldSnapshot.same_world).
+
+    interval <= 0 turns autosaving off; save_now() still works.
+    """
+    def __init__(self, world_name : str, capture : Callable[[], WorldSnapshot], interval : float = 60.0):
+        self.world_name = world_name
+        self.capture = capture
+        self.interval = interval
+        self._condition = threading.Condition()
+        self._pending : tuple[WorldSnapshot, float] | None = None
+        self._busy = False
+        self._closed = False
+        self._thread : threading.Thread | None = None
+        self._written : WorldSnapshot | None = None     # last snapshot on disk
+        self._last_capture = time.monotonic()
+
+        # Instrumentation
+        self.saves = 0
+        self.skipped = 0        # unchanged worlds not rewritten
+        self.failures = 0
+        self.stall_ms = 0.0     # main-thread time of the last capture
+        self.stall_max_ms = 0.0
+        self.stall_total_ms = 0.0
+        self.captures = 0
+        self.write_ms = 0.0     # worker time of the last write
+
+    def poll(self):
+        if self.interval <= 0 or time.monotonic() - self._last_capture < self.interval or self.busy():
+            return
+        self.save_now()
+
+    def save_now(self):
+        """Snapshot the world now and queue it for the worker"""
+        start = time.perf_counter()
+        snapshot = self.capture()
+        stall = (time.perf_counter() - start) * 1000
+        self._last_capture = time.monotonic()
+        self.captures += 1
+        self.stall_ms = stall
+        self.stall_max_ms = max(self.stall_max_ms, stall)
+        self.stall_total_ms += stall
+
+        with self._condition:
+            if self._closed:
+                return
+            self._pending = (snapshot, stall)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"autosave-{self.world_name}", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def mark_saved(self, snapshot : WorldSnapshot):
+        """Treat snapshot as already on disk, e.g. the world as it was loaded"""
+        with self._condition:
+            self._written = snapshot
+
+    def busy(self) -> bool:
+        with self._condition:
+            return self._busy or self._pending is not None
+
+    def flush(self, timeout : float | None = None) -> bool:
+        """Wait for queued and in-flight saves, returns False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._busy and self._pending is None, timeout)
+
+    def close(self, timeout : float | None = None):
+        """Finish queued saves and stop the worker"""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "saves": self.saves, "skipped": self.skipped, "failures": self.failures,
+            "stall_ms": self.stall_ms, "stall_max_ms": self.stall_max_ms,
+            "stall_mean_ms": self.stall_total_ms / self.captures if self.captures else 0.0,
+            "write_ms": self.write_ms,
+        }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                (snapshot, stall), self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._write(snapshot, stall)
+            except Exception as e:
+                self.failures += 1
+                log(1, f"[Autosave] Saving {self.world_name} failed: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, snapshot : WorldSnapshot, stall : float):
+        if snapshot.same_world(self._written):
+            self.skipped += 1
+            return
+        start = time.perf_counter()
+        written = Persistence.save_state(self.world_name, snapshot.state())
+        self.write_ms = (time.perf_counter() - start) * 1000
+        self._written = snapshot
+        self.saves += 1
+        log(2, f"[Autosave] Saved {self.world_name}: {written} bytes in {self.write_ms:.1f}ms on the worker, "
+               f"{stall:.2f}ms main-thread stall")
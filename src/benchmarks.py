@@ -0,0 +1,432 @@
+# ----------------------------------------------------------------
+# Contained here are developer benchmarks for the simulation code
+# Run from the project root, e.g.:
+#   python src/benchmarks.py collisions --creatures 500 1000 2000
+#   python src/benchmarks.py assets --creatures 10000
+#   python src/benchmarks.py flappy --frames 3000
+#   python src/benchmarks.py scene-switch --repeats 50
+#   python src/benchmarks.py saves --creatures 10000 --saves 20
+#   python src/benchmarks.py save-format --creatures 100 1000 10000
+#   python src/benchmarks.py slot-menu --creatures 10000 --slots 3
+#   python src/benchmarks.py autosave --creatures 10000 --saves 10
+# ----------------------------------------------------------------
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from random import Random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from classes import Creature, CreaturePool, Inventory, Less_Decay, More_Satisfaction
+from assets import assets
+from minigames import FlappyBird, PIPE_GAP
+from gameplay import GameScene, FlappyBirdScene
+import persistence
+from persistence import Persistence
+from save_format import encode_world, decode_world
+from autosave import AutoSaver, WorldSnapshot
+
+SPRITE = ["assets/Sprites/Cat_happy.png", "assets/Sprites/Cat.png", "assets/Sprites/Cat_sad.png", "assets/Sprites/Dead.png"]
+
+
+def build_pool(count : int, seed : int = 0) -> CreaturePool:
+    """Spawn `count` creatures at the same positions admin "spawn" would use"""
+    rng = Random(seed)
+    pool = CreaturePool()
+    for i in range(count):
+        Creature(f"creature{i}", "admin_spawned_creature", rng.randint(50, 750), rng.randint(50, 550), SPRITE, pool = pool)
+    return pool
+
+
+def nested_loop_tick(pool : CreaturePool) -> int:
+    """The original O(n^2) GameScene.update collision pass"""
+    creatures = pool.creatures
+    tests = 0
+    for i, creature in enumerate(creatures):
+        for j in range(i + 1, len(creatures)):
+            creature.resolve_soft_collisions(creatures[j])
+            tests += 1
+    return tests
+
+
+def bench_collisions(sizes : list[int], ticks : int):
+    print(f"{'creatures':>10} {'nested tests':>14} {'nested ms':>10} {'grid tests':>11} {'grid ms':>9} {'same result':>12}")
+    for count in sizes:
+        nested = build_pool(count)
+        start = time.perf_counter()
+        nested_tests = nested_loop_tick(nested)
+        nested_ms = (time.perf_counter() - start) * 1000
+
+        grid = build_pool(count)
+        grid.resolve_soft_collisions()   # first tick builds the grid
+        grid.set_satisfaction(100)
+        grid_tests = 0
+        start = time.perf_counter()
+        for _ in range(ticks):
+            grid_tests = grid.resolve_soft_collisions()
+        grid_ms = (time.perf_counter() - start) * 1000 / ticks
+
+        check = build_pool(count)
+        check.resolve_soft_collisions()
+        same = (
+            abs(check.levels() - nested.levels()).max() < 1e-9
+            and (check.left[:count] == nested.left[:count]).all()
+            and (check.top[:count] == nested.top[:count]).all()
+        )
+        print(f"{count:>10} {nested_tests:>14} {nested_ms:>10.1f} {grid_tests:>11} {grid_ms:>9.2f} {str(same):>12}")
+
+
+def bench_assets(count : int):
+    assets.clear()
+    start = time.perf_counter()
+    pool = build_pool(count)
+    for creature in pool.creatures:
+        creature.update_sprite(3, quiet = True)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    shared = len({id(s) for c in pool.creatures for s in c.frames})
+    print(f"Spawned {count} creatures in {elapsed:.1f}ms")
+    print(f"Distinct frame surfaces: {shared}")
+    for key, value in assets.stats().items():
+        print(f"  {key:<10} {value}")
+
+
+def flappy_autopilot(game : FlappyBird):
+    """Flap whenever the bird sinks below the middle of the next gap"""
+    bird = game.bird
+    ahead = [p for p in game.pipe_group if not p.inverted and p.rect.right > bird.rect.left]
+    if ahead:
+        target = min(ahead, key=lambda p: p.rect.x).rect.y - PIPE_GAP // 2
+        if bird.rect.centery > target and bird.speed > 0:
+            bird.bump()
+
+
+def bench_flappy(frames : int, seed : int = 0):
+    random.seed(seed)
+    surface = pygame.Surface((800, 600))
+    FlappyBird(surface)    # first game warms the asset cache
+    before = dict(assets.stats())
+
+    runs, pipes = 1, set()
+    game = FlappyBird(surface)
+    game.state = "running"
+    start = time.perf_counter()
+    for _ in range(frames):
+        flappy_autopilot(game)
+        game.update()
+        pipes.update(id(p) for p in game.pipe_group)
+        if game.finished:
+            runs += 1
+            game = FlappyBird(surface)
+            game.state = "running"
+    elapsed = (time.perf_counter() - start) * 1000
+
+    after = assets.stats()
+    print(f"{frames} frames over {runs} run(s) in {elapsed:.1f}ms ({elapsed / frames:.3f}ms/frame), last score {game.score:g}")
+    print(f"Distinct pipe sprites: {len(pipes)}")
+    for key in ("loads", "scales", "flips", "masks"):
+        print(f"  {key:<10} {after[key] - before[key]}")
+
+
+def bench_scene_switch(repeats : int):
+    """Cost of opening the minigame: building its scene and showing the first frame"""
+    screen = pygame.display.get_surface()
+    world = GameScene("benchmark", audio = False)    # the suspended world, warms the asset cache
+    world.draw(screen)
+
+    def first_frame(scene):
+        scene.update()
+        scene.draw(screen)
+
+    # What the minigame used to cost on top of itself: a throwaway GameScene
+    start = time.perf_counter()
+    for _ in range(repeats):
+        GameScene("benchmark", audio = False)
+    world_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        first_frame(FlappyBirdScene(screen, on_finish = lambda earned: None))
+    host_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    print(f"Throwaway GameScene:               {world_ms:.2f}ms")
+    print(f"Minigame host + first frame:       {host_ms:.2f}ms")
+    print(f"Previous host (both of the above): {world_ms + host_ms:.2f}ms")
+
+
+def bench_saves(count : int, saves : int, changes : int, seed : int = 0):
+    """Journaled saves vs the old full json.dump, on a world that decays with a few changes between saves"""
+    rng = Random(seed)
+    pool = build_pool(count, seed)
+    foods = {"Grapes": 3, "Makku": 1}
+    money = 100
+
+    def save_args():
+        return (pool.average_level() * pool.size, pool.creatures, foods, {}, {}, money)
+
+    def mutate():
+        nonlocal money
+        pool.advance_clock(60 * 30)     # 30s of decay between autosaves
+        for creature in rng.sample(pool.creatures, changes):
+            creature.satisfaction_level = rng.uniform(0, 100)
+        rng.choice(pool.creatures).move(rng.randint(50, 750), rng.randint(50, 550))
+        money += 5
+        foods["Grapes"] += 1
+
+    directory = tempfile.mkdtemp()
+    saved_dir, persistence.SAVE_DIR = persistence.SAVE_DIR, directory
+    try:
+        # Old format: build the state and dump it indented over the file
+        full_ms, full_bytes = 0.0, 0
+        for _ in range(saves):
+            mutate()
+            start = time.perf_counter()
+            state = {"creatures": [Persistence.pack_creature(c) for c in pool.creatures], "money": money}
+            data = json.dumps(state, indent=4)
+            with open(os.path.join(directory, "full"), "w") as f:
+                f.write(data)
+            full_ms += (time.perf_counter() - start) * 1000
+            full_bytes += len(data)
+
+        Persistence.save_to_slot("journaled", *save_args())     # the first save of a session is a snapshot
+        journal = Persistence.journal("journaled")
+        journal_ms, journal_bytes = 0.0, 0
+        for _ in range(saves):
+            mutate()
+            start = time.perf_counter()
+            journal_bytes += Persistence.save_to_slot("journaled", *save_args())
+            journal_ms += (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        loaded = Persistence.load_slot("journaled")
+        load_ms = (time.perf_counter() - start) * 1000
+        same = len(loaded["creatures"]) == count and abs(loaded["creatures"][0]["satisfaction_level"] - pool.creatures[0].satisfaction_level) < 1e-6
+    finally:
+        persistence.SAVE_DIR = saved_dir
+        shutil.rmtree(directory)
+
+    print(f"{count} creatures, {saves} saves, {changes} creatures re-anchored between saves")
+    print(f"{'':<12} {'ms/save':>9} {'bytes/save':>12}")
+    print(f"{'full dump':<12} {full_ms / saves:>9.1f} {full_bytes // saves:>12}")
+    print(f"{'journaled':<12} {journal_ms / saves:>9.1f} {journal_bytes // saves:>12}  (fsynced, {journal.compactions - 1} compactions)")
+    print(f"Load with journal replay: {load_ms:.1f}ms, matches live world: {same}")
+
+
+def world_state(count : int, seed : int = 0) -> dict:
+    """A save state as save_to_slot builds it, with effects on some creatures"""
+    pool = build_pool(count, seed)
+    rng = Random(seed)
+    for creature in rng.sample(pool.creatures, count // 10):
+        Less_Decay(multiplier = 2, duration = rng.uniform(1, 10)).consume(creature)
+        if rng.random() < 0.5:
+            More_Satisfaction(duration = rng.uniform(1, 10)).consume(creature)
+    pool.advance_clock(600)
+    return {
+        "world_name": f"world{count}",
+        "world_score": pool.average_level() * pool.size,
+        "creatures": [Persistence.pack_creature(c) for c in pool.creatures],
+        "inventory": {"foods": {"Grapes": 2, "Makku": 0}, "potions": {"Less Decay": 1}, "cleanse": {}},
+        "last_saved": "January 01, 2026 12:00:00 PM",
+        "money": 42,
+        "clock": pool.tick / 60,
+    }
+
+
+def bench_save_format(sizes : list[int], repeats : int = 5):
+    print(f"{'creatures':>10} {'json KB':>9} {'binary KB':>10} {'json save':>10} {'bin save':>9} {'json load':>10} {'bin load':>9}")
+    for count in sizes:
+        state = world_state(count)
+        timings = {}
+        for name, save, load in (("json", lambda s: json.dumps(s, indent=4).encode(), json.loads),
+                                 ("binary", encode_world, decode_world)):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                data = save(state)
+            saved = time.perf_counter()
+            for _ in range(repeats):
+                load(data)
+            loaded = time.perf_counter()
+            timings[name] = (len(data), (saved - start) * 1000 / repeats, (loaded - saved) * 1000 / repeats)
+        j, b = timings["json"], timings["binary"]
+        print(f"{count:>10} {j[0] / 1024:>9.1f} {b[0] / 1024:>10.1f} {j[1]:>8.1f}ms {b[1]:>7.1f}ms {j[2]:>8.1f}ms {b[2]:>7.1f}ms")
+
+
+def bench_slot_menu(count : int, slots : int, repeats : int = 5):
+    """Opening the load menu: parsing every slot vs the slot manifest"""
+    directory = tempfile.mkdtemp()
+    saved_dir, persistence.SAVE_DIR = persistence.SAVE_DIR, directory
+    try:
+        for i in range(slots):
+            state = world_state(count, seed = i)
+            with open(os.path.join(directory, f"slot{i}"), "wb") as f:
+                f.write(encode_world(state))
+
+        def parse_all():
+            # what the menu used to do: parse each slot for its name, then again for its save time
+            for slot in Persistence.taken_name():
+                Persistence.load_slot(slot)["world_name"]
+            Persistence.load_slot(Persistence.taken_name()[0])["last_saved"]
+
+        def from_manifest(manifest):
+            manifest.entries()
+            manifest.entry(Persistence.taken_name()[0])
+
+        def timed(run) -> float:
+            start = time.perf_counter()
+            for _ in range(repeats):
+                run()
+            return (time.perf_counter() - start) * 1000 / repeats
+
+        manifest_path = os.path.join(directory, persistence.MANIFEST_FILE)
+        def cold():
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            from_manifest(persistence.SaveManifest(directory))
+
+        parse_ms = timed(parse_all)
+        cold_ms = timed(cold)
+        warm = persistence.SaveManifest(directory)
+        warm_ms = timed(lambda: from_manifest(persistence.SaveManifest(directory)))
+        hot_ms = timed(lambda: from_manifest(warm))
+
+        # a slot saved by another process is re-read once, the rest are trusted
+        os.utime(os.path.join(directory, "slot0"), ns = (0, 0))
+        warm.entries()
+        stale_parses = warm.parses
+    finally:
+        persistence.SAVE_DIR = saved_dir
+        shutil.rmtree(directory)
+
+    print(f"{slots} slots of {count} creatures, menu open + slot select")
+    print(f"{'parse every slot':<26} {parse_ms:>8.2f}ms")
+    print(f"{'manifest, rebuilt':<26} {cold_ms:>8.2f}ms")
+    print(f"{'manifest, from disk':<26} {warm_ms:>8.2f}ms")
+    print(f"{'manifest, in memory':<26} {hot_ms:>8.2f}ms")
+    print(f"Slots parsed after one slot changed on disk: {stale_parses}")
+
+
+def bench_autosave(count : int, saves : int, seed : int = 0):
+    """Main-thread time per save: synchronous save_to_slot vs the autosave worker"""
+    rng = Random(seed)
+    pool = build_pool(count, seed)
+    inventory = Inventory()
+    inventory.foods["Grapes"] = 3
+
+    def mutate():
+        pool.advance_clock(60 * 30)
+        for creature in rng.sample(pool.creatures, 50):
+            creature.satisfaction_level = rng.uniform(0, 100)
+
+    def frame() -> float:
+        """One simulation step without collisions (the synthetic world is packed far too densely), in ms"""
+        start = time.perf_counter()
+        pool.store_previous()
+        pool.clamp(20, 20, 780, 580)
+        pool.advance_clock()
+        pool.update_hover((400, 300))
+        return (time.perf_counter() - start) * 1000
+
+    directory = tempfile.mkdtemp()
+    saved_dir, persistence.SAVE_DIR = persistence.SAVE_DIR, directory
+    try:
+        quiet = max(frame() for _ in range(30))
+
+        sync_ms = []
+        for _ in range(saves):
+            mutate()
+            start = time.perf_counter()
+            Persistence.save_to_slot("sync", 0, pool.creatures, inventory.foods, inventory.potions, inventory.cleanse, 0)
+            sync_ms.append((time.perf_counter() - start) * 1000)
+
+        saver = AutoSaver("background", lambda: WorldSnapshot.capture("background", pool, inventory, 0), interval = 0)
+        worst, frames = 0.0, 0
+        for _ in range(saves):
+            mutate()
+            saver.save_now()
+            while saver.busy():     # keep simulating while the worker writes
+                worst = max(worst, frame())
+                frames += 1
+        saver.flush()
+        written = saver.saves
+        pool.advance_clock(60 * 30)     # decay alone leaves the saved anchors as they are
+        saver.save_now()
+        saver.close()
+        skipped = saver.saves == written
+    finally:
+        persistence.SAVE_DIR = saved_dir
+        shutil.rmtree(directory)
+
+    stats = saver.stats()
+    print(f"{count} creatures, {saves} saves with 50 creatures re-anchored between them")
+    print(f"{'synchronous save':<28} {sum(sync_ms) / saves:>8.2f}ms mean {max(sync_ms):>8.2f}ms max")
+    print(f"{'autosave main-thread stall':<28} {stats['stall_mean_ms']:>8.2f}ms mean {stats['stall_max_ms']:>8.2f}ms max")
+    print(f"{'autosave worker write':<28} {stats['write_ms']:>8.2f}ms (last)")
+    print(f"Simulation steps during background writes: {frames}, worst {worst:.2f}ms (vs {quiet:.2f}ms without a save)")
+    print(f"Unchanged world rewritten: {not skipped}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cozy Cove developer benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    collisions = sub.add_parser("collisions", help="soft collision broadphase vs nested loop")
+    collisions.add_argument("--creatures", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    collisions.add_argument("--ticks", type=int, default=20)
+
+    asset_cache = sub.add_parser("assets", help="image loads and memory when spawning creatures")
+    asset_cache.add_argument("--creatures", type=int, default=10000)
+
+    flappy = sub.add_parser("flappy", help="disk reads and mask builds during Flappy Bird runs")
+    flappy.add_argument("--frames", type=int, default=3000)
+
+    scene_switch = sub.add_parser("scene-switch", help="latency of opening the minigame from a world")
+    scene_switch.add_argument("--repeats", type=int, default=50)
+
+    save = sub.add_parser("saves", help="journaled save latency and bytes written vs a full dump")
+    save.add_argument("--creatures", type=int, default=10000)
+    save.add_argument("--saves", type=int, default=20)
+    save.add_argument("--changes", type=int, default=50, help="creatures re-anchored between saves")
+
+    save_format = sub.add_parser("save-format", help="binary save size and speed vs JSON")
+    save_format.add_argument("--creatures", type=int, nargs="+", default=[100, 1000, 10000])
+
+    slot_menu = sub.add_parser("slot-menu", help="load menu latency with and without the slot manifest")
+    slot_menu.add_argument("--creatures", type=int, default=10000)
+    slot_menu.add_argument("--slots", type=int, default=3)
+
+    autosave = sub.add_parser("autosave", help="main-thread stall per save, synchronous vs the autosave worker")
+    autosave.add_argument("--creatures", type=int, default=10000)
+    autosave.add_argument("--saves", type=int, default=10)
+
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((800, 600) if args.command == "scene-switch" else (1, 1))
+
+    if args.command == "collisions":
+        bench_collisions(args.creatures, args.ticks)
+    elif args.command == "assets":
+        bench_assets(args.creatures)
+    elif args.command == "flappy":
+        bench_flappy(args.frames)
+    elif args.command == "scene-switch":
+        bench_scene_switch(args.repeats)
+    elif args.command == "saves":
+        bench_saves(args.creatures, args.saves, args.changes)
+    elif args.command == "save-format":
+        bench_save_format(args.creatures)
+    elif args.command == "slot-menu":
+        bench_slot_menu(args.creatures, args.slots)
+    elif args.command == "autosave":
+        bench_autosave(args.creatures, args.saves)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,24 @@
 from enum import Enum
 from non_essential import hex_to_rgb
+from assets import load_image, get_font
 import pygame
 from logger import log
 from typing import Any
 from collections import defaultdict
+from collections.abc import Callable
 import random
+import heapq
+import itertools
+import math
+import bisect
+import numpy as np
+
+# Simulation timing: GameScene.update runs at a fixed rate, independent of
+# the render frame rate. Rates below are expressed per second.
+SIM_HZ = 60
+SIM_DT = 1 / SIM_HZ
+DEFAULT_DECAY = 0.6             # satisfaction lost per second
+COLLISION_PENALTY = 6.0         # satisfaction lost per second while overlapping
 
 
 class PetAction(Enum):
@@ -12,7 +26,20 @@ class PetAction(Enum):
     FEED = 2
 
 
+# Satisfaction bar color bands: band i covers BAR_BAND_LIMITS[i-1] < value <= BAR_BAND_LIMITS[i]
+BAR_BAND_LIMITS = (9, 29, 39, 59, 89, 100)
+
+# Pre-rendered bar strips shared by every bar with the same geometry and colors
+_bar_strips : dict[tuple[Any, ...], list[pygame.Surface]] = {}
+
+
 class SatisfactionBar:
+    """
+    Drawing is a single blit: for every color band there is one strip twice
+    the bar's width, the band color on the left half and the background on
+    the right. Any integer fill width is the width-wide window starting at
+    (width - fill), so the strips act as a lookup table of every fill state.
+    """
     def __init__(self, 
                  width : int = 50, 
                  height : int = 5, 
@@ -33,76 +60,799 @@ class SatisfactionBar:
         self.color_red = hex_to_rgb("#e06614") 
         self.color_critical = hex_to_rgb("#ff0000") 
 
+        # Color per band index (see BAR_BAND_LIMITS), values above 100 fall in the last slot
+        self.band_colors = (self.color_critical, self.color_red, self.color_orange,
+                            self.color_yellow, self.color_lime, self.color_green, self.color_critical)
+
 
     def get_satbar_color(self, value : float):
         """coloring of the value"""
-        if 100 >= value > 89:
-            return self.color_green
-        elif 89 >= value > 59:
-            return self.color_lime
-        elif 59 >= value > 39:
-            return self.color_yellow
-        elif 39 >= value > 29:
-            return self.color_orange
-        elif 29 >= value > 9:
-            return self.color_red
-        elif 9 >= value >= 0:
-            return self.color_critical
-        return self.color_critical
+        return self.band_colors[self.band(value)]
+
+    def band(self, value : float) -> int:
+        return bisect.bisect_left(BAR_BAND_LIMITS, value)
+
+    def color_indices(self, values : np.ndarray) -> np.ndarray:
+        """Vectorized band()"""
+        return np.searchsorted(BAR_BAND_LIMITS, values, side="left")
+
+    def fill_width(self, value : float) -> int:
+        return min(self.width, max(0, int((value/100) * self.width)))
+
+    def strips(self) -> list[pygame.Surface]:
+        """One pre-rendered strip per color band, built on first use"""
+        key = (self.width, self.height, self.bg_color, self.band_colors)
+        strips = _bar_strips.get(key)
+        if strips is None:
+            strips = []
+            for color in self.band_colors:
+                strip = pygame.Surface((self.width * 2, self.height))
+                if pygame.display.get_surface() is not None:
+                    strip = strip.convert()
+                strip.fill(color, (0, 0, self.width, self.height))
+                strip.fill(self.bg_color, (self.width, 0, self.width, self.height))
+                strips.append(strip)
+            _bar_strips[key] = strips
+        return strips
+
+    def draw_state(self, x : int, y : int, value : float) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        rect = pygame.Rect(x + self.offset_x, y + self.offset_y, self.width, self.height)
+        return (self.fill_width(value), self.band(value)), rect
 
     def draw(self, screen : pygame.Surface, x : int, y : int, value : float):
         """
         x, y - coordinate placement
         value - satisfaction level
         """
-        pygame.draw.rect(screen, self.bg_color, (x +  self.offset_x, y + self.offset_y, self.width, self.height))
-        
-        fill_width = int((value/100) * self.width)
+        fill_width = self.fill_width(value)
+        strip = self.strips()[self.band(value)]
+        screen.blit(strip, (x + self.offset_x, y + self.offset_y), (self.width - fill_width, 0, self.width, self.height))
 
-        pygame.draw.rect(
-            screen,
-            self.get_satbar_color(value), 
-            (x + self.offset_x, y + self.offset_y, fill_width, self.height)
+class SpatialHash:
+    """
+    Uniform-grid broadphase over the rows of a CreaturePool.
+
+    Each creature is binned by the cell of its top-left corner. As long as the
+    cell size is at least as large as the biggest creature, two rects can only
+    overlap if their cells are neighbours, so only those pairs are tested.
+    Cell keys are recomputed every tick, but the candidate pair list is only
+    rebuilt when some creature actually crossed into another cell.
+    """
+    _KEY_SHIFT = 1 << 21
+    _KEY_BIAS = 1 << 20
+    # Own cell plus half of the neighbourhood, so every pair is produced once
+    _NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    def __init__(self, cell_size : int = 0):
+        self.cell_size = cell_size
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.pairs_i = np.zeros(0, dtype=np.intp)
+        self.pairs_j = np.zeros(0, dtype=np.intp)
+        self.rebuilds = 0
+
+    def reset(self):
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.pairs_i = np.zeros(0, dtype=np.intp)
+        self.pairs_j = np.zeros(0, dtype=np.intp)
+
+    def _cell_keys(self, pool : "CreaturePool") -> np.ndarray:
+        n = pool.size
+        cell_x = pool.left[:n].astype(np.int64) // self.cell_size
+        cell_y = pool.top[:n].astype(np.int64) // self.cell_size
+        return cell_x * self._KEY_SHIFT + (cell_y + self._KEY_BIAS)
+
+    def update(self, pool : "CreaturePool"):
+        """Re-bin the pool and rebuild candidate pairs if any creature changed cell"""
+        n = pool.size
+        if n == 0:
+            self.reset()
+            return
+
+        largest = int(max(pool.width[:n].max(), pool.height[:n].max(), 1))
+        if largest > self.cell_size:
+            self.cell_size = largest
+            self.keys = np.zeros(0, dtype=np.int64)
+
+        keys = self._cell_keys(pool)
+        if len(keys) == len(self.keys) and np.array_equal(keys, self.keys):
+            return
+
+        self.keys = keys
+        self._build_pairs()
+        self.rebuilds += 1
+
+    def _build_pairs(self):
+        keys = self.keys
+        n = len(keys)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        rank = np.empty(n, dtype=np.intp)
+        rank[order] = np.arange(n)
+
+        pairs_i : list[np.ndarray] = []
+        pairs_j : list[np.ndarray] = []
+
+        # own cell: only members sorted after i
+        hi = np.searchsorted(sorted_keys, keys, side="right")
+        self._collect(order, rank + 1, hi, pairs_i, pairs_j)
+
+        for dx, dy in self._NEIGHBOURS:
+            target = keys + dx * self._KEY_SHIFT + dy
+            lo = np.searchsorted(sorted_keys, target, side="left")
+            hi = np.searchsorted(sorted_keys, target, side="right")
+            self._collect(order, lo, hi, pairs_i, pairs_j)
+
+        if pairs_i:
+            self.pairs_i = np.concatenate(pairs_i)
+            self.pairs_j = np.concatenate(pairs_j)
+        else:
+            self.pairs_i = np.zeros(0, dtype=np.intp)
+            self.pairs_j = np.zeros(0, dtype=np.intp)
+
+    @staticmethod
+    def _collect(order : np.ndarray, lo : np.ndarray, hi : np.ndarray,
+                 pairs_i : list[np.ndarray], pairs_j : list[np.ndarray]):
+        """Expand per-creature [lo, hi) ranges of the sorted order into index pairs"""
+        counts = np.maximum(hi - lo, 0)
+        total = int(counts.sum())
+        if total == 0:
+            return
+        starts = np.repeat(lo, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        pairs_i.append(np.repeat(np.arange(len(order)), counts))
+        pairs_j.append(order[starts + offsets])
+
+    @property
+    def pair_count(self) -> int:
+        return len(self.pairs_i)
+
+
+EFFECT_EVENT = 0    # (effect, creature): an effect reaches its expiry tick
+LEVEL_EVENT = 1     # (row, None): a creature crosses a sprite threshold or hits 0
+
+# A creature stays in sprite stage s while its level is above STAGE_FLOORS[s]
+STAGE_FLOORS = (70, 30, 0)
+_STAGE_FLOORS = np.array(STAGE_FLOORS + (0,), dtype=np.float64)
+_STAGE_EDGES = np.array([0, 30, 70], dtype=np.float64)
+
+
+def satisfaction_stages(levels : np.ndarray) -> np.ndarray:
+    """Sprite stage per level: 0 happy (>70), 1 neutral (>30), 2 sad (>0), 3 depleted"""
+    return 3 - np.searchsorted(_STAGE_EDGES, levels, side="left")
+
+
+def satisfaction_stage(level : float) -> int:
+    """Scalar satisfaction_stages"""
+    for stage, floor in enumerate(STAGE_FLOORS):
+        if level > floor:
+            return stage
+    return 3
+
+
+class EventScheduler:
+    """
+    Min-heap of world events keyed by simulation tick.
+
+    Entries are never removed from the heap directly: when the state an entry
+    was computed from changes (an effect is cleansed, a creature is fed...),
+    the owner simply schedules a new entry and the old one is recognised as
+    stale when it is popped.
+    """
+    def __init__(self):
+        self.heap : list[tuple[int, int, int, Any, Any]] = []
+        self._seq = itertools.count()
+
+    def schedule(self, tick : int, kind : int, a : Any, b : Any):
+        heapq.heappush(self.heap, (tick, next(self._seq), kind, a, b))
+
+    def schedule_many(self, ticks : list[int], kind : int, items : list[Any], b : Any = None):
+        """schedule() for many entries of one kind, re-heapifying once when that is cheaper"""
+        entries = [(tick, next(self._seq), kind, a, b) for tick, a in zip(ticks, items)]
+        if len(entries) * 8 > len(self.heap):
+            self.heap.extend(entries)
+            heapq.heapify(self.heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self.heap, entry)
+
+    def pop_next(self, until : int) -> tuple[int, int, int, Any, Any] | None:
+        """Pop the earliest entry due at or before `until`"""
+        if self.heap and self.heap[0][0] <= until:
+            return heapq.heappop(self.heap)
+        return None
+
+    def compact(self, is_live : Callable[[tuple[int, int, int, Any, Any]], bool]):
+        """Drop stale entries"""
+        self.heap = [entry for entry in self.heap if is_live(entry)]
+        heapq.heapify(self.heap)
+
+    def clear(self):
+        self.heap.clear()
+
+
+class CreaturePool:
+    """
+    Struct-of-arrays storage for creature simulation state.
+
+    Positions, decay, multiplier and the alive/hover flags live in NumPy
+    columns so a whole world can be clamped and hit-tested with a few array
+    operations per frame. Creature objects are thin views over one row each.
+
+    Satisfaction is not stored per frame. Between events it falls linearly, so
+    each row keeps (level0, anchor tick, decay) and the current level is
+    evaluated on demand. Rows are re-anchored only when something changes
+    the level or the decay, and the next sprite-threshold / depletion tick is
+    pushed onto the event heap instead of being polled every frame.
+
+    The same linearity keeps the world average cheap: each row contributes
+    level0 + decay * anchor * SIM_DT and -decay per second (nothing once
+    depleted), and the pool maintains running totals of both, so
+    average_level() is O(1) however many creatures there are.
+    """
+    _COLUMNS : tuple[tuple[str, Any], ...] = (
+        ("left", np.int32),
+        ("top", np.int32),
+        ("prev_left", np.int32),    # position at the start of the last tick, for interpolation
+        ("prev_top", np.int32),
+        ("width", np.int32),
+        ("height", np.int32),
+        ("level0", np.float64),     # satisfaction at the anchor tick
+        ("anchor", np.int64),
+        ("decay", np.float64),
+        ("multiplier", np.float64),
+        ("stage", np.int8),
+        ("due", np.int64),          # tick of the row's queued level event, -1 if none; others are stale
+        ("sum_base", np.float64),   # this row's share of level_base_sum / level_decay_sum
+        ("sum_decay", np.float64),
+        ("alive", np.bool_),
+        ("hovered", np.bool_),
+    )
+
+    def __init__(self, capacity : int = 16):
+        self.creatures : list[Creature] = []
+        self.size = 0
+        self.capacity = max(1, capacity)
+        for column, dtype in self._COLUMNS:
+            setattr(self, column, np.zeros(self.capacity, dtype=dtype))
+        self.broadphase = SpatialHash()
+
+        # World clock in simulation ticks, drives effect expiry and level events
+        self.tick = 0
+        self.events = EventScheduler()
+        self.depleted = 0   # rows in stage 3
+        self.level_base_sum = 0.0
+        self.level_decay_sum = 0.0
+        self._deferred : set[int] | None = None   # rows whose sprite update waits for a batch to end
+
+    def _grow(self):
+        """Double the capacity of every column"""
+        self.capacity *= 2
+        for column, dtype in self._COLUMNS:
+            old = getattr(self, column)
+            new = np.zeros(self.capacity, dtype=dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, column, new)
+
+    def add(self, creature : "Creature", rect : pygame.Rect,
+            satisfaction : float, decay : float, multiplier : float,
+            alive : bool = True) -> int:
+        """Append a row for creature and return its index"""
+        if self.size == self.capacity:
+            self._grow()
+
+        index = self.size
+        satisfaction = max(0.0, satisfaction)
+        self.left[index] = self.prev_left[index] = rect.x
+        self.top[index] = self.prev_top[index] = rect.y
+        self.width[index] = rect.width
+        self.height[index] = rect.height
+        self.level0[index] = satisfaction
+        self.anchor[index] = self.tick
+        self.decay[index] = decay
+        self.multiplier[index] = multiplier
+        self.stage[index] = satisfaction_stage(satisfaction)
+        self.due[index] = -1
+        self.alive[index] = alive
+        self.hovered[index] = False
+        self.sum_base[index] = self.sum_decay[index] = 0.0
+
+        if self.stage[index] == 3:
+            self.depleted += 1
+        self.size += 1
+        self.creatures.append(creature)
+        self._refresh_sum(index)
+        self._schedule_level(index)
+        return index
+
+    def attach(self, creature : "Creature"):
+        """Move a creature (its current row values and active effects) into this pool"""
+        if creature.pool is self:
+            return
+        remaining = [(effect, effect.duration) for effect in creature.effects]
+        index = self.add(
+            creature,
+            creature.rect,
+            creature.satisfaction_level,
+            creature.satisfaction_decay,
+            creature.satisfaction_multiplier,
+            creature.isalive
+        )
+        creature.pool = self
+        creature.index = index
+        for effect, duration in remaining:
+            self.schedule_effect(effect, creature, duration)
+
+    def clear(self):
+        self.creatures.clear()
+        self.size = 0
+        self.depleted = 0
+        self.level_base_sum = 0.0
+        self.level_decay_sum = 0.0
+        self.broadphase.reset()
+        self.events.clear()
+
+    # ------------------------------------------------------------------
+    # Lazy satisfaction
+    # ------------------------------------------------------------------
+
+    def levels(self, indices : np.ndarray | slice | None = None) -> np.ndarray:
+        """Current satisfaction of the given rows (all rows by default)"""
+        if indices is None:
+            indices = slice(0, self.size)
+        elapsed = (self.tick - self.anchor[indices]) * SIM_DT
+        return np.maximum(0.0, self.level0[indices] - self.decay[indices] * elapsed)
+
+    def level(self, index : int) -> float:
+        elapsed = (self.tick - int(self.anchor[index])) * SIM_DT
+        return max(0.0, float(self.level0[index]) - float(self.decay[index]) * elapsed)
+
+    def average_level(self) -> float:
+        """Mean satisfaction of every row, from the running totals"""
+        if self.size == 0:
+            return 0.0
+        total = self.level_base_sum - self.level_decay_sum * self.tick * SIM_DT
+        return max(0.0, total / self.size)
+
+    def set_level(self, index : int, value : float):
+        self._reanchor_row(index, max(0.0, value))
+
+    def set_decay(self, index : int, value : float):
+        current = self.level(index)
+        self.decay[index] = value
+        self._reanchor_row(index, current)
+
+    def set_satisfaction(self, value : float):
+        """Set every row to the same level (admin refill)"""
+        self._reanchor(np.arange(self.size), np.full(self.size, max(0.0, value)))
+
+    def restore_anchor(self, index : int, level0 : float, anchor : int, decay : float):
+        """Put back a saved (level0, anchor tick, decay), so the row carries on exactly as it was saved"""
+        self.level0[index] = level0
+        self.anchor[index] = anchor
+        self.decay[index] = decay
+
+        stage = satisfaction_stage(self.level(index))
+        if stage != self.stage[index]:
+            self._set_stage(index, stage)
+        self._refresh_sum(index)
+        self._schedule_level(index)
+
+    def _reanchor_row(self, index : int, level : float):
+        """Scalar _reanchor for a single row"""
+        self.level0[index] = level
+        self.anchor[index] = self.tick
+
+        stage = satisfaction_stage(level)
+        if stage != self.stage[index]:
+            self._set_stage(index, stage)
+        self._refresh_sum(index)
+        self._schedule_level(index)
+
+        if len(self.events.heap) > 4 * self.size + 256:
+            self.events.compact(self._is_live)
+
+    def _reanchor(self, indices : np.ndarray, levels : np.ndarray):
+        """Restart the linear decay of `indices` (unique rows) from `levels` at the current tick"""
+        self.level0[indices] = levels
+        self.anchor[indices] = self.tick
+
+        stages = satisfaction_stages(levels)
+        changed = stages != self.stage[indices]
+        for index, stage in zip(indices[changed].tolist(), stages[changed].tolist()):
+            self._set_stage(index, stage)
+        self._refresh_sums(indices)
+        self._schedule_levels(indices)
+
+        if len(self.events.heap) > 4 * self.size + 256:
+            self.events.compact(self._is_live)
+
+    def _schedule_level(self, index : int):
+        """
+        Queue the tick at which this row next drops out of its current stage.
+        Nothing is pushed when the row's queued event is already due then.
+        """
+        if self._deferred is not None:
+            return  # batches reschedule every row once at the end
+        stage = int(self.stage[index])
+        decay = float(self.decay[index])
+        if stage == 3 or decay <= 0:
+            self.due[index] = -1
+            return
+        drop = float(self.level0[index]) - STAGE_FLOORS[stage]
+        due = max(int(self.anchor[index]) + max(1, math.ceil(drop / (decay * SIM_DT))), self.tick + 1)
+        if due != self.due[index]:
+            self.due[index] = due
+            self.events.schedule(due, LEVEL_EVENT, index, None)
+
+    def _schedule_levels(self, indices : np.ndarray):
+        """Vectorized _schedule_level for unique rows"""
+        if self._deferred is not None:
+            return
+        stage = self.stage[indices]
+        decay = self.decay[indices]
+        live = (stage != 3) & (decay > 0)
+        steps = np.ceil((self.level0[indices] - _STAGE_FLOORS[stage]) / np.where(live, decay * SIM_DT, 1.0))
+        due = np.where(live, np.maximum(self.anchor[indices] + np.maximum(1, steps).astype(np.int64), self.tick + 1), -1)
+
+        moved = due != self.due[indices]
+        self.due[indices] = due
+        push = moved & live
+        if push.any():
+            self.events.schedule_many(due[push].tolist(), LEVEL_EVENT, indices[push].tolist())
+
+    def _refresh_sum(self, index : int):
+        """Re-derive this row's contribution to the running level totals"""
+        if self.stage[index] == 3:
+            base = decay = 0.0
+        else:
+            decay = float(self.decay[index])
+            base = float(self.level0[index]) + decay * int(self.anchor[index]) * SIM_DT
+        self.level_base_sum += base - self.sum_base[index]
+        self.level_decay_sum += decay - self.sum_decay[index]
+        self.sum_base[index] = base
+        self.sum_decay[index] = decay
+
+    def _refresh_sums(self, indices : np.ndarray):
+        """Vectorized _refresh_sum for unique rows"""
+        live = self.stage[indices] != 3
+        decay = np.where(live, self.decay[indices], 0.0)
+        base = np.where(live, self.level0[indices] + decay * self.anchor[indices] * SIM_DT, 0.0)
+        self.level_base_sum += float((base - self.sum_base[indices]).sum())
+        self.level_decay_sum += float((decay - self.sum_decay[indices]).sum())
+        self.sum_base[indices] = base
+        self.sum_decay[indices] = decay
+
+    def resync_sums(self):
+        """Recompute the running totals from scratch, dropping accumulated rounding"""
+        n = self.size
+        self.sum_base[:n] = self.sum_decay[:n] = 0.0
+        self.level_base_sum = self.level_decay_sum = 0.0
+        self._refresh_sums(np.arange(n))
+
+    def _set_stage(self, index : int, stage : int):
+        old = int(self.stage[index])
+        self.stage[index] = stage
+        self.depleted += (stage == 3) - (old == 3)
+        if (stage == 3) != (old == 3):
+            self._refresh_sum(index)
+
+        if self._deferred is not None:
+            self._deferred.add(index)
+            return
+
+        creature = self.creatures[index]
+        if stage == 1 and old == 0:
+            log(2, f"{creature.name}'s satisfaction level is below 70")
+        elif stage == 2 and old < 2:
+            log(2, f"{creature.name}'s satisfaction level is below 30")
+        creature.update_sprite(stage)
+
+    def _fire_level(self, index : int, due : int):
+        if due != self.due[index]:
+            return
+        self.due[index] = -1
+        stage = satisfaction_stage(self.level(index))
+        if stage != self.stage[index]:
+            self._set_stage(index, stage)
+        self._schedule_level(index)
+
+    def _is_live(self, entry : tuple[int, int, int, Any, Any]) -> bool:
+        tick, _, kind, a, b = entry
+        if kind == LEVEL_EVENT:
+            return a < self.size and tick == self.due[a]
+        return a.expires_at == tick and a.pool is self and b.pool is self and a in b.effects
+
+    def all_depleted(self) -> bool:
+        return self.size > 0 and self.depleted == self.size
+
+    # ------------------------------------------------------------------
+    # Clock and events
+    # ------------------------------------------------------------------
+
+    def schedule_effect(self, effect : "Effect", creature : "Creature", duration : float):
+        """Activate effect on this pool's clock, expiring after duration seconds"""
+        effect.pool = self
+        effect.expires_at = self.tick + max(0, math.ceil(duration / SIM_DT))
+        self.events.schedule(effect.expires_at, EFFECT_EVENT, effect, creature)
+
+    def advance_clock(self, ticks : int = 1, batch : bool = False):
+        """
+        Move the world clock forward, firing due events in tick order.
+        Each event runs with the clock set to its own tick, so state changes
+        it causes (e.g. an expiring Less Decay) re-anchor at the right time.
+
+        batch - for long jumps (offline catch-up): only effect expiries are
+                replayed in order; stages are then evaluated once in closed
+                form, and sprite switches are applied once per creature
+        """
+        target = self.tick + ticks
+        if batch:
+            self._fast_forward(target)
+            return
+
+        while True:
+            entry = self.events.pop_next(target)
+            if entry is None:
+                break
+            due, _, kind, a, b = entry
+            self.tick = max(self.tick, due)
+            if kind == LEVEL_EVENT:
+                self._fire_level(a, due)
+            elif self._is_live(entry):
+                a.remove(b)
+        self.tick = target
+
+    def _fast_forward(self, target : int):
+        heap = self.events.heap
+        due_effects = sorted(e for e in heap if e[2] == EFFECT_EVENT and e[0] <= target)
+        self.events.heap = [e for e in heap if e[2] == EFFECT_EVENT and e[0] > target]
+        heapq.heapify(self.events.heap)
+        self.due[:self.size] = -1
+
+        self._deferred = set()
+        for entry in due_effects:
+            self.tick = max(self.tick, entry[0])
+            if self._is_live(entry):
+                entry[3].remove(entry[4])
+        self.tick = target
+
+        n = self.size
+        stages = satisfaction_stages(self.levels())
+        for index in np.flatnonzero(stages != self.stage[:n]).tolist():
+            self._set_stage(index, int(stages[index]))
+
+        self.resync_sums()
+
+        deferred, self._deferred = self._deferred, None
+        for index in deferred:
+            self.creatures[index].update_sprite(int(self.stage[index]), quiet = True)
+        self._schedule_levels(np.arange(n))
+
+    # ------------------------------------------------------------------
+    # Batched per-frame operations
+    # ------------------------------------------------------------------
+
+    def draw_bounds(self, alpha : float, bar : SatisfactionBar, selected : int = -1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Painted area and appearance of every row, for dirty-rect tracking.
+
+        Returns (bounds, state): bounds is (n, 4) left, top, right, bottom
+        covering the interpolated sprite, its selection outline and its
+        satisfaction bar, state packs bar width/color, stage and selection.
+        """
+        n = self.size
+        left = np.round(self.prev_left[:n] + (self.left[:n] - self.prev_left[:n]) * alpha).astype(np.int64)
+        top = np.round(self.prev_top[:n] + (self.top[:n] - self.prev_top[:n]) * alpha).astype(np.int64)
+        width = self.width[:n].astype(np.int64)
+        height = self.height[:n].astype(np.int64)
+        bar_left = left + width // 2 + bar.offset_x
+
+        bounds = np.empty((n, 4), dtype=np.int64)
+        bounds[:, 0] = np.minimum(left - 5, bar_left)                   # outline is inflate(10, 10)
+        bounds[:, 1] = np.minimum(top - 5, top + bar.offset_y)
+        bounds[:, 2] = np.maximum(left + width + 5, bar_left + bar.width)
+        bounds[:, 3] = np.maximum(top + height + 5, top + bar.offset_y + bar.height)
+
+        levels = self.levels()
+        state = np.clip((levels / 100 * bar.width).astype(np.int64), 0, bar.width)
+        state |= bar.color_indices(levels) << 16
+        state |= self.stage[:n].astype(np.int64) << 20
+        if 0 <= selected < n:
+            state[selected] |= 1 << 24
+        return bounds, state
+
+    def store_previous(self):
+        """Remember positions at the start of a tick so draws can interpolate"""
+        n = self.size
+        self.prev_left[:n] = self.left[:n]
+        self.prev_top[:n] = self.top[:n]
+
+    def clamp(self, left : int, top : int, right : int, bottom : int):
+        """Keep every rect inside the given world bounds"""
+        n = self.size
+        self.left[:n] = np.maximum(left, np.minimum(self.left[:n], right - self.width[:n]))
+        self.top[:n] = np.maximum(top, np.minimum(self.top[:n], bottom - self.height[:n]))
+
+    def update_hover(self, mouse_pos : tuple[int, int]):
+        mx, my = mouse_pos
+        n = self.size
+        self.hovered[:n] = (
+            (self.left[:n] <= mx) & (mx < self.left[:n] + self.width[:n]) &
+            (self.top[:n] <= my) & (my < self.top[:n] + self.height[:n])
         )
 
+    def resolve_soft_collisions(self, dt : float = SIM_DT, push_strength : float = 0.5,
+                                penalty : float = COLLISION_PENALTY) -> int:
+        """
+        Batched Creature.resolve_soft_collisions for every overlapping pair.
+
+        Candidate pairs come from the spatial hash; every overlapping pair costs
+        both creatures `penalty * dt` satisfaction and pushes them apart along
+        the line between their centers. Pushes are computed from the positions
+        at the start of the tick. Returns the number of pairs tested.
+        """
+        self.broadphase.update(self)
+        i = self.broadphase.pairs_i
+        j = self.broadphase.pairs_j
+        if len(i) == 0:
+            return 0
+
+        left, top = self.left, self.top
+        right = left + self.width
+        bottom = top + self.height
+        hit = (left[i] < right[j]) & (left[j] < right[i]) & (top[i] < bottom[j]) & (top[j] < bottom[i])
+        if not hit.any():
+            return len(i)
+
+        i = i[hit]
+        j = j[hit]
+        n = self.size
+
+        hits = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+        bumped = np.flatnonzero(hits)
+        self._reanchor(bumped, np.maximum(0.0, self.levels(bumped) - penalty * dt * hits[bumped]))
+
+        center_x = left[:n] + self.width[:n] // 2
+        center_y = top[:n] + self.height[:n] // 2
+        delta_x = (center_x[i] - center_x[j]).astype(np.float64)
+        delta_y = (center_y[i] - center_y[j]).astype(np.float64)
+        delta_x[(delta_x == 0) & (delta_y == 0)] = 1.0
+        distance = np.maximum(1.0, np.hypot(delta_x, delta_y))
+
+        # int() truncation towards zero, same as the per-pair version
+        push_x = np.trunc(delta_x / distance * push_strength).astype(np.int32)
+        push_y = np.trunc(delta_y / distance * push_strength).astype(np.int32)
+        if push_x.any() or push_y.any():
+            np.add.at(self.left, i, push_x)
+            np.add.at(self.top, i, push_y)
+            np.add.at(self.left, j, -push_x)
+            np.add.at(self.top, j, -push_y)
+
+        return len(hit)
+
+
 class Creature:
     def __init__(self, name : str, type : str, x : int, y : int, sprite: list[str],
                 satisfaction_multiplier : int = 1,
-                satisfaction_decay : float = 0.01,
+                satisfaction_decay : float = DEFAULT_DECAY,
                 satisfaction_level : float = 100,
-                dragging : bool = True):
+                dragging : bool = True,
+                pool : CreaturePool | None = None):
         self.name = name
-        self.x = x
-        self.y = y
         self.type = type
-        self.satisfaction_multiplier  = satisfaction_multiplier
-        self.satisfaction_decay  = satisfaction_decay
-        self.satisfaction_level = satisfaction_level
         self.satisfaction_bar = SatisfactionBar()
         self.effects : list[Effect] = []
-        self.hovered = False
-        self.isalive = True
-        
 
         # Reactive Sprite Image
         self.frames_paths = sprite
-        self.frames = [pygame.image.load(path).convert_alpha() for path in sprite]
+        self.frames = [load_image(path) for path in sprite]
         self.sprite = self.frames[0]
-        self.rect = self.frames[0].get_rect(center = (x,y))
+
+        # Numeric state lives in a CreaturePool row; a creature created outside
+        # of a scene gets a private pool until GameScene attaches it.
+        self.pool = pool if pool is not None else CreaturePool(capacity = 1)
+        self.index = self.pool.add(
+            self,
+            self.frames[0].get_rect(center = (x,y)),
+            satisfaction_level,
+            satisfaction_decay,
+            satisfaction_multiplier
+        )
+        if self.pool.stage[self.index]:
+            self.update_sprite(int(self.pool.stage[self.index]))
+
+    # ------------------------------------------------------------------
+    # Views over the pool row
+    # ------------------------------------------------------------------
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Snapshot of the creature rect. Use move()/move_topleft()/shift() to change it."""
+        i = self.index
+        return pygame.Rect(int(self.pool.left[i]), int(self.pool.top[i]),
+                           int(self.pool.width[i]), int(self.pool.height[i]))
+
+    @property
+    def x(self) -> int:
+        return int(self.pool.left[self.index] + self.pool.width[self.index] // 2)
+
+    @property
+    def y(self) -> int:
+        return int(self.pool.top[self.index] + self.pool.height[self.index] // 2)
+
+    @property
+    def satisfaction_level(self) -> float:
+        """Evaluated lazily from the pool's (level0, anchor, decay)"""
+        return self.pool.level(self.index)
+
+    @satisfaction_level.setter
+    def satisfaction_level(self, value : float):
+        self.pool.set_level(self.index, value)
+
+    @property
+    def satisfaction_decay(self) -> float:
+        return float(self.pool.decay[self.index])
+
+    @satisfaction_decay.setter
+    def satisfaction_decay(self, value : float):
+        self.pool.set_decay(self.index, value)
+
+    @property
+    def satisfaction_multiplier(self) -> float:
+        return float(self.pool.multiplier[self.index])
+
+    @satisfaction_multiplier.setter
+    def satisfaction_multiplier(self, value : float):
+        self.pool.multiplier[self.index] = value
+
+    @property
+    def isalive(self) -> bool:
+        return bool(self.pool.alive[self.index])
+
+    @isalive.setter
+    def isalive(self, value : bool):
+        self.pool.alive[self.index] = value
+
+    @property
+    def hovered(self) -> bool:
+        return bool(self.pool.hovered[self.index])
+
+    @hovered.setter
+    def hovered(self, value : bool):
+        self.pool.hovered[self.index] = value
+
+    def render_rect(self, alpha : float = 1.0) -> pygame.Rect:
+        """Rect interpolated between the previous and current tick positions"""
+        i = self.index
+        left = self.pool.prev_left[i] + (self.pool.left[i] - self.pool.prev_left[i]) * alpha
+        top = self.pool.prev_top[i] + (self.pool.top[i] - self.pool.prev_top[i]) * alpha
+        return pygame.Rect(round(left), round(top), int(self.pool.width[i]), int(self.pool.height[i]))
 
     def move(self, new_x : int, new_y : int):
-        self.x = new_x
-        self.y = new_y
-        self.rect.center = (new_x, new_y)
+        """Move the creature so its center is at (new_x, new_y)"""
+        i = self.index
+        self.move_topleft(new_x - self.pool.width[i] // 2, new_y - self.pool.height[i] // 2)
+
+    def move_topleft(self, left : int, top : int):
+        """Teleport the creature (no interpolation from the old position)"""
+        i = self.index
+        self.pool.left[i] = self.pool.prev_left[i] = left
+        self.pool.top[i] = self.pool.prev_top[i] = top
+
+    def shift(self, dx : int, dy : int):
+        self.pool.left[self.index] += dx
+        self.pool.top[self.index] += dy
 
-    def update_sprite(self, spritestyle: int):
+    def update_sprite(self, spritestyle: int, quiet : bool = False):
         if not self.isalive and spritestyle != 3:
             return  # dead creatures cannot change sprite
 
         if spritestyle == 3:
-            if self.isalive:  # only log once
+            if self.isalive and not quiet:  # only log once
                 log(2, f"Creature '{self.name}' has reached 0 satisfaction and is now dead.")
-            self.sprite = pygame.image.load("assets/Sprites/Dead.png").convert_alpha()
+            # sprite lists carry the dead frame last; older lists may stop at 3 frames
+            self.sprite = self.frames[3] if len(self.frames) > 3 else load_image("assets/Sprites/Dead.png")
             self.isalive = False
         else:
             self.sprite = self.frames[spritestyle]
@@ -110,15 +860,16 @@ class Creature:
 
 
 
-    def draw(self, screen: pygame.Surface, is_selected : bool = False):
+    def draw(self, screen: pygame.Surface, is_selected : bool = False, alpha : float = 1.0):
+        rect = self.render_rect(alpha)
         if is_selected:
-            pygame.draw.rect(screen, (255,255, 0), self.rect.inflate(10,10), width = 3)
-        screen.blit(self.sprite, self.rect)
+            pygame.draw.rect(screen, (255,255, 0), rect.inflate(10,10), width = 3)
+        screen.blit(self.sprite, rect)
 
         self.satisfaction_bar.draw(
             screen,
-            self.rect.centerx,
-            self.rect.top,
+            rect.centerx,
+            rect.top,
             self.satisfaction_level
         )
 
@@ -126,17 +877,20 @@ class Creature:
         if action == PetAction.PET and self.satisfaction_level > 0:
             self.satisfaction_level = min(100, (self.satisfaction_level + 0.5 * self.satisfaction_multiplier))
     
-    def resolve_soft_collisions(self, other : "Creature", push_strength : float = 0.5) -> None:
+    def resolve_soft_collisions(self, other : "Creature", push_strength : float = 0.5,
+                                penalty : float = COLLISION_PENALTY * SIM_DT) -> None:
         """Soft separation force between creature and other creature"""
 
         if self is other:
             return
         
-        if self.rect.colliderect(other.rect):
-            self.satisfaction_level = max(0, self.satisfaction_level - 0.1)
-            other.satisfaction_level = max(0, other.satisfaction_level - 0.1)
-            delta_x = float(self.rect.centerx - other.rect.centerx)
-            delta_y = float(self.rect.centery - other.rect.centery)
+        self_rect = self.rect
+        other_rect = other.rect
+        if self_rect.colliderect(other_rect):
+            self.satisfaction_level = max(0, self.satisfaction_level - penalty)
+            other.satisfaction_level = max(0, other.satisfaction_level - penalty)
+            delta_x = float(self_rect.centerx - other_rect.centerx)
+            delta_y = float(self_rect.centery - other_rect.centery)
 
             if delta_x == 0 and delta_y == 0:
                 delta_x = 1.0
@@ -146,21 +900,122 @@ class Creature:
             normal_x: float = delta_x / distance
             normal_y: float = delta_y / distance
 
-            self.rect.x += int(normal_x * push_strength)
-            self.rect.y += int(normal_y * push_strength)
+            self.shift(int(normal_x * push_strength), int(normal_y * push_strength))
+            other.shift(-int(normal_x * push_strength), -int(normal_y * push_strength))
 
-            other.rect.x -= int(normal_x * push_strength)
-            other.rect.y -= int(normal_y * push_strength)
 
-
-    def update_effects(self):
-        for effects in self.effects[:]:
-            effects.update(self)
-    
     def update_hover(self, mouse_pos : tuple[int, int]):
         mx, my = mouse_pos
         self.hovered = self.rect.collidepoint(mx, my)
 
+class CreatureSprite(pygame.sprite.Sprite):
+    """
+    Composited image of one creature: selection outline, sprite frame and
+    satisfaction bar in a single surface covering CreaturePool.draw_bounds().
+    The image is only rebuilt when the row's draw state (bar width/color,
+    stage, selection) changes; moving just moves the rect.
+    """
+    def __init__(self, creature : "Creature", row : int):
+        super().__init__()
+        self.creature = creature
+        self.row = row
+        self.state : int | None = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def compose(self, state : int, selected : bool):
+        c = self.creature
+        bar = c.satisfaction_bar
+        w, h = c.sprite.get_size()
+
+        # Local layout, same geometry as Creature.draw() with the sprite at (0, 0)
+        sprite_rect = pygame.Rect(0, 0, w, h)
+        outline = sprite_rect.inflate(10, 10)
+        bar_rect = pygame.Rect(w // 2 + bar.offset_x, bar.offset_y, bar.width, bar.height)
+        bounds = outline.union(bar_rect)
+        dx, dy = -bounds.x, -bounds.y
+
+        image = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        if selected:
+            pygame.draw.rect(image, (255, 255, 0), outline.move(dx, dy), width = 3)
+        # MAX copies the frame's pixels as-is onto the transparent canvas (a normal blit would premultiply them)
+        image.blit(c.sprite, (dx, dy), special_flags = pygame.BLEND_RGBA_MAX)
+        bar.draw(image, w // 2 + dx, dy, c.satisfaction_level)
+
+        self.image = image
+        self.state = state
+
+
+class CreatureGroup(pygame.sprite.Group):
+    """
+    Group holding one CreatureSprite per pool row.
+
+    sync() compares the pool's draw arrays with last frame's and only touches
+    rows that changed, returning their old and new rects. draw_area() repaints
+    the sprites inside one region, ordered by the bottom of the creature (then
+    row) so creatures lower on screen are drawn in front.
+
+    This is a plain Group rather than a LayeredDirty: the scene's
+    DirtyRenderer already decides which regions to repaint and clears them,
+    and LayeredDirty.draw() would walk every sprite in Python each frame
+    to find the dirty ones. Hit-testing and z-ordering over the bounds
+    arrays with NumPy keeps a redraw proportional to what it touches.
+    """
+    MAX_CHANGED = 32            # more changed sprites than this and sync() asks for a full redraw
+
+    def __init__(self):
+        super().__init__()
+        self.rows : list[CreatureSprite] = []
+        self._creatures : list[Creature] = []     # row -> creature at the last rebuild
+        self._bounds : np.ndarray = np.empty((0, 4), dtype=np.int64)
+        self._state : np.ndarray = np.empty(0, dtype=np.int64)
+
+    def sync(self, creatures : "list[Creature]", bounds : np.ndarray, state : np.ndarray,
+             selected : int = -1) -> list[pygame.Rect] | None:
+        """
+        Bring the sprites up to date with bounds/state from CreaturePool.draw_bounds().
+        Returns the old and new rects of every changed sprite, or None when so
+        many changed (or rows were replaced) that a full redraw is cheaper.
+        """
+        n = len(creatures)
+        # list == compares by identity here (Creature has no __eq__), row by row in C
+        rebuilt = self._creatures != creatures
+        if rebuilt:
+            self._creatures = list(creatures)
+            self.empty()
+            self.rows = [CreatureSprite(creature, i) for i, creature in enumerate(creatures)]
+            changed = np.arange(n)
+        else:
+            changed = np.flatnonzero((bounds != self._bounds).any(axis = 1) | (state != self._state))
+        self._bounds, self._state = bounds, state
+
+        full = rebuilt or len(changed) > self.MAX_CHANGED
+        rects : list[pygame.Rect] = []
+        for i in changed.tolist():
+            sprite = self.rows[i]
+            if not full:
+                rects.append(pygame.Rect(sprite.rect))
+            if sprite.state != int(state[i]):
+                sprite.compose(int(state[i]), i == selected)
+            b = bounds[i]
+            sprite.rect = pygame.Rect(int(b[0]), int(b[1]), int(b[2] - b[0]), int(b[3] - b[1]))
+            self.add(sprite)
+            if not full:
+                rects.append(pygame.Rect(sprite.rect))
+        return None if full else rects
+
+    def draw_area(self, surface : pygame.Surface, area : pygame.Rect | None = None):
+        """Blit the sprites touching area (all when None) back to front"""
+        b = self._bounds
+        if area is None:
+            hit = np.arange(len(b))
+        else:
+            hit = ((b[:, 0] < area.right) & (b[:, 2] > area.left) & (b[:, 1] < area.bottom) & (b[:, 3] > area.top)).nonzero()[0]
+        order = hit[np.lexsort((hit, b[hit, 3]))]
+        rows = self.rows
+        surface.blits([(rows[i].image, rows[i].rect) for i in order.tolist()], doreturn = False)
+
+
 class GlobalSatisfactionBar(SatisfactionBar):
     def __init__(self, screen_width : int=800, y : int=20, height : int=12, margin : int =40):
         width = screen_width - 2 * margin
@@ -171,42 +1026,63 @@ class GlobalSatisfactionBar(SatisfactionBar):
         self.x = x
         self.y = y
 
-    def compute_average(self, creatures : list[Creature]):
+    def compute_average(self, creatures : "CreaturePool | list[Creature]"):
+        """A pool answers from its running totals, a plain list is summed"""
+        if isinstance(creatures, CreaturePool):
+            return creatures.average_level()
         if not creatures:
             return 0
         total = sum(c.satisfaction_level for c in creatures)
         return total / len(creatures)
 
-    def draw(self, screen : pygame.Surface, creatures : list[Creature]): #type: ignore
+    def draw_state(self, creatures : "CreaturePool | list[Creature]") -> tuple[Any, pygame.Rect]: #type: ignore
+        return super().draw_state(self.x, self.y, self.compute_average(creatures))
+
+    def draw(self, screen : pygame.Surface, creatures : "CreaturePool | list[Creature]"): #type: ignore
         avg = self.compute_average(creatures)
         super().draw(screen, self.x, self.y, avg)
 
 class Effect():
+    """
+    Timed creature modifier; duration is in seconds.
+
+    Once consumed, expiry is handled by the pool's EventScheduler and the
+    remaining duration is derived from the world clock on demand.
+    """
     def __init__(self, name : str):
         self.name = name
-        self.duration = 0
+        self.pool : CreaturePool | None = None
+        self.expires_at : int | None = None
+        self._duration : float = 0
+
+    @property
+    def duration(self) -> float:
+        """Remaining seconds"""
+        if self.pool is None or self.expires_at is None:
+            return self._duration
+        return max(0, (self.expires_at - self.pool.tick) * SIM_DT)
+
+    @duration.setter
+    def duration(self, value : float):
+        self._duration = value
+        self.expires_at = None
+        self.pool = None
 
     def remove(self, creature : Creature):
         if self in creature.effects:
             creature.effects.remove(self)
 
-    def update(self, creature : Creature):
-        if self.duration > 0:
-            self.duration -= 1
-        else:
-            self.remove(creature)
-
-    def consume(self, creature : Creature, multiplier : int, duration_frames : int):
+    def consume(self, creature : Creature, multiplier : int, duration : float):
         for effect in creature.effects[:]:
             if type(effect) == type(self):
                 creature.effects.remove(effect)
-        self.duration = duration_frames
         creature.effects.append(self)
+        creature.pool.schedule_effect(self, creature, duration)
 
     def to_dict(self, creature : Creature | None = None):
             data : dict[str, Any] = {
                 "name": self.name,
-                "duration": self.duration,
+                "duration_seconds": self.duration,
                 "type": self.__class__.__name__
             }
 
@@ -219,16 +1095,13 @@ class Effect():
         
 class More_Satisfaction(Effect):
     """Increases Satisfaction sensitivity"""
-    def __init__(self, multiplier: float = 1.0, duration: int = 0):
+    def __init__(self, multiplier: float = 1.0, duration: float = 0):
         super().__init__(name="More Satisfaction")
         self.multiplier = multiplier
-        if duration and duration < 1000:
-            self.duration = duration * 60
-        else:
-            self.duration = duration
+        self.duration = duration
     
-    def consume(self, creature : Creature, multiplier : int = 1, duration_frames : int = 0):
-        super().consume(creature, multiplier, duration_frames)
+    def consume(self, creature : Creature, multiplier : int = 1, duration : float = 0):
+        super().consume(creature, multiplier, duration)
         use_mult = getattr(self, "multiplier", None)
         if use_mult is None:
             use_mult = multiplier or 1
@@ -240,16 +1113,13 @@ class More_Satisfaction(Effect):
     
 class Less_Decay(Effect):
     """Reduce Decay Rate of Creature"""
-    def __init__(self, multiplier: float = 1.0, duration: int = 0):
+    def __init__(self, multiplier: float = 1.0, duration: float = 0):
         super().__init__(name="Less Decay")
         self.multiplier = multiplier
-        if duration and duration < 1000:
-            self.duration = duration * 60
-        else:
-            self.duration = duration
+        self.duration = duration
 
-    def consume(self, creature : Creature, multiplier : int = 1, duration_frames : int = 0):
-        super().consume(creature, multiplier, duration_frames)
+    def consume(self, creature : Creature, multiplier : int = 1, duration : float = 0):
+        super().consume(creature, multiplier, duration)
         use_mult = getattr(self, "multiplier", None)
         if use_mult is None:
             use_mult = multiplier or 1
@@ -257,7 +1127,7 @@ class Less_Decay(Effect):
 
     def remove(self, creature : Creature):
         super().remove(creature)
-        creature.satisfaction_decay = 0.01
+        creature.satisfaction_decay = DEFAULT_DECAY
 
 class Consumable():
     def __init__(self, name : str):
@@ -292,6 +1162,11 @@ class Inventory:
         self.foods : defaultdict[str, int] = defaultdict(int)
         self.potions : defaultdict[str, int] = defaultdict(int)
         self.cleanse : defaultdict[str, int] = defaultdict(int)
+        self.listeners : list[Callable[[], None]] = []    # called after every count change (e.g. Toolbar.invalidate)
+
+    def notify(self):
+        for listener in self.listeners:
+            listener()
     
     def add_inventory(self, item : Food | Potion | Cleanse):
         """
@@ -310,6 +1185,7 @@ class Inventory:
         else:
             self.cleanse[item.name] += 1
         log(2, f"Acquired an item: {item.name}")
+        self.notify()
 
     def remove_inventory(self, item_name: str, on_consumed): #type: ignore
         """
@@ -330,6 +1206,7 @@ class Inventory:
             
         if consumed:
             log(2, f"Consumed an item: {item_name}")
+            self.notify()
 
             if on_consumed is not None:
                 on_consumed(item_name)
@@ -337,9 +1214,16 @@ class Inventory:
 class Money:
     def __init__(self, money : int = 0):
         self.money : int = money
+        self.rect = pygame.Rect(630, 470, 140, 36)
+        self._label = None
         
     def add_money(self, flappypoints : int | float):
-        self.money += int(flappypoints) * random.randint(6, 10)
+        self.money += Money.reward(flappypoints)
+
+    @staticmethod
+    def reward(flappypoints : int | float) -> int:
+        """Money earned for a minigame score"""
+        return int(flappypoints) * random.randint(6, 10)
     
     def remove_money(self, item : dict[str, int]):
         self.money -= item["price"]
@@ -349,5 +1233,11 @@ class Money:
 
         from game_manager import Text
 
-        text = Text(630, 470, 140, 36, pygame.font.Font(None, 30), f"${str(self.money)}", "#e8ab83", "#ffffff")
-        text.draw(screen)
+        if self._label is None:
+            self._label = Text(self.rect.x, self.rect.y, self.rect.width, self.rect.height, get_font(None, 30), "", "#e8ab83", "#ffffff")
+        self._label.text = f"${str(self.money)}"
+        self._label.draw(screen)
+
+    def draw_state(self) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        return f"${str(self.money)}", self.rect
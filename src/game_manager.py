@@ -7,6 +7,8 @@ from classes import Food, Cleanse, Potion
 from collections.abc import Callable
 from typing import Any
 from non_essential import hex_to_rgb
+from assets import load_image, scaled_image, get_font, render_text
+from logger import log
 
 class InfoBox:
     def __init__(self, xpos : int, ypos : int, wid : int | float, hei : int | float, 
@@ -27,7 +29,7 @@ class InfoBox:
         pygame.draw.rect(surface, self.color, self.rect, border_radius=5)
         
         if self.image:
-            portrait = pygame.transform.scale(self.image, (120, 120))
+            portrait = scaled_image(self.image, (120, 120))
             portrait_rect = portrait.get_rect(topleft=(self.rect.x + 20, self.rect.y + 20))
             surface.blit(portrait, portrait_rect)
             text_x_offset = 160  # shift text to the right of portrait
@@ -40,10 +42,14 @@ class InfoBox:
             start_y = self.rect.y + 20
 
             for i, line in enumerate(lines):
-                text_surf = self.font.render(line, True, self.text_color)
+                text_surf = render_text(self.font, line, self.text_color)
                 text_rect = text_surf.get_rect(topleft=(self.rect.x + text_x_offset, start_y + i * line_height))
                 surface.blit(text_surf, text_rect)
 
+    def draw_state(self) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        return (self.text, id(self.image), self.color, self.text_color), self.rect
+
     def handle_event(self, event : pygame.event.Event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             return False
@@ -79,10 +85,15 @@ class Button:
         button_color = self.hover_color if is_hovered else self.color
         pygame.draw.rect(surface, button_color, self.rect, border_radius = 5)
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center = self.rect.center)
         surface.blit(text_surf, text_rect)
 
+    def draw_state(self) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        is_hovered = self.rect.collidepoint(pygame.mouse.get_pos())
+        return (is_hovered, self.text, self.color, self.hover_color, self.text_color), self.rect
+
     def handle_event(self, event : pygame.event.Event):
         """Button handles"""
         mx, my = pygame.mouse.get_pos()
@@ -102,9 +113,13 @@ class InputField:
 
     def draw(self, screen : pygame.Surface):
         pygame.draw.rect(screen, (255,255,255), self.rect, 2)
-        txt = self.font.render(self.text, True, (255,255,255))
+        txt = render_text(self.font, self.text, (255,255,255))
         screen.blit(txt, (self.rect.x + 5, self.rect.y + 5))
 
+    def draw_state(self) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        return self.text, self.rect
+
     def handle_event(self, event : pygame.event.Event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.active = self.rect.collidepoint(event.pos) # true if the field in being interacted
@@ -135,11 +150,15 @@ class Text:
     def draw(self, screen : pygame.Surface):
         if self.should_draw:
             pygame.draw.rect(screen, self.bg_color, self.rect)
-            text_surf = self.font.render(self.text, True, self.text_color)
+            text_surf = render_text(self.font, self.text, self.text_color)
             text_rect = text_surf.get_rect(center=self.rect.center)  # center in the rectangle
             screen.blit(text_surf, text_rect)
         else: return
 
+    def draw_state(self) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        return (self.should_draw, self.text, self.bg_color, self.text_color), self.rect
+
 class BackgroundManager:
     def __init__(self, wid : int = 800, hei : int = 600):
         self.width = wid
@@ -147,13 +166,45 @@ class BackgroundManager:
         self.current : pygame.Surface | None = None
 
     def load(self, filename : str):
-        bg = pygame.image.load(filename).convert()
-        self.current = pygame.transform.scale(bg, (self.width, self.height))
+        self.current = load_image(filename, (self.width, self.height), alpha = False)
 
     def draw(self, screen: pygame.Surface):
         if self.current:
             screen.blit(self.current, (0,0))
 
+class CursorManager:
+    """
+    Hardware color cursors built from image files.
+
+    cursors maps a state name to (path, hotspot). The OS draws and moves the
+    pointer, so moving the mouse never repaints the scene; set() only calls
+    pygame.mouse.set_cursor() when the state actually changes. Drivers
+    without cursor support (e.g. dummy) keep the system cursor.
+    """
+    def __init__(self, cursors : dict[str, tuple[str, tuple[int, int]]]):
+        self.cursors = cursors
+        self.current : str | None = None
+        self.supported = True
+        self._built : dict[str, pygame.cursors.Cursor] = {}
+
+    def cursor(self, name : str) -> pygame.cursors.Cursor:
+        cursor = self._built.get(name)
+        if cursor is None:
+            path, hotspot = self.cursors[name]
+            cursor = self._built[name] = pygame.cursors.Cursor(hotspot, load_image(path))
+        return cursor
+
+    def set(self, name : str):
+        if name == self.current or not self.supported:
+            return
+        try:
+            pygame.mouse.set_cursor(self.cursor(name))
+        except pygame.error as e:
+            self.supported = False
+            log(1, f"Hardware cursors unavailable, using the system cursor ({e})")
+            return
+        self.current = name
+
 class Menu:
     def __init__(self, background_file: str, buttons: list[Button], bg_manager: BackgroundManager):
         self.buttons = buttons
@@ -227,7 +278,7 @@ class GameSetupMenu(Menu):
 
         if self.input_fields:
             for i, field in enumerate(self.input_fields):
-                label_surf = field.font.render(self.labels[i], True, hex_to_rgb('ffffff'))
+                label_surf = render_text(field.font, self.labels[i], hex_to_rgb('ffffff'))
                 screen.blit(label_surf, (field.rect.x, field.rect.y - 30))
                 field.draw(screen)
 
@@ -272,7 +323,7 @@ class InventorySlot:
         self.quantity: int = 0
 
         # Font
-        self.font: pygame.font.Font = pygame.font.Font(None, 18)
+        self.font: pygame.font.Font = get_font(None, 18)
         self.item: Food | Potion | Cleanse | None = None
 
         # Dragging Logics
@@ -318,12 +369,31 @@ class InventorySlot:
 
         return False
 
+    def sync_quantity(self, inventory : Any):
+        """Get quantity from inventory"""
+        if self.item_name in inventory.foods:
+            self.quantity = inventory.foods[self.item_name]
+        elif self.item_name in inventory.potions:
+            self.quantity = inventory.potions[self.item_name]
+        elif self.item_name in inventory.cleanse:
+            self.quantity = inventory.cleanse[self.item_name]
+
+    def draw_state(self, inventory : Any) -> tuple[Any, pygame.Rect]:
+        """(state, painted rect) for dirty-rect tracking, see renderer.DirtyRenderer"""
+        self.sync_quantity(inventory)
+        if self.dragging and self.drag_icon and self.drag_pos:
+            drag_rect = pygame.Rect(self.drag_pos[0] + 4, self.drag_pos[1] + 4, self.rect.width - 8, self.rect.height - 8)
+            return ("drag", id(self.drag_icon)), drag_rect
+        return (self.hovered, self.quantity, id(self.icon)), self.rect
+
     def draw(self, screen : pygame.Surface, inventory: Any):
         if self.dragging and self.drag_icon and self.drag_pos:
-            icon = pygame.transform.scale(self.drag_icon, (self.rect.width - 8, self.rect.height - 8))
+            icon = scaled_image(self.drag_icon, (self.rect.width - 8, self.rect.height - 8))
             screen.blit(icon, (self.drag_pos[0] + 4, self.drag_pos[1] + 4))
             return
 
+        self.sync_quantity(inventory)
+
         pygame.draw.rect(screen, self.bg_color, self.rect, border_radius=6)
         pygame.draw.rect(screen, self.border_color, self.rect, width=2, border_radius=6)
 
@@ -332,26 +402,23 @@ class InventorySlot:
         # Draw icon
         if self.icon:
             if self.quantity > 0:
-                icon = pygame.transform.scale(self.icon, (self.rect.width - 8, self.rect.height - 8))
+                icon = scaled_image(self.icon, (self.rect.width - 8, self.rect.height - 8))
                 screen.blit(icon, (self.rect.x + 4, self.rect.y + 4))
 
-        # Get quantity from inventory
-        if self.item_name in inventory.foods:
-            self.quantity = inventory.foods[self.item_name]
-        elif self.item_name in inventory.potions:
-            self.quantity = inventory.potions[self.item_name]
-        elif self.item_name in inventory.cleanse:
-            self.quantity = inventory.cleanse[self.item_name]
-
         # Draw quantity
         if self.quantity > 0:
-            text = self.font.render(str(self.quantity), True, (255, 255, 255))
+            text = render_text(self.font, str(self.quantity), (255, 255, 255))
             screen.blit(text, (self.rect.right - text.get_width() - 4,
                             self.rect.bottom - text.get_height() - 2))
 
 class Toolbar:
     """
     IFYKYK
+
+    Retained mode: the background, tab headers and active tab are rendered into
+    an offscreen surface that is only rebuilt after invalidate() (tab switch,
+    inventory change, hover or drag change, label change). Every other frame
+    the toolbar is a single blit; only a dragged item icon is drawn live.
     """
     def __init__(self, x: int, y : int , width : int, height : int, bg_color : tuple[int, int,int] | str, buttons : list[Button] | None = None, Text : list[Text] | None = None, tabs: list[dict] | None = None):
         self.rect = pygame.Rect(x, y, width, height)
@@ -372,10 +439,15 @@ class Toolbar:
         self._tab_header_buttons: list[Button] = []
 
         # Default font for tab headers
-        self._tab_font = pygame.font.Font(None, 22)
+        self._tab_font = get_font(None, 22)
 
         self.visible = True
 
+        # Retained render, see invalidate()
+        self._canvas : pygame.Surface | None = None
+        self._rendered_state : tuple[Any, ...] | None = None
+        self.version = 0
+
         # If tabs provided, prepare header buttons
         if self.tabs:
             self._build_tab_headers()
@@ -417,10 +489,38 @@ class Toolbar:
         """Add a new tab to the toolbar."""
         self.tabs.append({'name': name, 'buttons': buttons if buttons else [], 'elements': elements if elements else []})
         self._build_tab_headers()
+        self.invalidate()
 
     def switch_tab(self, index: int):
         if 0 <= index < len(self.tabs):
             self.active_tab = index
+            self.invalidate()
+
+    def invalidate(self):
+        """Re-render the toolbar on the next draw; call after anything it shows changes"""
+        self._rendered_state = None
+        self.version += 1
+
+    def bounds(self) -> pygame.Rect:
+        """Area covered by the retained render (the bar plus the tab headers above it)"""
+        return self.rect.unionall([btn.rect for btn in self._tab_header_buttons]) if self._tab_header_buttons else pygame.Rect(self.rect)
+
+    def _components(self) -> list[Any]:
+        if self.tabs:
+            active = self.tabs[self.active_tab]
+            return active.get('buttons', []) + active.get('elements', [])
+        return self.text
+
+    def _render_state(self) -> tuple[Any, ...]:
+        """Everything the retained render depends on, compared after events"""
+        inventory = self.parent_scene.inventory if self.parent_scene else None
+        states : list[Any] = [self.active_tab, tuple(self.rect)]
+        for element in self._tab_header_buttons + self._components():
+            if isinstance(element, InventorySlot):
+                states.append(element.draw_state(inventory)[0])
+            elif hasattr(element, "draw_state"):
+                states.append(element.draw_state()[0])
+        return tuple(states)
 
     def add_button(self, button : Button):
         """Add a button to the legacy single-view toolbar (or current tab if tabbed)."""
@@ -441,6 +541,14 @@ class Toolbar:
         if not self.visible:
             return
 
+        self._dispatch_event(event)
+
+        # Hover, drag and quantity changes show up in the component states
+        if self._rendered_state is not None and self._render_state() != self._rendered_state:
+            self.invalidate()
+
+    def _dispatch_event(self, event: pygame.event.Event):
+
         # If tabbed, send events to header buttons and active tab's components
         if self.tabs:
             # Tab header buttons (switch tabs)
@@ -469,11 +577,47 @@ class Toolbar:
 
             return
 
+    def draw_regions(self) -> list[tuple[Any, Any, pygame.Rect]]:
+        """(key, state, painted rect) for the retained render and any dragged icon, see renderer.DirtyRenderer"""
+        if not self.visible:
+            return []
+
+        regions : list[tuple[Any, Any, pygame.Rect]] = [(id(self), self.version, self.bounds())]
+        inventory = self.parent_scene.inventory if self.parent_scene else None
+        for element in self._components():
+            if self._is_dragged(element):
+                state, rect = element.draw_state(inventory)
+                regions.append((id(element), state, rect))
+        return regions
+
+    @staticmethod
+    def _is_dragged(element : Any) -> bool:
+        return isinstance(element, InventorySlot) and bool(element.dragging and element.drag_icon and element.drag_pos)
+
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the toolbar and all its components."""
         if not self.visible:
             return
 
+        bounds = self.bounds()
+        if self._rendered_state is None or self._canvas is None or self._canvas.get_size() != screen.get_size():
+            # Components draw at screen coordinates, so render onto a screen-sized
+            # transparent canvas and blit back only the toolbar's part of it
+            if self._canvas is None or self._canvas.get_size() != screen.get_size():
+                self._canvas = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            self._canvas.fill((0, 0, 0, 0), bounds)
+            self._render(self._canvas)
+            self._rendered_state = self._render_state()
+
+        screen.blit(self._canvas, bounds, bounds)
+
+        # Dragged icons follow the mouse, they are never part of the retained render
+        for element in self._components():
+            if self._is_dragged(element):
+                element.draw(screen, self.parent_scene.inventory)
+
+    def _render(self, screen: pygame.Surface) -> None:
+        """Immediate-mode draw of the toolbar, used to build the retained render"""
         # Draw background rectangle
         pygame.draw.rect(screen, self.bg_color, self.rect)
 
@@ -496,7 +640,8 @@ class Toolbar:
             for button in active.get('buttons', []):
                 if isinstance(button, InventorySlot):
                     # Pass inventory from parent scene
-                    button.draw(screen, self.parent_scene.inventory)
+                    if not self._is_dragged(button):
+                        button.draw(screen, self.parent_scene.inventory)
                 else:
                     button.draw(screen)
 
@@ -504,17 +649,20 @@ class Toolbar:
             for element in active.get('elements', []):
                 if hasattr(element, "draw"):
                     if isinstance(element, InventorySlot):
-                        element.draw(screen, self.parent_scene.inventory)
+                        if not self._is_dragged(element):
+                            element.draw(screen, self.parent_scene.inventory)
                     else:
                         element.draw(screen)
 
             return
 
         # Draw inventory slots or other UI elements
-        for element in self.Text:
+        for element in self.text:
             if hasattr(element, "draw"):
                 if isinstance(element, InventorySlot):
-                    element.draw(screen, self.parent_scene.inventory)
+                    if not self._is_dragged(element):
+                        element.draw(screen, self.parent_scene.inventory)
                 else:
                     element.draw(screen)
             else:
+                continue
@@ -4,14 +4,22 @@
 
 # Imports
 import os
+import time
 import pygame
 from random import randint, choice
 from persistence import Persistence
-from classes import PetAction, Creature, Food, Potion, Cleanse, GlobalSatisfactionBar, Less_Decay, More_Satisfaction, Inventory, Money  # type: ignore
+from classes import SIM_DT, SIM_HZ, PetAction, Creature, CreaturePool, CreatureGroup, Food, Potion, Cleanse, GlobalSatisfactionBar, Less_Decay, More_Satisfaction, Inventory, Money  # type: ignore
 from game_manager import  Button, InputField, InventorySlot, Toolbar, Text, InfoBox
 from logger import log
+from non_essential import format_duration
+from assets import load_image, scaled_image, get_font, render_text
+from audio import music, play_music, GAME_MUSIC, HOME_MUSIC
+from autosave import AutoSaver, WorldSnapshot
 from minigames import FlappyBird
+from renderer import DirtyRenderer, ModalLayer
 from collections import defaultdict
+from typing import Any
+from collections.abc import Callable
 
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -35,14 +43,55 @@ WORLD_TOP = 0 + PADDING
 WORLD_RIGHT = 800 - PADDING
 WORLD_BOTTOM = 600 - PADDING
 
+AWAY_SUMMARY_MIN_SECONDS = 60   # shorter offline gaps are caught up silently
 
-class GameScene:
+
+class Scene:
+    """
+    What main.py drives every frame: events, fixed-step updates and draws.
+    draw() returns the rects it repainted, or None when the whole screen
+    should be flipped. The cursor logic also reads `selected` and
+    `cursor_mode`.
+    """
+    selected : Any = None
+    cursor_mode = "Default"
+
+    def handle_event(self, event : pygame.event.Event):
+        pass
+
+    def update(self, dt : float = SIM_DT):
+        pass
+
+    def draw(self, screen : pygame.Surface, alpha : float = 1.0) -> list[pygame.Rect] | None:
+        return None
+
+    def is_animating(self) -> bool:
+        """False lets the main loop idle, see pacing.FramePacer"""
+        return True
+
+    def invalidate(self, rect : pygame.Rect | None = None):
+        pass
+
+    def resume(self):
+        """Called when the scene becomes current again after being suspended under another"""
+        self.invalidate()
+
+    def close(self):
+        """Called when the scene is left for good"""
+        pass
+
+    def get_all_active_buttons(self) -> list[Button]:
+        return []
+
+
+class GameScene(Scene):
     def __init__(self, world_name: str, creatures : list[str] = [],
                   foods : defaultdict[str, int] | None = None, potions : defaultdict[str, int] | None = None,
-                  cleanse : defaultdict[str, int] | None = None, money : int  = 0, on_start_flappy=None):
-        pygame.mixer.music.load("assets/Music/Gamescene_music.mp3")
-        pygame.mixer.music.set_volume(0.5)  # 0.0 to 1.0
-        pygame.mixer.music.play(-1)  
+                  cleanse : defaultdict[str, int] | None = None, money : int  = 0, on_start_flappy=None,
+                  audio : bool = True, autosave_interval : float = 0, clock : float = 0.0):
+        self.audio = audio
+        if audio:
+            play_music(GAME_MUSIC, volume = 0.5)  # 0.0 to 1.0
 
         # Initial Game Constants
         self.world_name = world_name
@@ -59,6 +108,7 @@ class GameScene:
         self.game_continue = True
         self.is_dragging = False # -> IFKYK
         self.showing_info = False
+        self.away_summary : str | None = None   # "while you were away" text, shown until dismissed
         self.drag_starts_pos = None
         self.on_start_flappy = on_start_flappy
 
@@ -67,24 +117,26 @@ class GameScene:
         if potions: self.inventory.potions = potions
         if cleanse: self.inventory.cleanse = cleanse
 
-        self.background = pygame.image.load(os.path.join(ASSETS, "Background/main_world.png"))
-        self.background = pygame.transform.scale(self.background, (800, 600))
-
-        self.icon_grapes = pygame.image.load("assets/Items/grapes.png").convert_alpha()
-        self.icon_cassis = pygame.image.load("assets/Items/cassis.png").convert_alpha()
-        self.icon_cherry = pygame.image.load("assets/Items/cherry.png").convert_alpha()
-        self.icon_aisu = pygame.image.load("assets/Items/aisu.png").convert_alpha()
-        self.icon_makku = pygame.image.load("assets/Items/makku.png").convert_alpha()
-        self.icon_spam = pygame.image.load("assets/Items/spamcan.png").convert_alpha()
-        self.icon_cleanse = pygame.image.load("assets/Items/Cleanse.png").convert_alpha()
-        self.icon_less_decay = pygame.image.load("assets/Items/Lessdecay.png").convert_alpha()
-        self.icon_more_satsifaction = pygame.image.load("assets/Items/MoreSatisfaction.png").convert_alpha()
-
-        # Creatures
+        self.background = load_image(os.path.join(ASSETS, "Background/main_world.png"), (800, 600), alpha = False)
+
+        self.icon_grapes = load_image("assets/Items/grapes.png")
+        self.icon_cassis = load_image("assets/Items/cassis.png")
+        self.icon_cherry = load_image("assets/Items/cherry.png")
+        self.icon_aisu = load_image("assets/Items/aisu.png")
+        self.icon_makku = load_image("assets/Items/makku.png")
+        self.icon_spam = load_image("assets/Items/spamcan.png")
+        self.icon_cleanse = load_image("assets/Items/Cleanse.png")
+        self.icon_less_decay = load_image("assets/Items/Lessdecay.png")
+        self.icon_more_satsifaction = load_image("assets/Items/MoreSatisfaction.png")
+
+        # Creatures (numeric state is stored in the pool, see CreaturePool)
+        self.pool = CreaturePool()
+        self.pool.tick = round(clock * SIM_HZ)     # a saved world resumes on its own clock
+        self.creatures : list[Creature] = self.pool.creatures
         if creatures:
-            self.creatures = creatures
+            for creature in creatures:
+                self.pool.attach(creature)
         else:
-            self.creatures : list[Creature] = []
             names = []
             for i in range(randint(2,4)):
                 self_sprite = choice(spritz)
@@ -95,14 +147,16 @@ class GameScene:
                     name = choice(("Patch", "Nikita", "Butter", "Dino", "Bug", "Mister",
                                 "Frankie", "Beans", "Chessie", "Pearl", "Panda",
                                 "Maya", "Abby", "Bacchus", "Rosebud", "Maximus"))
-                c = Creature(
+                Creature(     # registers itself with the pool
                     name,
                     "quacker" if self_sprite == spritz[1] else "mimi-carrier",
                     randint(10, 500), randint(10, 500),
-                    self_sprite
+                    self_sprite,
+                    pool = self.pool
                     )
-                
-                self.creatures.append(c)
+
+        # Saves are written on a worker thread; autosave_interval <= 0 only saves on request
+        self.autosave = AutoSaver(self.world_name, self.snapshot, autosave_interval)
 
         self.selected: Creature | None = None
         self.about_selected_creature : str | None = None
@@ -114,7 +168,7 @@ class GameScene:
         self.game_over_buttons : list[Button] = []
 
         # Build a tabbed toolbar with tabs
-        toolbar_font = pygame.font.Font(None, 30)
+        toolbar_font = get_font(None, 30)
 
         # Place tab content slightly below the header area so headers don't overlap
         tab_content_y = 540
@@ -133,13 +187,13 @@ class GameScene:
         ]
 
         Inv_Action_Buttons = [
-            # Button(20, tab_content_y, 120, 40, pygame.font.Font(None, 20), "Refill All", "#dda658", "#eec584", "#ffffff", on_click=lambda: self.run_admin_command("refill")),
+            # Button(20, tab_content_y, 120, 40, get_font(None, 20), "Refill All", "#dda658", "#eec584", "#ffffff", on_click=lambda: self.run_admin_command("refill")),
         ]
 
 
         mini_game_Buttons = [
-            Button(20, tab_content_y, 100, 40, pygame.font.Font(None, 25), "Plappy Birb", "#dda658", "#eec584", "##ffffff",
-                    on_click=lambda: (self.save_game_state(),self.on_start_flappy())),
+            Button(20, tab_content_y, 100, 40, get_font(None, 25), "Plappy Birb", "#dda658", "#eec584", "##ffffff",
+                    on_click=lambda: self.on_start_flappy()),
         ]
 
         self.market_items : list[dict[str, str | int | pygame.Surface]] = [
@@ -172,7 +226,7 @@ class GameScene:
         Inventory_slots = [sloti ,slot0 ,slot1, slot2, slot3, slot4, slot5, slot6, slot7]
         self.inventory_slots_list = Inventory_slots
         
-        self.infobox = InfoBox(670, tab_content_y, 120, 40, pygame.font.Font(None, 20), "", "#dda658", "#ffffff")
+        self.infobox = InfoBox(670, tab_content_y, 120, 40, get_font(None, 20), "", "#dda658", "#ffffff")
 
         self.toolbar = Toolbar(
             x=0,
@@ -188,21 +242,31 @@ class GameScene:
 
         )
         self.toolbar.parent_scene = self #type: ignore
+        self.inventory.listeners.append(self.toolbar.invalidate)
         
 
-        pause_font = pygame.font.Font(None, 32)
+        pause_font = get_font(None, 32)
 
         self.info_back_btn = Button(
             600, 380, 120, 40,
-            pygame.font.Font(None, 28),
+            get_font(None, 28),
             "Back",
             "#dda658", "#eec584", "#ffffff",
             on_click=lambda: self.close_info()
         )
 
+        self.away_box = InfoBox(80, 80, 640, 340, get_font(None, 28), "", "#dda658", "#ffffff")
+        self.away_close_btn = Button(
+            600, 380, 120, 40,
+            get_font(None, 28),
+            "Continue",
+            "#dda658", "#eec584", "#ffffff",
+            on_click=self.close_away_summary
+        )
+
         self.hamburger_btn = Button(
             10, 10, 40, 40,
-            pygame.font.Font(None, 30),
+            get_font(None, 30),
             "≡",
             "#dda658", "#eec584", "#ffffff",
             on_click=self.toggle_pause            
@@ -210,7 +274,7 @@ class GameScene:
 
         self.toggle_toolbar_btn = Button(
             10, 480 if self.toolbar.visible else 600, 40, 40,
-            pygame.font.Font(None, 30),
+            get_font(None, 30),
             "^",
             "#dda658", "#eec584", "#ffffff",
             on_click=self.toggle_toolbar
@@ -240,7 +304,7 @@ class GameScene:
         # Admin input field -> to be shipped in the final game but NOT documented (cheat code kumbaga)
         self.master_buttons: list[Button] = []
         self.master_visible = False      
-        self.admin_field = InputField(300, 200, 200, 60, pygame.font.Font(None, 20))
+        self.admin_field = InputField(300, 200, 200, 60, get_font(None, 20))
         self.inputs.append(self.admin_field)
 
         self.admin_mode = False
@@ -248,7 +312,7 @@ class GameScene:
 
         spawn_btn_m = Button(
             20, 80, 120, 40,
-            pygame.font.Font(None, 20),
+            get_font(None, 20),
             "Master Spawn",
             "#dda658", "#eec584", "#ffffff",
             on_click=lambda: self.run_admin_command("spawn")
@@ -256,7 +320,7 @@ class GameScene:
 
         reset_btn_m = Button(
             20, 130, 120, 40,
-            pygame.font.Font(None, 20),
+            get_font(None, 20),
             "Reset All",
             "#dda658", "#eec584", "#ffffff",
             on_click=lambda: self.run_admin_command("reset")
@@ -264,7 +328,7 @@ class GameScene:
 
         refill_btn_m = Button(
             20, 180, 120, 40,
-            pygame.font.Font(None, 20),
+            get_font(None, 20),
             
             "Refill All",
             "#dda658", "#eec584", "#ffffff",
@@ -273,7 +337,7 @@ class GameScene:
 
         hide_btn_m = Button(
             20, 230, 120, 40,
-            pygame.font.Font(None, 20),
+            get_font(None, 20),
             "Hide Panel",
             "#dda658", "#eec584", "#ffffff",
             on_click=lambda: self.toggle_master(False)
@@ -281,6 +345,89 @@ class GameScene:
 
         self.master_buttons.extend([spawn_btn_m, reset_btn_m, refill_btn_m, hide_btn_m])
 
+        # Dirty-rect bookkeeping, see draw()
+        self.renderer = DirtyRenderer((800, 600))
+        self.modals = ModalLayer()
+        self.creature_sprites = CreatureGroup()
+
+    @classmethod
+    def from_save(cls, data : dict[str, Any], **kwargs : Any) -> "GameScene":
+        """Build a scene from a save slot dict (see Persistence.load_slot)"""
+        creatures = [Persistence.unpack_creatures(c) for c in data["creatures"]]
+        inv = data.get("inventory", {})
+        scene = cls(
+            data["world_name"],
+            creatures,
+            foods=inv.get("foods", {}),
+            potions=inv.get("potions", {}),
+            cleanse=inv.get("cleanse", {}),
+            money=data.get("money", 0),
+            clock=data.get("clock", 0.0),
+            **kwargs
+        )
+        # Same anchors as on disk, otherwise the next save would journal every creature
+        for creature, saved in zip(scene.creatures, data["creatures"]):
+            anchor = saved.get("anchor")
+            if anchor:
+                scene.pool.restore_anchor(creature.index, anchor["level"], round(anchor["seconds"] * SIM_HZ), anchor["decay"])
+        scene.autosave.mark_saved(scene.snapshot())     # the world as it is on disk
+        return scene
+
+    def catch_up(self, seconds : float) -> dict[str, Any]:
+        """
+        Fast-forward the world by `seconds` of offline time.
+
+        Decay is closed-form and effect expiries/depletions are events on the
+        pool's heap, so this only fires the events that fall inside the gap
+        instead of simulating every tick. Collisions are not simulated.
+        """
+        ticks = int(seconds * SIM_HZ)
+        summary : dict[str, Any] = {"seconds": seconds, "depleted": [], "effects_expired": 0,
+                                    "average_before": 0.0, "average_after": 0.0}
+        if ticks <= 0 or not self.creatures:
+            return summary
+
+        start = time.perf_counter()
+        n = self.pool.size
+        was_depleted = self.pool.stage[:n] == 3
+        effects_before = sum(len(c.effects) for c in self.creatures)
+        summary["average_before"] = float(self.pool.levels().mean())
+
+        self.pool.advance_clock(ticks, batch = True)
+
+        now_depleted = (self.pool.stage[:n] == 3) & ~was_depleted
+        summary["depleted"] = [self.creatures[i].name for i in now_depleted.nonzero()[0].tolist()]
+        summary["effects_expired"] = effects_before - sum(len(c.effects) for c in self.creatures)
+        summary["average_after"] = float(self.pool.levels().mean())
+
+        log(2, f"Offline catch-up of {format_duration(seconds)} for {n} creatures took "
+               f"{(time.perf_counter() - start) * 1000:.1f}ms")
+
+        if seconds >= AWAY_SUMMARY_MIN_SECONDS:
+            self.show_away_summary(summary)
+        return summary
+
+    def show_away_summary(self, summary : dict[str, Any]):
+        depleted : list[str] = summary["depleted"]
+        if not depleted:
+            depleted_text = "Nobody ran out of satisfaction."
+        elif len(depleted) <= 5:
+            depleted_text = f"Ran out of satisfaction: {', '.join(depleted)}"
+        else:
+            depleted_text = f"{len(depleted)} creatures ran out of satisfaction."
+
+        self.away_summary = (
+            f"While you were away ({format_duration(summary['seconds'])})\n"
+            f"\n"
+            f"Average satisfaction: {summary['average_before']:.1f} -> {summary['average_after']:.1f}\n"
+            f"{depleted_text}\n"
+            f"Effects that wore off: {summary['effects_expired']}"
+        )
+        self.away_box.text = self.away_summary
+
+    def close_away_summary(self):
+        self.away_summary = None
+
     def passed(self):
         self.showing_info = not self.showing_info
         log(2, f"Player toggled creature info showing to {self.showing_info}")
@@ -309,12 +456,12 @@ class GameScene:
                 return
             
             if used_item_name == "Less Decay":
-                eff = Less_Decay(multiplier = 2, duration = 20)
+                eff = Less_Decay(multiplier = 2, duration = 20)    # seconds
                 eff.consume(target, target.satisfaction_multiplier, eff.duration)
                 return
 
             if used_item_name == "More Satisfaction":
-                eff = More_Satisfaction(multiplier = 2, duration = 20)
+                eff = More_Satisfaction(multiplier = 2, duration = 20)    # seconds
                 eff.consume(target, target.satisfaction_multiplier, eff.duration)
                 return
 
@@ -343,7 +490,7 @@ class GameScene:
             btn_x = base_x + col * col_spacing
             btn_y = base_y + row * row_spacing + 30
             buy_btn = Button(btn_x, btn_y, 120, 40, 
-                        pygame.font.Font(None, 20),
+                        get_font(None, 20),
                         f"Buy ({item["price"]})", 
                         "#dda658", "#eec584", "#ffffff",
                         on_click=lambda i = item: self.buy_item(i)
@@ -352,7 +499,7 @@ class GameScene:
         
         close_btn = Button(
             350, 500, 120, 40,
-            pygame.font.Font(None, 20),
+            get_font(None, 20),
             "Close",
             "#dda658", "#eec584", "#ffffff",
             on_click=self.close_market
@@ -397,6 +544,9 @@ class GameScene:
         if self.showing_info:
             buttons.append(self.info_back_btn)
 
+        if self.away_summary:
+            buttons.append(self.away_close_btn)
+
         # Pause menu buttons
         if self.is_paused:
             buttons.extend(self.pause_menu_buttons)
@@ -430,20 +580,20 @@ class GameScene:
     def toggle_toolbar(self):
         self.toolbar.visible = not self.toolbar.visible
 
-    def save_game_state(self, world_name = None, money = None):
-        world_name = self.world_name if not world_name else world_name
-        money = self.money.money if not money else money
-        Persistence.save_to_slot(self.world_name,
-                                sum(c.satisfaction_level for c in self.creatures),
-                                    self.creatures,
-                                    self.inventory.foods,
-                                    self.inventory.potions,
-                                    self.inventory.cleanse,
-                                    money)
+    def save_game_state(self):
+        """Queue a save on the autosave worker, only the snapshot is taken on this thread"""
+        self.autosave.save_now()
+
+    def snapshot(self) -> WorldSnapshot:
+        return WorldSnapshot.capture(self.world_name, self.pool, self.inventory, self.money.money)
+
+    def close(self):
+        """Let a save in flight finish before the world is dropped"""
+        self.autosave.close()
 
     def load_game_state(self):
-        pygame.mixer.music.load("assets/Music/HomeScene_music.mp3")
-        pygame.mixer.music.play(-1)
+        play_music(HOME_MUSIC)
+        self.close()
         import main
         main.creatureslist = None
         main.current_scene = None
@@ -451,8 +601,8 @@ class GameScene:
         
 
     def quit_to_main_menu(self):
-        pygame.mixer.music.load("assets/Music/HomeScene_music.mp3")
-        pygame.mixer.music.play(-1)
+        play_music(HOME_MUSIC)
+        self.close()
         import main
         main.current_scene = None
         log(2, "Returned to main menu from pause")
@@ -468,10 +618,10 @@ class GameScene:
             "admin_spawned_creature",
             randint(50, 750),  
             randint(50, 550),  
-            choice(spritz)
+            choice(spritz),
+            pool = self.pool
         )
-        self.creatures.append(new)
-        log(3, "Spawned creature")
+        log(3, f"Spawned creature {new.name}")
 
     def run_admin_command(self, cmd: str):
         cmd = cmd.strip().lower()
@@ -482,13 +632,13 @@ class GameScene:
             return
 
         if cmd == "reset":
-            self.creatures.clear()
+            self.pool.clear()
+            self.selected = None
             log(3, "Despawned all creatures via admin")
             return
 
         if cmd == "refill":
-            for c in self.creatures:
-                c.satisfaction_level = 100
+            self.pool.set_satisfaction(100)
             log(3, "Refilled all creature satisfaction level via admin")
             return
 
@@ -502,6 +652,12 @@ class GameScene:
         log(3, f"Unknown command '{cmd}'")
 
     def handle_event(self, event: pygame.event.Event):
+        if self.away_summary:
+            if self.away_box.handle_event(event) is False:
+                self.close_away_summary()
+            self.away_close_btn.handle_event(event)
+            return
+
         if self.showing_info:
             if self.infobox.handle_event(event) is False:
                 self.showing_info = False
@@ -521,6 +677,7 @@ class GameScene:
 
                     slot.dragging = False
                     slot.drag_pos = None
+                    self.toolbar.invalidate()
                     return  # ✅ STOP HERE so toolbar never sees this event
 
         # ✅ THEN: let toolbar handle the event
@@ -576,12 +733,15 @@ class GameScene:
                     self.about_selected_creature = self.selected.type
                     if hasattr(self, "selected_info_btn") and self.selected_info_btn:
                         self.selected_info_btn.text = f"{creature.name} ({(str(creature.satisfaction_level)[:5])})"
+                        self.toolbar.invalidate()
+                    effects_text = ", ".join(f"{e.name} ({e.duration:.0f}s)" for e in creature.effects) or "None"
                     self.infobox.text = (
                             f"Name: {creature.name}\n"
                             f"Type: {creature.type}\n"
                             f"Satisfaction: {creature.satisfaction_level:.1f}\n"
-                            f"Decay: {creature.satisfaction_decay:.3f}\n"
+                            f"Decay: {creature.satisfaction_decay:.3f}/s\n"
                             f"Multiplier: {creature.satisfaction_multiplier}\n"
+                            f"Effects: {effects_text}\n"
 
                             f"""
                             A lively, duck like creature bursting with playful energy 
@@ -598,8 +758,9 @@ class GameScene:
                             f"Name: {creature.name}\n"
                             f"Type: {creature.type}\n"
                             f"Satisfaction: {creature.satisfaction_level:.1f}\n"
-                            f"Decay: {creature.satisfaction_decay:.3f}\n"
+                            f"Decay: {creature.satisfaction_decay:.3f}/s\n"
                             f"Multiplier: {creature.satisfaction_multiplier}\n"
+                            f"Effects: {effects_text}\n"
                             f"""
                             A gentle, softspoken creature known for its calm 
                             temperament and nurturing instincts. Mimi carriers 
@@ -638,6 +799,7 @@ class GameScene:
             log(2, f"Player has removed creature selection")
             if hasattr(self, "selected_info_btn"):
                 self.selected_info_btn.text = "No Selection"
+                self.toolbar.invalidate()
 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             self.is_dragging = False
@@ -646,43 +808,160 @@ class GameScene:
         elif event.type == pygame.MOUSEMOTION and self.is_dragging and self.selected:
             if self.allow_dragging:
                 # move the selected creature while dragging
-                self.selected.rect.x = event.pos[0] + self.drag_offset[0]
-                self.selected.rect.y = event.pos[1] + self.drag_offset[1]
-                self.selected.x, self.selected.y = self.selected.rect.center
-
-    def update(self):
+                self.selected.move_topleft(
+                    event.pos[0] + self.drag_offset[0],
+                    event.pos[1] + self.drag_offset[1]
+                )
+
+    def update(self, dt : float = SIM_DT):
+        """Advance the world by one fixed simulation step of dt seconds"""
+        self.autosave.poll()
         mx, my = pygame.mouse.get_pos()
-        if self.is_paused:
+        if self.is_paused or self.away_summary:
             return #temporarily disables updates when game state is paused
 
-        for i, creature in enumerate(self.creatures):
-            for j in range(i +1, len(self.creatures)):
-                creature.resolve_soft_collisions(self.creatures[j])
-
-        for creature in self.creatures:
-            creature.rect.x = max(WORLD_LEFT, min(creature.rect.x, WORLD_RIGHT - creature.rect.width))
-            creature.rect.y = max(WORLD_TOP, min(creature.rect.y, WORLD_BOTTOM - creature.rect.height))
-            creature.update_effects()
-            creature.update_hover((mx, my))
-            creature.satisfaction_level = max(
-                0,
-                creature.satisfaction_level - creature.satisfaction_decay
-            )
-            creature.x, creature.y = creature.rect.center
-
-        if self.creatures and all(c.satisfaction_level <= 0 for c in self.creatures):
+        self.pool.store_previous()
+        self.pool.resolve_soft_collisions(dt)
+
+        # Batched over the whole pool. Satisfaction is evaluated lazily, so the
+        # clock only fires effect expiries and sprite/depletion events that are due.
+        self.pool.clamp(WORLD_LEFT, WORLD_TOP, WORLD_RIGHT, WORLD_BOTTOM)
+        self.pool.advance_clock()
+        self.pool.update_hover((mx, my))
+
+        if self.pool.all_depleted():
             if self.game_continue:
                 self.game_continue = False
                 log(1, "All creatures reached 0 satisfaction. Game over.")
-                try:
-                    pygame.mixer.music.stop()
-                except Exception:
-                    pass
+                music.stop()
+
+
+    def resume(self):
+        """Back from a minigame: the world was kept in memory, only music and the screen need restoring"""
+        if self.audio:
+            play_music(GAME_MUSIC, volume = 0.5)
+        self.invalidate()
+
+    def is_animating(self) -> bool:
+        """False while the world is frozen (pause, away summary, game over), lets the main loop idle"""
+        return not (self.is_paused or self.away_summary or not self.game_continue)
+
+    def invalidate(self, rect : pygame.Rect | None = None):
+        """Force rect (or the whole screen) to be repainted by the next draw()"""
+        self.renderer.invalidate(rect)
+
+    def _track_regions(self, alpha : float):
+        """Report what every drawable would paint this frame to the renderer"""
+        track = self.renderer.track
+
+        # Opening or closing any modal repaints the whole screen
+        layers = self._active_modals()
+        track("modal", tuple(layers), self.renderer.screen_rect)
+
+        widgets : list[Any] = []
+        if layers:
+            # The world under a modal is a frozen snapshot (see ModalLayer), only modal widgets can change
+            modal_widgets : dict[str, list[Any]] = {
+                "info": [self.infobox, self.info_back_btn],
+                "away": [self.away_box, self.away_close_btn],
+                "market": self.market_buttons,
+                "paused": self.pause_menu_buttons,
+                "game_over": self.game_over_buttons,
+            }
+            for layer in layers:
+                widgets.extend(modal_widgets[layer])
+        else:
+            track("global_bar", *self.global_bar.draw_state(self.pool))
+            track("money", *self.money.draw_state())
+            track(id(self.hamburger_btn), *self.hamburger_btn.draw_state())
+            track(id(self.toggle_toolbar_btn), *self.toggle_toolbar_btn.draw_state())
+            for key, state, rect in self.toolbar.draw_regions():
+                track(key, state, rect)
+
+            changed = self._sync_creatures(alpha)
+            if changed is None:
+                self.renderer.invalidate()
+            else:
+                for rect in changed:
+                    self.renderer.invalidate(rect)
+
+            if self.master_visible:
+                widgets.extend(self.master_buttons)
+            if self.admin_mode:
+                widgets.extend(self.inputs)
+
+        for widget in widgets:
+            track(id(widget), *widget.draw_state())
+
+    def _sync_creatures(self, alpha : float) -> list[pygame.Rect] | None:
+        """Update the creature sprites from the pool, returns the rects that changed (None: too many)"""
+        selected = self.selected.index if self.selected is not None and self.selected.pool is self.pool else -1
+        bar = self.creatures[0].satisfaction_bar if self.creatures else self.global_bar
+        bounds, state = self.pool.draw_bounds(alpha, bar, selected)
+        return self.creature_sprites.sync(self.creatures, bounds, state, selected)
+
+    def draw(self, screen: pygame.Surface, alpha : float = 1.0) -> list[pygame.Rect] | None:
+        """
+        alpha - fraction of a simulation step elapsed since the last update, for interpolation
+
+        Only the regions whose contents changed are repainted, each clipped and
+        drawn back to front over the background. Returns the repainted rects
+        for pygame.display.update(), or None after a full redraw (flip).
+        """
+        self._track_regions(alpha)
+        dirty = self.renderer.collect()
+        if dirty is None:
+            self._draw_scene(screen, alpha)
+            return None
+
+        for rect in dirty:
+            screen.set_clip(rect)
+            self._draw_scene(screen, alpha, rect)
+        screen.set_clip(None)
+        return dirty
+
+    def _active_modals(self) -> list[str]:
+        """Open modal screens, bottom to top"""
+        layers : list[str] = []
+        if self.showing_info:
+            layers.append("info")
+        if self.away_summary:
+            layers.append("away")
+        if self.is_market_open:
+            layers.append("market")
+        if self.is_paused:
+            layers.append("paused")
+        if not self.game_continue:
+            layers.append("game_over")
+        return layers
+
+    def _draw_scene(self, screen: pygame.Surface, alpha : float, area : pygame.Rect | None = None):
+        """Paint the scene; with an area, only creatures touching it are drawn"""
+        layers = self._active_modals()
+        if not layers:
+            self.modals.release()
+            self._draw_world(screen, alpha, area)
+            return
+
+        # The dimmed world under a modal is painted once and reused until the modals change
+        backdrop = self.modals.backdrop(
+            tuple(layers), screen.get_size(),
+            lambda surface: (self._sync_creatures(alpha), self._draw_world(surface, alpha), self._draw_modal(surface, layers[0], dim_only = True))
+        )
+        if area is None:
+            screen.blit(backdrop, (0, 0))
+        else:
+            screen.blit(backdrop, area, area)
 
+        for i, layer in enumerate(layers):
+            self._draw_modal(screen, layer, dim = i > 0)
 
-    def draw(self, screen: pygame.Surface):
-        screen.blit(self.background, (0, 0))
-        self.global_bar.draw(screen, self.creatures)
+    def _draw_world(self, screen: pygame.Surface, alpha : float, area : pygame.Rect | None = None):
+        if area is None:
+            screen.blit(self.background, (0, 0))
+        else:
+            screen.blit(self.background, area, area)
+        self.global_bar.draw(screen, self.pool)
         try:
             self.money.draw(screen)
         except Exception:
@@ -694,18 +973,9 @@ class GameScene:
         self.toolbar.draw(screen)
         self.toggle_toolbar_btn.draw(screen)
 
-        for creature in self.creatures:
-            if 100 >= creature.satisfaction_level > 70:
-                creature.update_sprite(0)
-            elif 70 >= creature.satisfaction_level > 30:
-                log(2, f"{creature.name}'s satisfaction level is below 70")
-                creature.update_sprite(1)
-            elif 30 >= creature.satisfaction_level > 0:
-                creature.update_sprite(2)
-                log(2, f"{creature.name}'s satisfaction level is below 30")
-            else:
-                creature.update_sprite(3)
-            creature.draw(screen, is_selected = (creature is self.selected))
+        # Sprite stages are switched by the pool's level events, not polled here;
+        # the composited sprites were brought up to date by _sync_creatures()
+        self.creature_sprites.draw_area(screen, area)
 
         if self.master_visible:
             for buttons in self.master_buttons:
@@ -715,30 +985,32 @@ class GameScene:
             for input_field in self.inputs:
                 input_field.draw(screen)
 
-        if self.showing_info:
-            overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
-                        
-            pygame.draw.rect(screen, (200, 171, 131), (50, 50, 700, 400), border_radius=12)
-            pygame.draw.rect(screen, (255, 255, 255), (50, 50, 700, 400), width=3, border_radius=12)
+    def _draw_modal(self, screen: pygame.Surface, layer : str, dim : bool = True, dim_only : bool = False):
+        """One modal screen: its translucent overlay (if dim), then its panel and widgets"""
+        if dim or dim_only:
+            color = (30, 0, 0, 150) if layer == "game_over" else (0, 0, 0, 150)
+            screen.blit(self.modals.overlay(screen.get_size(), color), (0, 0))
+        if dim_only:
+            return
+
+        if layer in ("info", "away", "market"):
+            panel = self.modals.panel((700, 400), (200, 171, 131), (255, 255, 255), border_width = 3, radius = 12)
+            screen.blit(panel, (50, 50))
 
+        if layer == "info":
             self.infobox.rect.topleft = (80, 80)
             self.infobox.rect.size = (640, 340)
             
             self.infobox.draw(screen)
             self.info_back_btn.draw(screen)
 
-        if self.is_market_open:
-            overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+        elif layer == "away":
+            self.away_box.draw(screen)
+            self.away_close_btn.draw(screen)
 
-            pygame.draw.rect(screen, (200, 171, 131), (50, 50, 700, 400), border_radius=12)
-            pygame.draw.rect(screen, (255, 255, 255), (50, 50, 700, 400), width=3, border_radius=12)
-
-            font = pygame.font.Font(None, 28)
-            title = font.render("Marketplace", True, (0, 0, 0))
+        elif layer == "market":
+            font = get_font(None, 28)
+            title = render_text(font, "Marketplace", (0, 0, 0))
             screen.blit(title, (310, 80))
 
             base_x = 100
@@ -755,68 +1027,57 @@ class GameScene:
 
                 # Draw icon
                 if item["icon"]:
-                    icon = pygame.transform.scale(item["icon"], (64, 64)) # type: ignore
+                    icon = scaled_image(item["icon"], (64, 64)) # type: ignore
                     screen.blit(icon, (x, y + 5))
 
                 # Draw name
-                name_text = font.render(item["name"], True, (0, 0, 0)) # type: ignore
+                name_text = render_text(font, item["name"], (0, 0, 0)) # type: ignore
                 screen.blit(name_text, (x + 80, y + 20))
 
-                for btn in self.market_buttons:
-                    btn.draw(screen)
-
-        if self.is_paused:
-            overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            for btn in self.market_buttons:
+                btn.draw(screen)
 
+        elif layer == "paused":
             for b in self.pause_menu_buttons:
                 b.draw(screen)
-        
-        if not self.game_continue:
-            overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-            overlay.fill((30, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
 
+        elif layer == "game_over":
             for b in self.game_over_buttons:
                 b.draw(screen)
 
-class FlappyBirdScene(GameScene):
-    def __init__(self, screen: pygame.Surface, slot, on_finish):
-        super().__init__(
-            world_name=slot,
-            on_start_flappy=None
-        )
-        self.screen = screen
-        self.flappy = FlappyBird(screen, width=screen.get_width(), height=screen.get_height())
-        self.running = True
-        self.slot = slot
+class MinigameScene(Scene):
+    """
+    Host for a minigame object (handle_event/update/draw, `finished` and
+    `score`). Unlike GameScene it builds no world, toolbar or menus, so
+    launching a minigame only costs the minigame itself; images come from
+    the asset cache the suspended world already filled.
+
+    When the game finishes the score is converted to money and passed to
+    on_finish(earned), which credits it to the suspended world.
+    """
+    def __init__(self, game : Any, on_finish : Callable[[int], Any]):
+        self.game = game
         self.on_finish = on_finish
+        self.score_label = Text(10, 10, 140, 36, get_font(None, 28), "Score: 0", "#000000", "#ffffff")
 
     def handle_event(self, event : pygame.event.Event):
-        self.flappy.handle_event(event)
+        self.game.handle_event(event)
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.flappy.finished = True
-
-    def update(self):
-        self.flappy.update()
-        if self.flappy.finished:
-            self.money.add_money(self.flappy.score)
-            total_money = Persistence.load_slot(f"{self.slot}")["money"] + self.money.money
-            Persistence.update_file(self.slot, {"money" : total_money})
-            self.on_finish()
-            return self.money
-
-    def draw(self, screen: pygame.Surface): 
-        if self.running:
-            self.flappy.draw(screen)
-
-            font = pygame.font.Font(None, 28)
-            score_text = f"Score: {int(getattr(self.flappy, 'score', 0))}"
-
-            score_label = None
-            from game_manager import Text
-            score_label = Text(10, 10, 140, 36, font, score_text, "#000000", "#ffffff")
-
-            if score_label:
-                score_label.draw(screen)
+            self.game.finished = True
+
+    def update(self, dt : float = SIM_DT):
+        self.game.update()
+        if self.game.finished:
+            self.on_finish(Money.reward(self.game.score))
+
+    def draw(self, screen : pygame.Surface, alpha : float = 1.0) -> list[pygame.Rect] | None:
+        self.game.draw(screen)
+        self.score_label.text = f"Score: {int(getattr(self.game, 'score', 0))}"
+        self.score_label.draw(screen)
+        return None
+
+
+class FlappyBirdScene(MinigameScene):
+    def __init__(self, screen : pygame.Surface, on_finish : Callable[[int], Any]):
+        super().__init__(FlappyBird(screen, width=screen.get_width(), height=screen.get_height()), on_finish)
+        self.flappy = self.game
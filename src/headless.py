@@ -0,0 +1,97 @@
+# ----------------------------------------------------------------
+# Headless, uncapped simulation runner for soak tests and balancing
+# Run from the project root, e.g.:
+#   python src/headless.py --slot dfg --ticks 36000
+#   python src/headless.py --seed 7 --creatures 2000 --ticks 600
+# ----------------------------------------------------------------
+
+import argparse
+import os
+import random
+import time
+
+# SDL has to pick its drivers before pygame initialises
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+from gameplay import GameScene
+from persistence import Persistence
+from logger import log
+from classes import SIM_DT
+
+
+def build_scene(slot : str | None = None, seed : int | None = None, creatures : int = 0,
+                catch_up : bool = False) -> GameScene:
+    """Build a GameScene from a save slot, or from a random seed when no slot is given"""
+    if seed is not None:
+        random.seed(seed)
+
+    if slot:
+        data = Persistence.load_slot(slot)
+        if data is None:
+            raise SystemExit(f"Could not load save slot '{slot}'")
+        scene = GameScene.from_save(data, audio = False)
+        if catch_up:
+            summary = scene.catch_up(Persistence.seconds_since_saved(data))
+            scene.close_away_summary()
+            print(f"Caught up {summary['seconds']:.0f}s offline: {len(summary['depleted'])} depleted, "
+                  f"{summary['effects_expired']} effects expired")
+    else:
+        scene = GameScene(f"headless-{seed}", audio = False)
+
+    for _ in range(creatures):
+        scene.debug_spawn()
+    return scene
+
+
+def run(scene : GameScene, ticks : int) -> float:
+    """Run `ticks` updates as fast as possible, returns elapsed seconds"""
+    start = time.perf_counter()
+    for _ in range(ticks):
+        scene.update()
+    return time.perf_counter() - start
+
+
+def report(scene : GameScene, ticks : int, elapsed : float, verbose : bool = False):
+    creatures = scene.creatures
+    alive = sum(1 for c in creatures if c.isalive)
+    average = sum(c.satisfaction_level for c in creatures) / len(creatures) if creatures else 0
+
+    print(f"World:        {scene.world_name}")
+    print(f"Ticks:        {ticks} in {elapsed:.3f}s ({ticks / elapsed if elapsed else float('inf'):.1f} ticks/s)")
+    print(f"Simulated:    {ticks * SIM_DT:.1f}s of game time")
+    print(f"Creatures:    {len(creatures)} ({alive} alive, {len(creatures) - alive} dead)")
+    print(f"Satisfaction: {average:.2f} average")
+    print(f"Money:        {scene.money.money}")
+    print(f"Game over:    {not scene.game_continue}")
+
+    if verbose or len(creatures) <= 20:
+        for c in creatures:
+            effects = ", ".join(f"{e.name} ({e.duration:.1f}s)" for e in c.effects) or "-"
+            print(f"  {c.name:<16} {c.type:<24} ({c.x:>4}, {c.y:>4})  sat {c.satisfaction_level:6.2f}  effects: {effects}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a Cozy Cove world without a display")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--slot", help="save slot in save_files/ to load")
+    source.add_argument("--seed", type=int, default=0, help="seed for a freshly generated world")
+    parser.add_argument("--creatures", type=int, default=0, help="extra creatures to spawn (admin spawn)")
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--catch-up", action="store_true", help="apply offline progression since the slot was saved")
+    parser.add_argument("--verbose", action="store_true", help="list every creature in the report")
+    args = parser.parse_args()
+
+    pygame.init()
+    log(2, f"Headless run started: slot={args.slot} seed={args.seed} ticks={args.ticks}")
+
+    scene = build_scene(args.slot, args.seed, args.creatures, args.catch_up)
+    elapsed = run(scene, args.ticks)
+    report(scene, args.ticks, elapsed, args.verbose)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,18 @@
 import pygame
 import os
+import time
 from datetime import datetime
 from typing import Any
 
 # local dependencies
-from game_manager import Menu, Button, InputField, Text, MenuManager, GameSetupMenu, BackgroundManager
-from gameplay import GameScene, FlappyBirdScene
+from game_manager import Menu, Button, InputField, Text, MenuManager, GameSetupMenu, BackgroundManager, CursorManager
+from gameplay import Scene, GameScene, FlappyBirdScene
 from logger import log, clear
 from persistence import Persistence
-from minigames import FlappyBird
+from classes import SIM_DT
+from assets import get_font, text_cache
+from pacing import FramePacer
+from audio import play_music, HOME_MUSIC
 # Path and Assets
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 ASSETS = os.path.join(BASE_DIR, "assets")
@@ -18,22 +22,34 @@ ASSETS = os.path.join(BASE_DIR, "assets")
 if __name__ == "__main__":
     pygame.init()
     pygame.mixer.init()
-    pygame.mixer.music.load("assets/Music/HomeScene_music.mp3")
-    pygame.mixer.music.play(-1)
+    play_music(HOME_MUSIC)
 
-clock = pygame.time.Clock()
 clear()
 
+# Frame pacing: the simulation always steps at SIM_DT, rendering runs up to FPS_CAP
+FPS_CAP = 60
+MAX_FRAME_TIME = 0.25   # seconds; longer hitches are dropped instead of fast-forwarded
+
+# Adaptive pacing: menus and pause screens idle at IDLE_FPS until the player acts.
+# Set COZY_ADAPTIVE_PACING=0 to always run at FPS_CAP.
+ADAPTIVE_PACING = os.environ.get("COZY_ADAPTIVE_PACING", "1") != "0"
+IDLE_FPS = 10
+pacer = FramePacer(FPS_CAP, IDLE_FPS, adaptive = ADAPTIVE_PACING)
+
+# Worlds are autosaved in the background every AUTOSAVE_SECONDS (0 turns it off).
+AUTOSAVE_SECONDS = float(os.environ.get("COZY_AUTOSAVE_SECONDS", "60"))
+
 # Managers
 menu_manager = MenuManager()
 bg_manager = BackgroundManager()
 
-font = pygame.font.Font(None, 40)
+font = get_font(None, 40)
 screen = pygame.display.set_mode((800,600))
 pygame.display.set_caption("Cozy Cove the App")
 
 # Gameplay Stuff
 current_scene = None
+scene_stack : list[Scene | None] = []   # scenes suspended under current_scene, e.g. the world during a minigame
 creatureslist : list[str]= []
 
 # Callbacks
@@ -53,16 +69,16 @@ def load_game():
     saved_games_btn = []
     texts = []
 
-    saved_files = Persistence.taken_name()
+    saved_files = Persistence.list_slots()
 
-    for idx, filename in enumerate(saved_files):
+    for idx, (filename, info) in enumerate(saved_files):
         btn = Button(
             300,
             120 + idx * 100,
             200,
             60,
             font,
-            Persistence.load_slot(filename).get("world_name", "Unknown World"),
+            info["world_name"],
             "c8ab83",
             "eec584",
             "ffffff",
@@ -92,8 +108,15 @@ def get_active_buttons():
     return active_buttons
 
 
+def close_scenes():
+    """Let every open scene finish up (e.g. a save in flight) before exiting"""
+    for scene in [current_scene, *scene_stack]:
+        if scene:
+            scene.close()
+
 def quit_game():
     log(2, "Game Exited")
+    close_scenes()
     pygame.quit()
     exit()
 
@@ -109,50 +132,34 @@ def start_game():
     global current_scene
     go_back() # so that when the player quits the gameplay, it returns to the main menu
 
-    pygame.mixer.music.load("assets/Music/GameScene_music.mp3")
-    pygame.mixer.music.play(-1)
-    current_scene = GameScene(world_name, on_start_flappy=lambda: start_flappy(world_name))
+    current_scene = GameScene(world_name, on_start_flappy=start_flappy, autosave_interval=AUTOSAVE_SECONDS)
     log(2, f"[Main] Scene switched to: {type(current_scene).__name__}")
     log(2, "Player Started New Game")
 
-def start_loaded_game(slot: str):
+def start_loaded_game(slot: str, catch_up: bool = True):
     global current_scene, creatureslist
     creatureslist = []
     log(2, f"Stated Loaded Game: {slot}")
 
     loaded_data = Persistence.load_slot(slot)
     go_back()
-    for c in loaded_data["creatures"]:
-        creature = Persistence.unpack_creatures(c)
-        creatureslist.append(creature)
-    inv = loaded_data.get("inventory", {})
-    foods = inv.get("foods", {})
-    potions = inv.get("potions", {})
-    cleanse = inv.get("cleanse", {})
-    money = loaded_data.get("money", 0)
-
-    pygame.mixer.music.load("assets/Music/GameScene_music.mp3")
-    pygame.mixer.music.play(-1)
-    current_scene = GameScene(
-        loaded_data["world_name"],
-        creatureslist,
-        foods=foods,
-        potions=potions,
-        cleanse=cleanse,
-        money=money, on_start_flappy=lambda: start_flappy(slot)
-    )
+
+    current_scene = GameScene.from_save(loaded_data, on_start_flappy=start_flappy, autosave_interval=AUTOSAVE_SECONDS)
+    creatureslist = current_scene.creatures
+    if catch_up:
+        current_scene.catch_up(Persistence.seconds_since_saved(loaded_data))
     log(3, f"[Main] Scene switched to: {type(current_scene).__name__}")
 
 
 def delete_loaded_game(slot : str):
     global saved_games_btn
-    os.remove(f"save_files/{slot}")
+    Persistence.delete_slot(slot)
     saved_games_btn[:] = []
 
-    for i, slot in enumerate(Persistence.taken_name()):
+    for i, (slot, info) in enumerate(Persistence.list_slots()):
         btn = Button(
             300, 100 + i * 100, 200, 60, font,
-            Persistence.load_slot(slot)["world_name"],
+            info["world_name"],
             "#dda658", "#eec584", "ffffff",
             on_click=lambda s=slot: select_loaded_game(s)
         )
@@ -165,9 +172,13 @@ def select_loaded_game(slot : str):
     saved_games_btn[:] = [btn for btn in saved_games_btn 
                         if btn.text not in ("Delete", "Continue")]
 
-    p = Persistence.load_slot(slot)["last_saved"].split()
-    text = Text(550, 100, 200, 60, pygame.font.Font(None, 30), f"{p[0]} {p[1]} {p[2]}", "#e8ab83", "#ffffff")
-    text2 = Text(550, 150, 200, 60, pygame.font.Font(None, 30), f"{p[3]} {p[4]}", "#e8ab83", "#ffffff")
+    info = Persistence.slot_info(slot)
+    if info is None:
+        log(1, f"Save slot {slot} could not be read")
+        return
+    p = info["last_saved"].split()
+    text = Text(550, 100, 200, 60, get_font(None, 30), f"{p[0]} {p[1]} {p[2]}", "#e8ab83", "#ffffff")
+    text2 = Text(550, 150, 200, 60, get_font(None, 30), f"{p[3]} {p[4]}", "#e8ab83", "#ffffff")
 
     delete_game_btn =  Button(550, 350, 200, 60, font, "Delete", "#dda658", "#eec584", "#ffffff", on_click = lambda : delete_loaded_game(slot))
 
@@ -187,16 +198,31 @@ def go_back():
     if menu_manager.current:
         menu_manager.current.activate()
 
-def start_flappy(slot : str):
-    global current_scene, flappystate
-    flappystate = True
-    current_scene = FlappyBirdScene(
-        screen, 
-        slot, 
-        on_finish=lambda: start_loaded_game(slot), 
-    )
+def push_scene(scene : Scene):
+    """Suspend the current scene in memory and switch to scene"""
+    global current_scene
+    scene_stack.append(current_scene)
+    current_scene = scene
     log(2, f"[Main] Scene switched to: {type(current_scene).__name__}")
 
+def pop_scene():
+    """Drop the current scene and resume the one suspended under it"""
+    global current_scene
+    current_scene = scene_stack.pop()
+    if current_scene:
+        current_scene.resume()
+    log(2, f"[Main] Scene resumed: {type(current_scene).__name__}")
+
+def start_flappy():
+    global flappystate
+    flappystate = True
+    push_scene(FlappyBirdScene(screen, on_finish = finish_flappy))
+
+def finish_flappy(earned : int):
+    pop_scene()
+    current_scene.money.money += earned
+    log(2, f"Minigame earned {earned} money")
+
 
 # Global Variables
 return_to : Menu | None = None
@@ -248,25 +274,36 @@ home_menu.activate()
 
 is_running = True
 
-cursor_default = pygame.image.load("assets/Cursors/dark/pointer.png").convert_alpha()
-cursor_point = pygame.image.load("assets/Cursors/dark/link.png").convert_alpha()
-cursor_hand = pygame.image.load("assets/Cursors/dark/grab.png").convert_alpha()
-cursor_hover = pygame.image.load("assets/Cursors/dark/grab_hover.png").convert_alpha()
+# Hardware cursors, hotspot at the image's top-left like the old software cursor
+cursor_manager = CursorManager({
+    "default": ("assets/Cursors/dark/pointer.png", (0, 0)),
+    "point": ("assets/Cursors/dark/link.png", (0, 0)),
+    "hand": ("assets/Cursors/dark/grab.png", (0, 0)),
+    "hover": ("assets/Cursors/dark/grab_hover.png", (0, 0)),
+})
 
-pygame.mouse.set_visible(False)
+accumulator = 0.0
+frame_time = 0.0
+show_debug_overlay = False
+debug_font = get_font(None, 20)
+DEBUG_OVERLAY_RECT = pygame.Rect(4, 4, 520, 16)
+debug_overlay_drawn = False
 
-flappy = FlappyBird(screen, width=800, height=600)
+# Dirty-rect state: the scene drawn last frame
+drawn_scene = None
 
 while is_running:
 
-    mx, my = pygame.mouse.get_pos()
-
     # -------------------------
     # EVENT HANDLING
     # -------------------------
-    for event in pygame.event.get():
+    events = pacer.events()
+    input_at = time.perf_counter()     # scene switches are timed from here to their first frame
+    for event in events:
         if event.type == pygame.QUIT:
             is_running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            show_debug_overlay = not show_debug_overlay
         else:
             if current_scene:
                 current_scene.handle_event(event)
@@ -274,31 +311,28 @@ while is_running:
                 menu_manager.handle_event(event)
 
     # -------------------------
-    # UPDATE
+    # UPDATE (fixed timestep)
     # -------------------------
+    alpha = 1.0
     if current_scene:
-        current_scene.update()
-    # -------------------------
-    # DRAW SCENE OR MENU
-    # -------------------------
-    screen.fill((0, 0, 0))
-
-    if current_scene:
-        current_scene.draw(screen)
+        accumulator += frame_time
+        while current_scene and accumulator >= SIM_DT:
+            current_scene.update(SIM_DT)
+            accumulator -= SIM_DT
+        alpha = accumulator / SIM_DT
     else:
-        menu_manager.draw(screen)
-
+        accumulator = 0.0
     # -------------------------
     # CURSOR LOGIC (PRIORITY STACK)
     # -------------------------
-    cursor_to_draw = cursor_default
+    cursor_state = "default"
 
     active_buttons = get_active_buttons()
 
     # 1. Button Hover → pointer cursor
     for btn in active_buttons:
         if btn.hovered:
-            cursor_to_draw = cursor_point
+            cursor_state = "point"
             break
 
     else:
@@ -307,24 +341,62 @@ while is_running:
 
             # If something is selected → hand cursor
             if current_scene.selected:
-                cursor_to_draw = cursor_hand
+                cursor_state = "hand"
 
             else:
                 # Petting mode → creature hover logic
                 if current_scene.cursor_mode == "Petting":
                     for creature in current_scene.creatures:
                         if creature.hovered:
-                            cursor_to_draw = cursor_hover
+                            cursor_state = "hover"
                             break
                     else:
-                        cursor_to_draw = cursor_default
+                        cursor_state = "default"
                 else:
-                    cursor_to_draw = cursor_default
+                    cursor_state = "default"
 
-    # Draw cursor
-    screen.blit(cursor_to_draw, (mx, my))   
+    cursor_manager.set(cursor_state)
 
-    pygame.display.flip()
-    clock.tick(60)
+    # -------------------------
+    # DRAW SCENE OR MENU
+    # -------------------------
+    # Scenes return the rects they repainted, None means the whole screen changed
+    dirty = None
+    switched_scene = current_scene is not drawn_scene
+    if current_scene:
+        if switched_scene:
+            current_scene.invalidate()
+        # The debug overlay is painted over the scene, repaint under it while it shows
+        if show_debug_overlay or debug_overlay_drawn:
+            current_scene.invalidate(DEBUG_OVERLAY_RECT)
 
+        dirty = current_scene.draw(screen, alpha)
+    else:
+        screen.fill((0, 0, 0))
+        menu_manager.draw(screen)
+    drawn_scene = current_scene
+
+    if dirty is None or dirty:
+        # F3 debug overlay: frame pacing and the text cache counters of the previous frame
+        debug_overlay_drawn = show_debug_overlay
+        if show_debug_overlay:
+            overlay = debug_font.render(
+                f"{pacer.readout()} | text cache: {text_cache.last_hits} hits / {text_cache.last_misses} misses",
+                True, (255, 255, 255), (0, 0, 0))
+            screen.set_clip(DEBUG_OVERLAY_RECT)
+            screen.blit(overlay, DEBUG_OVERLAY_RECT)
+            screen.set_clip(None)
+
+    if dirty is None:
+        pygame.display.flip()
+    elif dirty:
+        pygame.display.update(dirty)
+    if switched_scene and current_scene:
+        log(2, f"[Main] First {type(current_scene).__name__} frame shown "
+               f"{(time.perf_counter() - input_at) * 1000:.1f}ms after the input that opened it")
+    text_cache.end_frame()
+    animating = bool(current_scene and current_scene.is_animating())
+    frame_time = min(pacer.tick(animating), MAX_FRAME_TIME)
+
+close_scenes()
 pygame.quit()
\ No newline at end of file
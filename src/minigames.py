@@ -1,7 +1,10 @@
 import pygame, random, time
 from pygame.locals import *
+from assets import assets, load_image
+from audio import sounds, play_sound
 
 # reference: minigames/flappybird.py
+# Physics constants are per simulation step; the main loop steps scenes at a fixed SIM_HZ
 
 SPEED = 5
 GRAVITY = 0.4
@@ -17,10 +20,10 @@ class Bird(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
 
-        self.image = pygame.image.load('assets/flappybird/assets/sprites/redbird-midflap.png').convert_alpha()
+        self.image = load_image('assets/flappybird/assets/sprites/redbird-midflap.png')
 
         self.speed = SPEED
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = assets.mask(self.image)
 
         self.rect = self.image.get_rect()
         self.rect.x = 800 / 6
@@ -34,25 +37,28 @@ class Bird(pygame.sprite.Sprite):
         self.speed = -SPEED
 
 class Pipe(pygame.sprite.Sprite):
+    """Image and mask are shared through the asset cache; reset() recycles the sprite"""
     def __init__(self, inverted, xpos, ysize):
         super().__init__()
 
-        img = pygame.image.load('assets/flappybird/assets/sprites/pipe-red.png').convert_alpha()
-        img = pygame.transform.scale(img, (PIPE_WIDHT, PIPE_HEIGHT))
+        img = load_image('assets/flappybird/assets/sprites/pipe-red.png', (PIPE_WIDHT, PIPE_HEIGHT))
 
         if inverted:
-            img = pygame.transform.flip(img, False, True)
+            img = assets.flipped(img, False, True)
 
+        self.inverted = inverted
         self.image = img
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = assets.mask(self.image)
         self.rect = self.image.get_rect()
-        self.rect.x = xpos
+        self.reset(xpos, ysize)
 
-        if inverted:
+    def reset(self, xpos, ysize):
+        self.rect.x = xpos
+        if self.inverted:
             self.rect.y = -(self.rect.height - ysize)
         else:
             self.rect.y = 600 - ysize
-
+        self.scored = False
 
     def update(self, game_speed):
         self.rect.x -= game_speed
@@ -61,13 +67,15 @@ class Ground(pygame.sprite.Sprite):
     def __init__(self, xpos):
         super().__init__()
 
-        img = pygame.image.load('assets/flappybird/assets/sprites/base.png').convert_alpha()
-        img = pygame.transform.scale(img, (GROUND_WIDHT, GROUND_HEIGHT))
+        img = load_image('assets/flappybird/assets/sprites/base.png', (GROUND_WIDHT, GROUND_HEIGHT))
 
         self.image = img
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = assets.mask(self.image)
 
         self.rect = self.image.get_rect()
+        self.reset(xpos)
+
+    def reset(self, xpos):
         self.rect.x = xpos
         self.rect.y = 600 - GROUND_HEIGHT
 
@@ -79,12 +87,16 @@ class Ground(pygame.sprite.Sprite):
 def is_off_screen(sprite):
     return sprite.rect.x < -(sprite.rect.width)
 
-def get_random_pipes(xpos):
+def get_random_pipes(xpos, recycle=None):
+    """A pipe pair with a random gap at xpos, repositioning the (bottom, top) pair in recycle if given"""
     size = random.randint(100, 300)
-    pipe_bottom = Pipe(False, xpos, size)
-    pipe_top = Pipe(True, xpos, 600 - size - PIPE_GAP)
-    pipe_top.scored = False
-    pipe_bottom.scored = False
+    if recycle:
+        pipe_bottom, pipe_top = recycle
+        pipe_bottom.reset(xpos, size)
+        pipe_top.reset(xpos, 600 - size - PIPE_GAP)
+    else:
+        pipe_bottom = Pipe(False, xpos, size)
+        pipe_top = Pipe(True, xpos, 600 - size - PIPE_GAP)
     return pipe_bottom, pipe_top
 
 # MAIN WRAPPER CLASS FOR GAME LOOP
@@ -96,8 +108,7 @@ class FlappyBird:
 
 
         # background
-        self.background = pygame.image.load('assets/flappybird/assets/sprites/flappybg2.png')
-        self.background = pygame.transform.scale(self.background, (800, 600))
+        self.background = load_image('assets/flappybird/assets/sprites/flappybg2.png', (800, 600), alpha = False)
 
 
         # create sprite groups
@@ -114,6 +125,9 @@ class FlappyBird:
             p1, p2 = get_random_pipes(800 * i + 800)
             self.pipe_group.add(p1, p2)
 
+        # decoded once per process, scoring only plays the preloaded sound
+        sounds.load("point", "assets/flappybird/assets/audio/point.wav")
+
         self.clock = pygame.time.Clock()
         self.state = "menu"   
         self.game_speed = GAME_SPEED   # starting scroll speed
@@ -153,26 +167,29 @@ class FlappyBird:
     def game_update(self):
         self.surface.blit(self.background, (0, 0))
 
-        # ground looping
+        # ground looping: the segment that scrolled off is moved to the back of the queue
         if is_off_screen(self.ground_group.sprites()[0]):
-            g = Ground(GROUND_WIDHT - 20)
-            self.ground_group.remove(self.ground_group.sprites()[0])
+            g = self.ground_group.sprites()[0]
+            self.ground_group.remove(g)
+            g.reset(GROUND_WIDHT - 20)
             self.ground_group.add(g)
 
-        # pipes looping
+        # pipes looping: same for the oldest pipe pair, with a new random gap
         if is_off_screen(self.pipe_group.sprites()[0]):
-            self.pipe_group.remove(self.pipe_group.sprites()[0])
-            self.pipe_group.remove(self.pipe_group.sprites()[0])
+            pair = self.pipe_group.sprites()[:2]
+            self.pipe_group.remove(*pair)
 
-            p1, p2 = get_random_pipes(800 * 2)
+            p1, p2 = get_random_pipes(800 * 2, recycle=pair)
             self.pipe_group.add(p1, p2)
 
+        scored = False
         for pipe in self.pipe_group:
             if not pipe.scored and pipe.rect.right < self.bird.rect.left:
                 pipe.scored = True
                 self.score += 0.5
-                pygame.mixer.music.load("assets/flappybird/assets/audio/point.wav")
-                pygame.mixer.music.play()
+                scored = True
+        if scored:
+            play_sound("point")
 
         # updates
         self.bird_group.update()
@@ -187,8 +204,6 @@ class FlappyBird:
         # collision
         if (pygame.sprite.groupcollide(self.bird_group, self.ground_group, False, False, pygame.sprite.collide_mask)
             or pygame.sprite.groupcollide(self.bird_group, self.pipe_group, False, False, pygame.sprite.collide_mask)):
-            pygame.mixer.music.load("assets/Music/HomeScene_music.mp3")
-            pygame.mixer.music.play(-1)
             self.state = "dead"
 
     def handle_event(self, event: pygame.event.Event):
@@ -9,3 +9,17 @@ def hex_to_rgb(hex_color : str) -> tuple[int, int, int]:
     g = int(hex_color[2:4], 16)
     b = int(hex_color[4:6], 16)
     return (r, g, b)
+
+
+def format_duration(seconds : float) -> str:
+    """Human readable duration, e.g. "2 days, 3 hours" (two largest units)"""
+    units = (("day", 86400), ("hour", 3600), ("minute", 60), ("second", 1))
+    parts : list[str] = []
+    remaining = int(seconds)
+    for name, size in units:
+        amount, remaining = divmod(remaining, size)
+        if amount:
+            parts.append(f"{amount} {name}{'s' if amount != 1 else ''}")
+        if len(parts) == 2:
+            break
+    return ", ".join(parts) if parts else "0 seconds"
@@ -0,0 +1,74 @@
+# ----------------------------------------------------------------
+# Contained here is the adaptive frame pacing used by the main loop
+# ----------------------------------------------------------------
+
+import time
+import pygame
+
+# Events that count as the player doing something, they ramp pacing back to full rate
+INPUT_EVENTS = {
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.WINDOWFOCUSGAINED, pygame.WINDOWENTER, pygame.WINDOWEXPOSED, pygame.QUIT,
+}
+
+
+class FramePacer:
+    """
+    Chooses how fast the main loop runs.
+
+    While something animates, or shortly after any input, frames are capped
+    at `active_fps`. Otherwise (menus, pause and game-over screens) the loop
+    goes idle: events() blocks in pygame.event.wait() for up to one idle
+    frame, so the process sleeps until the player acts, and tick() stops
+    capping since the wait already paced the frame.
+
+    Also samples the achieved frame rate and the process CPU share twice a
+    second for the debug overlay.
+    """
+    def __init__(self, active_fps : int = 60, idle_fps : int = 10, idle_after : float = 1.0, adaptive : bool = True):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after    # seconds of full rate after the last input
+        self.adaptive = adaptive
+        self.clock = pygame.time.Clock()
+        self.idle = False
+
+        self._last_input = time.perf_counter()
+        self._sample_wall = time.perf_counter()
+        self._sample_cpu = time.process_time()
+        self._sample_frames = 0
+        self.fps = 0.0
+        self.cpu = 0.0      # percent of one core
+
+    def events(self) -> list[pygame.event.Event]:
+        """This frame's events, waiting for the first one when idle"""
+        events = []
+        if self.idle:
+            event = pygame.event.wait(1000 // self.idle_fps)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+        events.extend(pygame.event.get())
+
+        if any(event.type in INPUT_EVENTS for event in events):
+            self._last_input = time.perf_counter()
+            self.idle = False
+        return events
+
+    def tick(self, animating : bool) -> float:
+        """End the frame, returns its length in seconds"""
+        was_idle = self.idle
+        now = time.perf_counter()
+        self.idle = self.adaptive and not animating and now - self._last_input >= self.idle_after
+        elapsed = self.clock.tick() if was_idle else self.clock.tick(self.active_fps)
+
+        self._sample_frames += 1
+        if now - self._sample_wall >= 0.5:
+            cpu = time.process_time()
+            self.fps = self._sample_frames / (now - self._sample_wall)
+            self.cpu = 100 * (cpu - self._sample_cpu) / (now - self._sample_wall)
+            self._sample_wall, self._sample_cpu, self._sample_frames = now, cpu, 0
+        return elapsed / 1000
+
+    def readout(self) -> str:
+        return f"{self.fps:5.1f} fps {'idle' if self.idle else 'active'}, cpu {self.cpu:3.0f}%"
@@ -1,10 +1,351 @@
 import json
 import os
+import threading
 from datetime import datetime
-from classes import Creature, Less_Decay, More_Satisfaction
+from classes import Creature, Less_Decay, More_Satisfaction, DEFAULT_DECAY, SIM_HZ, SIM_DT
 from typing import Any
+from save_format import encode_world, decode_world, is_binary, migrate_json
+from logger import log
+
+SAVE_DIR = "save_files"
+SAVE_TIME_FORMAT = "%B %d, %Y %I:%M:%S %p"
+JOURNAL_SUFFIX = ".journal"
+TEMP_SUFFIX = ".tmp"
+COMPACT_EVERY = 64      # journal records between snapshots
+MANIFEST_FILE = "slots.manifest"    # has an extension, so no slot can be named like it
+
+
+def slot_path(file_slot : str) -> str:
+    safe_filename = os.path.splitext(file_slot)[0].replace("\n", "").replace("\r", "")
+    return os.path.join(SAVE_DIR, safe_filename)
+
+
+def _fsync_dir(path : str):
+    """Make a rename in path durable; not possible (nor needed) on Windows"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveJournal:
+    """
+    Crash-safe incremental writer for one save slot.
+
+    The slot file is a full binary snapshot (see save_format). Each save
+    after the first appends one JSON line to `<slot>.journal` holding only
+    what changed since the previous save (top-level fields, creatures by
+    index, the creature count) and fsyncs it. Every COMPACT_EVERY records,
+    or once the journal outgrows the snapshot, the merged state is written
+    to a temp file, fsynced and renamed over the snapshot, and the journal
+    is dropped.
+
+    Records carry increasing sequence numbers and the snapshot remembers
+    the last one it includes, so records left behind by a crash between
+    rename and journal removal are skipped on load, as is a torn last line.
+
+    Creatures are compared without their satisfaction_level, which changes
+    every tick. Their "anchor" (level, clock time, decay) only changes when
+    something re-anchors them, and load_slot() re-derives every level at
+    the saved clock.
+    """
+    def __init__(self, file_slot : str):
+        self.path = slot_path(file_slot)
+        self.journal_path = self.path + JOURNAL_SUFFIX
+        self.seq = 0
+        self.records = 0                    # appended since the last compaction
+        self._state : dict[str, Any] | None = None
+        self._keys : list[Any] = []         # per creature, its compared form
+
+        # Instrumentation
+        self.bytes_written = 0
+        self.compactions = 0
+
+    def save(self, state : dict[str, Any]) -> int:
+        """Persist state, returns the bytes written"""
+        if self._state is None:
+            self.seq = max(self.seq, self._recover())
+            return self.compact(state)
+
+        record : dict[str, Any] = {}
+        changed = {k: v for k, v in state.items() if k != "creatures" and self._state.get(k) != v}
+        if changed:
+            record["set"] = changed
+        keys = [creature_key(c) for c in state["creatures"]]
+        creatures = {str(i): c for i, c in enumerate(state["creatures"]) if i >= len(self._keys) or self._keys[i] != keys[i]}
+        if creatures:
+            record["creatures"] = creatures
+        if len(keys) != len(self._keys):
+            record["count"] = len(keys)
+        if not record:
+            return 0
+
+        written = self._append(record)
+        self._state, self._keys = state, keys
+        if self.records >= COMPACT_EVERY or self._journal_size() > self._snapshot_size():
+            written += self.compact(state)
+        return written
+
+    def compact(self, state : dict[str, Any]) -> int:
+        """Atomically replace the snapshot with state and drop the journal"""
+        snapshot = {**state, "journal_seq": self.seq}
+        data = encode_world(snapshot)
+        temp = self.path + TEMP_SUFFIX
+        with open(temp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.path)
+        _fsync_dir(os.path.dirname(self.path) or ".")
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+        self._state = state
+        self._keys = [creature_key(c) for c in state["creatures"]]
+        self.records = 0
+        self.compactions += 1
+        self.bytes_written += len(data)
+        return len(data)
+
+    def _append(self, record : dict[str, Any]) -> int:
+        self.seq += 1
+        line = (json.dumps({"seq": self.seq, **record}, separators=(",", ":")) + "\n").encode()
+        with open(self.journal_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.records += 1
+        self.bytes_written += len(line)
+        return len(line)
+
+    def _recover(self) -> int:
+        """Cut a torn trailing record off the journal, returns the last complete sequence number"""
+        try:
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        seq, valid = 0, 0
+        for line in data.splitlines(keepends=True):
+            try:
+                seq = max(seq, json.loads(line)["seq"])
+            except (ValueError, KeyError):
+                break
+            valid += len(line)
+        if valid < len(data):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(valid)
+        return seq
+
+    def _journal_size(self) -> int:
+        try:
+            return os.path.getsize(self.journal_path)
+        except OSError:
+            return 0
+
+    def _snapshot_size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+
+def slot_stamp(file_slot : str) -> tuple[list[int], int] | None:
+    """(mtimes, total size) of the slot's snapshot and journal, None if the slot is gone"""
+    path = slot_path(file_slot)
+    try:
+        snapshot = os.stat(path)
+    except OSError:
+        return None
+    try:
+        journal = os.stat(path + JOURNAL_SUFFIX)
+        return [snapshot.st_mtime_ns, journal.st_mtime_ns], snapshot.st_size + journal.st_size
+    except OSError:
+        return [snapshot.st_mtime_ns, 0], snapshot.st_size
+
+
+class SaveManifest:
+    """
+    Index of the save slots in one folder, for the load menu.
+
+    Holds per slot its world name, last save time, creature count, and the
+    size and mtimes of its snapshot and journal. An entry is trusted while
+    those still match the files on disk; otherwise (a slot written by an
+    older version or another process) the slot is parsed once and the
+    entry rebuilt. Saves made through Persistence refresh their entry from
+    the state they just wrote, so listing slots normally costs one stat per
+    file, however large the worlds are.
+
+    The manifest is only a cache: it is rewritten through a temp file and a
+    rename but not fsynced, and a lost or corrupt one is simply rebuilt.
+    """
+    def __init__(self, folder : str):
+        self.path = os.path.join(folder, MANIFEST_FILE)
+        self._entries : dict[str, dict[str, Any]] | None = None
+
+        # Instrumentation
+        self.parses = 0
+
+    def entry(self, file_slot : str) -> dict[str, Any] | None:
+        key = os.path.basename(slot_path(file_slot))
+        previous = self._load().get(key)
+        entry = self._fresh(key)
+        if entry is not previous:
+            self._write()
+        return entry
+
+    def entries(self) -> list[tuple[str, dict[str, Any]]]:
+        """(slot, entry) for every readable slot, in taken_name() order"""
+        entries = self._load()
+        changed = False
+        listed : list[tuple[str, dict[str, Any]]] = []
+        for file_slot in Persistence.taken_name():
+            key = os.path.basename(slot_path(file_slot))
+            previous = entries.get(key)
+            entry = self._fresh(key)
+            changed |= entry is not previous
+            if entry is not None:
+                listed.append((file_slot, entry))
+        for key in [k for k in entries if slot_stamp(k) is None]:
+            del entries[key]
+            changed = True
+        if changed:
+            self._write()
+        return listed
+
+    def record(self, file_slot : str, state : dict[str, Any]):
+        """Refresh a slot's entry from the state just written to it"""
+        key = os.path.basename(slot_path(file_slot))
+        stamp = slot_stamp(key)
+        if stamp is None:
+            return
+        self._load()[key] = self._entry(state, stamp)
+        self._write()
+
+    def forget(self, file_slot : str):
+        if self._load().pop(os.path.basename(slot_path(file_slot)), None) is not None:
+            self._write()
+
+    def _fresh(self, key : str) -> dict[str, Any] | None:
+        """The slot's entry, rebuilt from the slot itself when stale"""
+        entries = self._load()
+        stamp = slot_stamp(key)
+        if stamp is None:
+            entries.pop(key, None)
+            return None
+        entry = entries.get(key)
+        if entry is not None and [entry["mtime"], entry["size"]] == list(stamp):
+            return entry
+        state = Persistence.load_slot(key)
+        self.parses += 1
+        if state is None:
+            entries.pop(key, None)
+            return None
+        entry = entries[key] = self._entry(state, stamp)
+        return entry
+
+    @staticmethod
+    def _entry(state : dict[str, Any], stamp : tuple[list[int], int]) -> dict[str, Any]:
+        return {
+            "world_name": state.get("world_name", "Unknown World"),
+            "last_saved": state.get("last_saved", ""),
+            "creatures": len(state.get("creatures", [])),
+            "mtime": stamp[0],
+            "size": stamp[1],
+        }
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._entries = dict(json.load(f))
+            except (OSError, ValueError, TypeError):
+                self._entries = {}
+        return self._entries
+
+    def _write(self):
+        temp = self.path + TEMP_SUFFIX
+        try:
+            with open(temp, "w") as f:
+                json.dump(self._entries, f, separators=(",", ":"))
+            os.replace(temp, self.path)
+        except OSError as e:
+            log(1, f"Error writing save manifest {self.path}: {e}")
+
+
+def creature_key(data : dict[str, Any]) -> Any:
+    """What decides whether a creature needs a new journal record"""
+    return {k: v for k, v in data.items() if k != "satisfaction_level"}
+
+
+def replay_journal(state : dict[str, Any], journal_path : str) -> dict[str, Any]:
+    """Apply the journal's records newer than the snapshot to state"""
+    try:
+        with open(journal_path, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return state
+
+    applied = state.get("journal_seq", 0)
+    creatures = state["creatures"]
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break   # torn last record
+        if record.get("seq", 0) <= applied:
+            continue
+        applied = record["seq"]
+        state.update(record.get("set", {}))
+        if "count" in record:
+            del creatures[record["count"]:]
+        for index, creature in record.get("creatures", {}).items():
+            index = int(index)
+            if index < len(creatures):
+                creatures[index] = creature
+            else:
+                creatures.append(creature)
+    state["creatures"] = creatures
+    state["journal_seq"] = applied
+
+    # Levels at the last saved clock; creatures untouched since the snapshot kept decaying
+    clock = state.get("clock")
+    if clock is not None:
+        for creature in creatures:
+            anchor = creature.get("anchor")
+            if anchor:
+                creature["satisfaction_level"] = max(0.0, anchor["level"] - anchor["decay"] * (clock - anchor["seconds"]))
+    return state
+
 
 class Persistence:
+    _journals : dict[str, SaveJournal] = {}
+    _manifests : dict[str, SaveManifest] = {}
+    _lock = threading.RLock()   # journals and manifests are shared with the autosave worker
+
+    @staticmethod
+    def journal(file_slot : str) -> SaveJournal:
+        """The slot's SaveJournal, one per slot per process"""
+        path = slot_path(file_slot)
+        journal = Persistence._journals.get(path)
+        if journal is None:
+            journal = Persistence._journals[path] = SaveJournal(file_slot)
+        return journal
+
+    @staticmethod
+    def manifest() -> SaveManifest:
+        """The SaveManifest of the current SAVE_DIR"""
+        manifest = Persistence._manifests.get(SAVE_DIR)
+        if manifest is None:
+            manifest = Persistence._manifests[SAVE_DIR] = SaveManifest(SAVE_DIR)
+        return manifest
+
     @staticmethod
     def save_to_slot(
         file_slot: str,
@@ -14,71 +355,120 @@ class Persistence:
         potions: dict[str, int] = {"More_satisfaction": 0, "Less decay" : 0},
         cleanse: dict[str, int] = {},
         money: int = 0
-    ) -> None:
-
-        # Clean filename
-        safe_filename = os.path.splitext(file_slot)[0].replace("\n", "").replace("\r", "")
-        filename = f"save_files/{safe_filename}"
+    ) -> int:
+        """Save the world through the slot's journal, returns the bytes written"""
+        state = Persistence.world_state(
+            file_slot,
+            world_score,
+            [Persistence.pack_creature(creature) for creature in creatures],
+            foods, potions, cleanse, money,
+            creatures[0].pool.tick * SIM_DT if creatures else 0.0,
+        )
+        return Persistence.save_state(file_slot, state)
 
-        # Base save structure
-        state: dict[str, Any] = {
+    @staticmethod
+    def world_state(
+        file_slot : str,
+        world_score : int | float,
+        creatures : list[dict[str, Any]],
+        foods : dict[str, int],
+        potions : dict[str, int],
+        cleanse : dict[str, int],
+        money : int,
+        clock : float,
+        saved_at : datetime | None = None
+    ) -> dict[str, Any]:
+        """The save structure, from packed creatures (see pack_creature)"""
+        return {
             "world_name": file_slot,
             "world_score": world_score,
-            "creatures": [],
-            "inventory": {
-                "foods": foods,     
-                "potions": potions,    
-                "cleanse": cleanse  
-            },
-            "last_saved": datetime.now().strftime("%B %d, %Y %I:%M:%S %p",),
-            "money": money
+            "creatures": creatures,
+            # copied so later inventory changes are seen as changes
+            "inventory": {"foods": dict(foods), "potions": dict(potions), "cleanse": dict(cleanse)},
+            "last_saved": (saved_at or datetime.now()).strftime(SAVE_TIME_FORMAT),
+            "money": money,
+            "clock": clock
         }
 
-        # -------------------------
-        # Save `c`reatures
-        # -------------------------
-        for creature in creatures:
-            state["creatures"].append({
-                "name": creature.name,
-                "x": creature.x,
-                "y": creature.y,
-                "sprite": creature.frames_paths,
-                "type": creature.type,
-                "satisfaction_level": creature.satisfaction_level,
-                "satisfaction_multiplier": 1,
-                "satisfaction_decay": 0.01,
-                "effects": [effect.to_dict(creature) for effect in creature.effects]
-            })
-
-        # -------------------------
-        # Save inventory (dict[str, int])
-        # -------------------------
-            state["inventory"]["foods"] = foods
-            state["inventory"]["potions"] = potions
-            state["inventory"]["cleanse"] = cleanse
-
-        # -------------------------
-        # Write to file
-        # -------------------------
-        with open(filename, "w") as f:
-            json.dump(state, f, indent=4)
+    @staticmethod
+    def save_state(file_slot : str, state : dict[str, Any]) -> int:
+        """Write a world_state() through the slot's journal, returns the bytes written"""
+        with Persistence._lock:
+            written = Persistence.journal(file_slot).save(state)
+            if written:
+                Persistence.manifest().record(file_slot, state)
+        return written
+
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def pack_creature(creature : Creature) -> dict[str, Any]:
+        pool, index = creature.pool, creature.index
+        return Persistence.creature_record(
+            creature, creature.x, creature.y, creature.satisfaction_level,
+            [effect.to_dict(creature) for effect in creature.effects],
+            float(pool.level0[index]), int(pool.anchor[index]) * SIM_DT, float(pool.decay[index])
+        )
+
+    @staticmethod
+    def creature_record(creature : Creature, x : int, y : int, level : float, effects : list[dict[str, Any]],
+                        anchor_level : float, anchor_seconds : float, anchor_decay : float) -> dict[str, Any]:
+        """A creature's save entry; only its name, type and sprite paths are read from the object"""
+        return {
+            "name": creature.name,
+            "x": x,
+            "y": y,
+            "sprite": creature.frames_paths,
+            "type": creature.type,
+            "satisfaction_level": level,
+            "satisfaction_multiplier": 1,
+            "decay_per_second": DEFAULT_DECAY,
+            "effects": effects,
+            # the linear decay the level follows until the next re-anchor, on the pool clock
+            "anchor": {
+                "level": anchor_level,
+                "seconds": anchor_seconds,
+                "decay": anchor_decay,
+            },
+        }
 
     # ----------------------------------------------------------------------
 
     @staticmethod
     def load_slot(file_slot: str) -> dict[str, Any]:
-        filename = f"save_files/{file_slot}"
+        """Snapshot with the journal replayed on top; JSON saves from older versions are migrated"""
+        filename = slot_path(file_slot)
         try:
-            with open(filename, "r") as f:
-                return json.load(f)
+            with Persistence._lock:     # not halfway through a save compacting the journal
+                with open(filename, "rb") as f:
+                    data = f.read()
+                state = decode_world(data) if is_binary(data) else migrate_json(json.loads(data))
+                return replay_journal(state, filename + JOURNAL_SUFFIX)
         except Exception as e:
             print("Error loading save:", e)
             return None
 
     # ----------------------------------------------------------------------
 
+    @staticmethod
+    def seconds_since_saved(data: dict[str, Any]) -> float:
+        """Wall time elapsed since the slot was written (0 if unknown or in the future)"""
+        try:
+            saved_at = datetime.strptime(data["last_saved"], SAVE_TIME_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+        return max(0.0, (datetime.now() - saved_at).total_seconds())
+
+    # ----------------------------------------------------------------------
+
     @staticmethod
     def unpack_creatures(data: dict[str, Any]) -> Creature:
+        # Older saves store decay per frame and effect durations in frames (60 FPS)
+        if "decay_per_second" in data:
+            decay = data["decay_per_second"]
+        else:
+            decay = data.get("satisfaction_decay", DEFAULT_DECAY / SIM_HZ) * SIM_HZ
+
         # restore Creature
         c = Creature(
             name=data["name"],
@@ -87,25 +477,27 @@ class Persistence:
             y=data["y"],
             sprite=data["sprite"],
             satisfaction_multiplier=data.get("satisfaction_multiplier", 1),
-            satisfaction_decay=data.get("satisfaction_decay", 0.01),
+            satisfaction_decay=decay,
             satisfaction_level=data.get("satisfaction_level", 100)
         )
 
         for eff_data in data.get("effects", []):
             eff_type = eff_data.get("type")
+            if "duration_seconds" in eff_data:
+                dur = eff_data["duration_seconds"]
+            else:
+                dur = eff_data.get("duration", 0) / SIM_HZ
 
             if eff_type == "More_Satisfaction":
                 effect = More_Satisfaction()
                 mult = eff_data.get("satisfaction_multiplier", getattr(c, "satisfaction_multiplier", 1))
             elif eff_type == "Less_Decay":
                 mult = eff_data.get("multiplier", 1)
-                dur = eff_data.get("duration", 0)
                 effect = Less_Decay(multiplier=mult, duration=dur)
             else:
                 continue
 
-            if "duration" in eff_data:
-                effect.duration = eff_data.get("duration", effect.duration)
+            effect.duration = dur
 
             effect.consume(
                 c,
@@ -119,21 +511,32 @@ class Persistence:
 
     @staticmethod
     def taken_name() -> list[str]:
-        folder = "save_files"
+        folder = SAVE_DIR
         filenames: list[str] = []
         for filename in os.listdir(folder):
+            if filename.endswith((JOURNAL_SUFFIX, TEMP_SUFFIX)) or filename == MANIFEST_FILE:
+                continue    # a slot's journal / interrupted snapshot / the manifest, not a slot
             filenames.append(filename)
         return filenames
 
-    def update_file(file_slot, data):
-        safe_filename = os.path.splitext(file_slot)[0].replace("\n", "").replace("\r", "")
-        filename = f"save_files/{safe_filename}"
-
-        with open(filename, "r") as f:
-            state = json.load(f)
-    
-        state.update(data)
-        
-        # Write back to file
-        with open(filename, "w") as f:
-            json.dump(state, f, indent=4)
\ No newline at end of file
+    @staticmethod
+    def slot_info(file_slot : str) -> dict[str, Any] | None:
+        """The slot's manifest entry (world_name, last_saved, creatures, size, mtime), None if unreadable"""
+        with Persistence._lock:
+            return Persistence.manifest().entry(file_slot)
+
+    @staticmethod
+    def list_slots() -> list[tuple[str, dict[str, Any]]]:
+        """(slot, manifest entry) for every readable save slot, without parsing up-to-date slots"""
+        with Persistence._lock:
+            return Persistence.manifest().entries()
+
+    @staticmethod
+    def delete_slot(file_slot : str):
+        path = slot_path(file_slot)
+        with Persistence._lock:
+            Persistence._journals.pop(path, None)
+            Persistence.manifest().forget(file_slot)
+            for filename in (path, path + JOURNAL_SUFFIX, path + TEMP_SUFFIX):
+                if os.path.exists(filename):
+                    os.remove(filename)
\ No newline at end of file
@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------
+# Contained here is the dirty-rectangle bookkeeping used by scenes
+# ----------------------------------------------------------------
+
+import pygame
+from typing import Any
+from collections.abc import Callable, Hashable, Iterable
+
+MAX_DIRTY_RECTS = 64          # more regions than this and a full redraw is cheaper
+FULL_REDRAW_AREA = 0.6        # fraction of the screen above which we just flip
+
+
+class DirtyRenderer:
+    """
+    Tracks what each drawable painted last frame and reports the regions that
+    need repainting this frame.
+
+    Widgets are tracked by key with a hashable state and the rect they paint;
+    when either changes (or the widget stops being reported) its old and new
+    rects become dirty. Anything else (e.g. sprites that moved) is reported
+    with invalidate().
+
+    collect() returns the merged dirty rects, or None when the frame should be
+    redrawn and flipped in full (first frame, invalidate(), too many changes).
+    """
+    def __init__(self, size : tuple[int, int] = (800, 600)):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.full = True
+
+        self._states : dict[Hashable, tuple[Hashable, pygame.Rect]] = {}
+        self._seen : set[Hashable] = set()
+        self._dirty : list[pygame.Rect] = []
+
+    def invalidate(self, rect : pygame.Rect | None = None):
+        """Repaint rect next frame, or everything when rect is None"""
+        if rect is None:
+            self.full = True
+        else:
+            self._dirty.append(pygame.Rect(rect))
+
+    def track(self, key : Hashable, state : Hashable, rect : pygame.Rect):
+        self._seen.add(key)
+        previous = self._states.get(key)
+        if previous is not None and previous[0] == state and previous[1] == rect:
+            return
+        if previous is not None:
+            self._dirty.append(previous[1])
+        rect = pygame.Rect(rect)
+        self._dirty.append(rect)
+        self._states[key] = (state, rect)
+
+    def collect(self) -> list[pygame.Rect] | None:
+        """Merged dirty rects for this frame, None means redraw everything"""
+        for key in [k for k in self._states if k not in self._seen]:
+            self._dirty.append(self._states.pop(key)[1])
+        self._seen.clear()
+
+        dirty, self._dirty = self._dirty, []
+        if self.full or len(dirty) > MAX_DIRTY_RECTS:
+            self.full = False
+            return None
+
+        rects = merge_rects(r.clip(self.screen_rect) for r in dirty)
+        if sum(r.width * r.height for r in rects) > FULL_REDRAW_AREA * self.screen_rect.width * self.screen_rect.height:
+            return None
+        return rects
+
+
+class ModalLayer:
+    """
+    Cached surfaces for modal screens.
+
+    Translucent overlays are built once per (size, color) and bordered panels
+    once per (size, colors, border); both are reused every frame. backdrop()
+    keeps a snapshot of the dimmed world under the open modals, so while they
+    stay open the world is not redrawn at all.
+    """
+    def __init__(self):
+        self._overlays : dict[tuple[tuple[int, int], tuple[int, ...]], pygame.Surface] = {}
+        self._panels : dict[tuple[Any, ...], pygame.Surface] = {}
+        self._snapshot : pygame.Surface | None = None
+        self._snapshot_key : Hashable = None
+
+    def overlay(self, size : tuple[int, int], color : tuple[int, int, int, int]) -> pygame.Surface:
+        key = (tuple(size), tuple(color))
+        surface = self._overlays.get(key)
+        if surface is None:
+            surface = self._overlays[key] = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+        return surface
+
+    def panel(self, size : tuple[int, int], fill : tuple[int, int, int], border : tuple[int, int, int],
+              border_width : int = 3, radius : int = 12) -> pygame.Surface:
+        """Rounded panel with a border, transparent outside the corners"""
+        key = (tuple(size), tuple(fill), tuple(border), border_width, radius)
+        surface = self._panels.get(key)
+        if surface is None:
+            surface = self._panels[key] = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, fill, surface.get_rect(), border_radius = radius)
+            pygame.draw.rect(surface, border, surface.get_rect(), width = border_width, border_radius = radius)
+        return surface
+
+    def backdrop(self, key : Hashable, size : tuple[int, int], paint : Callable[[pygame.Surface], Any]) -> pygame.Surface:
+        """Snapshot painted by paint(surface), rebuilt only when key or size changes"""
+        if self._snapshot is None or self._snapshot_key != key or self._snapshot.get_size() != tuple(size):
+            surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            paint(surface)
+            self._snapshot, self._snapshot_key = surface, key
+        return self._snapshot
+
+    def release(self):
+        """Drop the snapshot once no modal is open"""
+        self._snapshot = None
+        self._snapshot_key = None
+
+
+def merge_rects(rects : Iterable[pygame.Rect]) -> list[pygame.Rect]:
+    """Union overlapping rects until none overlap"""
+    merged : list[pygame.Rect] = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
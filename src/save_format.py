@@ -0,0 +1,201 @@
+# ----------------------------------------------------------------
+# Contained here is the binary world snapshot format used by persistence
+# ----------------------------------------------------------------
+
+import json
+import struct
+import numpy as np
+from typing import Any
+from classes import DEFAULT_DECAY, SIM_HZ
+
+MAGIC = b"COZY"
+VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_COUNT = struct.Struct("<I")
+
+# Fixed-width little-endian records; strings are indices into the string table
+CREATURE_RECORD = np.dtype([
+    ("name", "<u4"),
+    ("type", "<u4"),
+    ("sprite", "<u4"),              # index into the sprite set table
+    ("x", "<i4"),
+    ("y", "<i4"),
+    ("level", "<f8"),
+    ("multiplier", "<f8"),
+    ("decay", "<f8"),
+    ("anchor_level", "<f8"),
+    ("anchor_seconds", "<f8"),
+    ("anchor_decay", "<f8"),
+    ("flags", "u1"),                # bit 0: has an anchor
+    ("effects", "<u2"),             # how many of the next effect records are this creature's
+])
+EFFECT_RECORD = np.dtype([
+    ("name", "<u4"),
+    ("type", "<u4"),
+    ("duration", "<f8"),
+    ("multiplier", "<f8"),
+    ("flags", "u1"),                # bit 0: has a multiplier
+])
+
+HAS_ANCHOR = 1
+HAS_MULTIPLIER = 1
+
+
+def is_binary(data : bytes) -> bool:
+    return data[:len(MAGIC)] == MAGIC
+
+
+def encode_world(state : dict[str, Any]) -> bytes:
+    """
+    Snapshot layout, all little-endian:
+        header      magic, schema version, reserved
+        meta        u32 length + JSON of every top-level field except creatures
+        strings     u32 count, u32 length + NUL-joined UTF-8 (names, types, sprite paths)
+        sprite sets u32 count, u8 frame count per set, u32 string index per frame
+        creatures   u32 count + CREATURE_RECORD each
+        effects     u32 count + EFFECT_RECORD each, in creature order
+    """
+    strings : dict[str, int] = {}
+    def intern(text : str) -> int:
+        index = strings.get(text)
+        if index is None:
+            if "\0" in text:
+                raise ValueError(f"Cannot store {text!r} in a save file")
+            index = strings[text] = len(strings)
+        return index
+
+    sprite_sets : dict[tuple[int, ...], int] = {}
+    creatures = state.get("creatures", [])
+    rows : list[tuple[Any, ...]] = []
+    effects : list[tuple[int, int, float, float, int]] = []
+
+    for c in creatures:
+        frames = tuple(intern(path) for path in c["sprite"])
+        sprite = sprite_sets.setdefault(frames, len(sprite_sets))
+        anchor = c.get("anchor")
+        rows.append((
+            intern(c["name"]), intern(c["type"]), sprite,
+            int(c["x"]), int(c["y"]),
+            c.get("satisfaction_level", 100), c.get("satisfaction_multiplier", 1), c.get("decay_per_second", DEFAULT_DECAY),
+            anchor["level"] if anchor else 0.0, anchor["seconds"] if anchor else 0.0, anchor["decay"] if anchor else 0.0,
+            HAS_ANCHOR if anchor else 0, len(c.get("effects", [])),
+        ))
+        for e in c.get("effects", []):
+            effects.append((intern(e["name"]), intern(e["type"]), e["duration_seconds"],
+                            e.get("multiplier", 0.0), HAS_MULTIPLIER if "multiplier" in e else 0))
+
+    meta = json.dumps({k: v for k, v in state.items() if k != "creatures"}, separators=(",", ":")).encode()
+    text = "\0".join(strings).encode()
+    set_sizes = np.array([len(s) for s in sprite_sets], dtype="u1")
+    set_frames = np.array([f for s in sprite_sets for f in s], dtype="<u4")
+    records = np.array(rows, dtype=CREATURE_RECORD)
+
+    return b"".join((
+        _HEADER.pack(MAGIC, VERSION, 0),
+        _COUNT.pack(len(meta)), meta,
+        _COUNT.pack(len(strings)), _COUNT.pack(len(text)), text,
+        _COUNT.pack(len(sprite_sets)), set_sizes.tobytes(), set_frames.tobytes(),
+        _COUNT.pack(len(records)), records.tobytes(),
+        _COUNT.pack(len(effects)), np.array(effects, dtype=EFFECT_RECORD).tobytes(),
+    ))
+
+
+def decode_world(data : bytes) -> dict[str, Any]:
+    """Inverse of encode_world(), creature dicts come back in the current save schema"""
+    magic, version, _ = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a binary save file")
+    decoder = _DECODERS.get(version)
+    if decoder is None:
+        raise ValueError(f"Save schema version {version} is newer than this game supports ({VERSION})")
+    return decoder(data, _HEADER.size)
+
+
+def _decode_v1(data : bytes, offset : int) -> dict[str, Any]:
+    def count() -> int:
+        nonlocal offset
+        value, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        return value
+
+    def array(dtype : Any, n : int) -> np.ndarray:
+        nonlocal offset
+        values = np.frombuffer(data, dtype=dtype, count=n, offset=offset)
+        offset += values.nbytes
+        return values
+
+    size = count()
+    state : dict[str, Any] = json.loads(data[offset:offset + size])
+    offset += size
+
+    n_strings, size = count(), count()
+    strings = data[offset:offset + size].decode().split("\0") if n_strings else []
+    offset += size
+
+    n_sets = count()
+    set_sizes = array("u1", n_sets).tolist()
+    frames = [strings[i] for i in array("<u4", sum(set_sizes)).tolist()]
+    sprite_sets, start = [], 0
+    for n in set_sizes:
+        sprite_sets.append(frames[start:start + n])
+        start += n
+
+    records = array(CREATURE_RECORD, count())
+    effects = array(EFFECT_RECORD, count())
+
+    columns = {name: records[name].tolist() for name in CREATURE_RECORD.names}
+    effect_columns = {name: effects[name].tolist() for name in EFFECT_RECORD.names}
+    creatures = []
+    e = 0
+    for i in range(len(records)):
+        creature : dict[str, Any] = {
+            "name": strings[columns["name"][i]],
+            "x": columns["x"][i],
+            "y": columns["y"][i],
+            "sprite": list(sprite_sets[columns["sprite"][i]]),
+            "type": strings[columns["type"][i]],
+            "satisfaction_level": columns["level"][i],
+            "satisfaction_multiplier": columns["multiplier"][i],
+            "decay_per_second": columns["decay"][i],
+            "effects": [],
+        }
+        for _ in range(columns["effects"][i]):
+            effect : dict[str, Any] = {
+                "name": strings[effect_columns["name"][e]],
+                "duration_seconds": effect_columns["duration"][e],
+                "type": strings[effect_columns["type"][e]],
+            }
+            if effect_columns["flags"][e] & HAS_MULTIPLIER:
+                effect["multiplier"] = effect_columns["multiplier"][e]
+            creature["effects"].append(effect)
+            e += 1
+        if columns["flags"][i] & HAS_ANCHOR:
+            creature["anchor"] = {
+                "level": columns["anchor_level"][i],
+                "seconds": columns["anchor_seconds"][i],
+                "decay": columns["anchor_decay"][i],
+            }
+        creatures.append(creature)
+
+    state["creatures"] = creatures
+    return state
+
+
+_DECODERS = {1: _decode_v1}
+
+
+def migrate_json(state : dict[str, Any]) -> dict[str, Any]:
+    """
+    Bring a JSON save (schema 0, any age) to the current creature schema.
+    Older saves store decay per frame and effect durations in frames (60 FPS).
+    """
+    for c in state.get("creatures", []):
+        if "decay_per_second" not in c:
+            c["decay_per_second"] = c.pop("satisfaction_decay", DEFAULT_DECAY / SIM_HZ) * SIM_HZ
+        c.setdefault("satisfaction_multiplier", 1)
+        c.setdefault("satisfaction_level", 100)
+        c.setdefault("effects", [])
+        for e in c["effects"]:
+            if "duration_seconds" not in e:
+                e["duration_seconds"] = e.pop("duration", 0) / SIM_HZ
+    return state
@@ -0,0 +1,159 @@
+import json
+import os
+import pytest
+
+import persistence
+from persistence import Persistence, JOURNAL_SUFFIX
+from save_format import MAGIC, VERSION, encode_world, decode_world, is_binary, migrate_json
+from classes import DEFAULT_DECAY, SIM_HZ
+
+SAVE_FILES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "save_files")
+CAT = ["assets/Sprites/Cat_happy.png", "assets/Sprites/Cat.png", "assets/Sprites/Cat_sad.png", "assets/Sprites/Dead.png"]
+NOCKY = ["assets/Sprites/Nocky_OC_1.png", "assets/Sprites/Nocky_OC_2.png", "assets/Sprites/Nocky_OC_3.png", "assets/Sprites/Dead.png"]
+
+
+def creature(name, x = 100, y = 200, sprite = CAT, level = 80.5, effects = (), anchor = True):
+    data = {
+        "name": name,
+        "x": x,
+        "y": y,
+        "sprite": list(sprite),
+        "type": "mimi-carrier",
+        "satisfaction_level": level,
+        "satisfaction_multiplier": 1,
+        "decay_per_second": DEFAULT_DECAY,
+        "effects": list(effects),
+    }
+    if anchor:
+        data["anchor"] = {"level": level + 1.25, "seconds": 12.5, "decay": DEFAULT_DECAY / 2}
+    return data
+
+
+def world(creatures):
+    return {
+        "world_name": "meadow",
+        "world_score": 123.75,
+        "creatures": creatures,
+        "inventory": {"foods": {"Grapes": 2, "Makku": 0}, "potions": {"Less Decay": 1}, "cleanse": {}},
+        "last_saved": "January 01, 2026 12:00:00 PM",
+        "money": 42,
+        "clock": 20.0,
+    }
+
+
+@pytest.fixture
+def save_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "SAVE_DIR", str(tmp_path))
+    monkeypatch.setattr(Persistence, "_journals", {})
+    monkeypatch.setattr(Persistence, "_manifests", {})
+    return tmp_path
+
+
+@pytest.mark.parametrize("count", [0, 1, 50])
+def test_round_trip(count):
+    state = world([creature(f"c{i}", x = i, y = -i, sprite = CAT if i % 2 else NOCKY, level = i * 1.5) for i in range(count)])
+    data = encode_world(state)
+    assert is_binary(data)
+    assert decode_world(data) == state
+
+
+def test_round_trip_effects_unicode_and_missing_anchor():
+    effects = [
+        {"name": "Less Decay", "duration_seconds": 7.25, "type": "Less_Decay", "multiplier": 2},
+        {"name": "More Satisfaction", "duration_seconds": 0.5, "type": "More_Satisfaction"},
+    ]
+    state = world([creature("Ünïcode 🐱", effects = effects), creature("plain", anchor = False)])
+    decoded = decode_world(encode_world(state))
+    assert decoded == state
+    assert "multiplier" not in decoded["creatures"][0]["effects"][1]
+    assert "anchor" not in decoded["creatures"][1]
+
+
+def test_sprite_sets_are_stored_once():
+    one = len(encode_world(world([creature("a")])))
+    many = len(encode_world(world([creature("a")] * 100)))
+    assert many - one < 100 * 100    # fixed-width records, no repeated paths
+
+
+def test_bad_magic_is_rejected():
+    data = bytearray(encode_world(world([creature("a")])))
+    data[:len(MAGIC)] = b"JUNK"
+    assert not is_binary(bytes(data))
+    with pytest.raises(ValueError, match = "Not a binary save"):
+        decode_world(bytes(data))
+
+
+def test_unknown_version_is_rejected():
+    data = bytearray(encode_world(world([creature("a")])))
+    data[len(MAGIC):len(MAGIC) + 2] = (VERSION + 1).to_bytes(2, "little")
+    with pytest.raises(ValueError, match = "newer than this game supports"):
+        decode_world(bytes(data))
+
+
+def test_migrate_json_converts_frame_units():
+    legacy = {"creatures": [{"name": "old", "satisfaction_decay": 0.01,
+                             "effects": [{"name": "Less Decay", "duration": 120, "type": "Less_Decay", "multiplier": 2}]}]}
+    migrated = migrate_json(legacy)["creatures"][0]
+    assert migrated["decay_per_second"] == pytest.approx(0.01 * SIM_HZ)
+    assert "satisfaction_decay" not in migrated
+    assert migrated["satisfaction_level"] == 100
+    assert migrated["satisfaction_multiplier"] == 1
+    assert migrated["effects"][0]["duration_seconds"] == pytest.approx(120 / SIM_HZ)
+    assert "duration" not in migrated["effects"][0]
+
+
+def test_legacy_json_slot_loads_with_journal_replay(save_dir):
+    legacy = world([])
+    del legacy["clock"]
+    legacy["creatures"] = [
+        {"name": "Panda", "x": 240, "y": 309, "sprite": NOCKY, "type": "quacker", "satisfaction_level": 68.0,
+         "satisfaction_multiplier": 1, "satisfaction_decay": 0.01,
+         "effects": [{"name": "Less Decay", "duration": 432, "type": "Less_Decay", "multiplier": 2}]},
+        {"name": "Bug", "x": 10, "y": 20, "sprite": CAT, "type": "mimi-carrier", "satisfaction_level": 30.0,
+         "satisfaction_multiplier": 1, "satisfaction_decay": 0.02, "effects": []},
+    ]
+    (save_dir / "meadow").write_text(json.dumps(legacy, indent = 4))
+
+    moved = creature("Panda", x = 300, y = 310, sprite = NOCKY, level = 50.0)
+    records = [
+        {"seq": 1, "set": {"money": 99, "clock": 22.5}},
+        {"seq": 2, "creatures": {"0": moved}},
+        {"seq": 3, "count": 1},
+    ]
+    lines = "".join(json.dumps(r) + "\n" for r in records) + '{"seq": 4, "set": {"mon'    # torn tail
+    (save_dir / ("meadow" + JOURNAL_SUFFIX)).write_text(lines)
+
+    state = Persistence.load_slot("meadow")
+    assert state["money"] == 99
+    assert state["journal_seq"] == 3
+    assert [c["name"] for c in state["creatures"]] == ["Panda"]
+    panda = state["creatures"][0]
+    assert (panda["x"], panda["y"]) == (300, 310)
+    # level re-derived from the anchor at the journaled clock: 51.25 - decay/2 * (22.5 - 12.5)
+    assert panda["satisfaction_level"] == pytest.approx(51.25 - DEFAULT_DECAY / 2 * 10)
+
+
+def test_legacy_json_slot_without_journal_is_migrated(save_dir):
+    legacy = world([{"name": "Bug", "x": 10, "y": 20, "sprite": CAT, "type": "mimi-carrier", "satisfaction_level": 30.0,
+                     "satisfaction_multiplier": 1, "satisfaction_decay": 0.02,
+                     "effects": [{"name": "More Satisfaction", "duration": 600, "type": "More_Satisfaction"}]}])
+    (save_dir / "meadow").write_text(json.dumps(legacy))
+
+    state = Persistence.load_slot("meadow")
+    bug = state["creatures"][0]
+    assert bug["decay_per_second"] == pytest.approx(0.02 * SIM_HZ)
+    assert bug["effects"][0]["duration_seconds"] == pytest.approx(10.0)
+    assert decode_world(encode_world(state)) == state
+
+
+@pytest.mark.parametrize("slot", ["dfg", "iouygf"])
+def test_shipped_legacy_saves_migrate_losslessly(slot):
+    with open(os.path.join(SAVE_FILES, slot), "rb") as f:
+        raw = f.read()
+    legacy = json.loads(raw)
+    migrated = migrate_json(json.loads(raw))
+    assert decode_world(encode_world(migrated)) == migrated
+    assert [c["name"] for c in migrated["creatures"]] == [c["name"] for c in legacy["creatures"]]
+    for old, new in zip(legacy["creatures"], migrated["creatures"]):
+        assert new["decay_per_second"] == pytest.approx(old.get("satisfaction_decay", DEFAULT_DECAY / SIM_HZ) * SIM_HZ)
+        assert [e["duration_seconds"] for e in new["effects"]] == pytest.approx([e["duration"] / SIM_HZ for e in old["effects"]])